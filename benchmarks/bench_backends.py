@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 16 2026
+
+@author: Prosenjit
+
+Comparison of the ICGraph rendering backends for dense traces, runnable without a display.
+A graph with one noisy sine trace is rendered into a QImage with the QPainter path backend
+and with the NumPy raster backend, with and without level of detail reduction, and the
+paint time percentiles are reported per backend, trace size and mode.
+Drawing every sample of the larger traces with QPainter takes seconds per frame, so these
+cases are skipped unless --all is given.
+
+Run with:
+    python benchmarks/bench_backends.py
+    python benchmarks/bench_backends.py --frames 10 --points 1000000 --size 800 480
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# render offscreen unless a platform has been chosen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+from touchic.plot_widget import ICGraph, ICGraphBackend, ICGraphDecimation
+
+POINTS = (100_000, 1_000_000, 5_000_000)
+SIZE = (640, 480)
+FRAMES = 20
+
+# largest trace drawn sample by sample with QPainter unless --all is given
+PAINTER_FULL_LIMIT = 100_000
+
+# rendering modes as (name, backend, decimation, density)
+MODES = (
+    ("painter/minmax", ICGraphBackend.Painter, ICGraphDecimation.MinMax, False),
+    ("painter/off", ICGraphBackend.Painter, ICGraphDecimation.Off, False),
+    ("raster/minmax", ICGraphBackend.Raster, ICGraphDecimation.MinMax, False),
+    ("raster/off", ICGraphBackend.Raster, ICGraphDecimation.Off, False),
+    ("raster/density", ICGraphBackend.Raster, ICGraphDecimation.Off, True),
+)
+
+
+# graph with a noisy sine trace of the given number of points
+def create_graph(points: int) -> ICGraph:
+    graph = ICGraph("graph")
+    x_data = np.linspace(0, 100, points)
+    graph.add_line("signal", x_data, np.sin(x_data) + 0.1 * np.random.default_rng(0).standard_normal(points), "", "#00ff00",
+                   rescale_display=True, x_sorted=True)
+    return graph
+
+
+# render the graph into the image for the given number of frames.
+# a new sample is pushed before every frame, so cached reductions are recomputed.
+# returns the paint time of every frame in milliseconds
+def measure_time(graph: ICGraph, image: QtGui.QImage, frames: int) -> np.ndarray:
+    times = np.empty(frames)
+    for frame in range(frames):
+        graph.push_data(("signal",), (np.sin(frame * 0.1),))
+        image.fill(0)
+        tic = time.perf_counter()
+        graph.render(image)
+        times[frame] = time.perf_counter() - tic
+    return 1e3 * times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Comparison of the ICGraph rendering backends")
+    parser.add_argument("--frames", type=int, default=FRAMES, help="frames rendered per case")
+    parser.add_argument("--points", type=int, nargs="*", default=POINTS, help="trace sizes")
+    parser.add_argument("--size", type=int, nargs=2, default=SIZE, help="width and height of the graph")
+    parser.add_argument("--all", action="store_true", help="also draw the large traces sample by sample with QPainter")
+    args = parser.parse_args()
+
+    _ = QtWidgets.QApplication(sys.argv)
+
+    width, height = args.size
+    image = QtGui.QImage(width, height, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+
+    print("{:>16} {:>10} {:>9} {:>9} {:>9}".format("mode", "points", "p50 ms", "p90 ms", "p99 ms"))
+    for points in args.points:
+        graph = create_graph(points)
+        graph.resize(width, height)
+        for name, backend, decimation, density in MODES:
+            full_paint = backend == ICGraphBackend.Painter and decimation == ICGraphDecimation.Off
+            if full_paint and points > PAINTER_FULL_LIMIT and not args.all:
+                print("{:>16} {:>10} {:>9}".format(name, points, "skipped"))
+                continue
+
+            graph.backend = backend
+            graph.decimation = decimation
+            graph.density = density
+
+            # the first frame fills the caches
+            graph.render(image)
+            QtCore.QCoreApplication.processEvents()
+
+            times = measure_time(graph, image, args.frames)
+            p50, p90, p99 = np.percentile(times, (50, 90, 99))
+            print("{:>16} {:>10} {:>9.3f} {:>9.3f} {:>9.3f}".format(name, points, p50, p90, p99))
+        graph.deleteLater()
+
+
+if __name__ == "__main__":
+    main()
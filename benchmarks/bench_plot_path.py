@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 16 2026
+
+@author: Prosenjit
+
+Benchmark for the line path construction used by ICGraph.paintEvent.
+Compares the original per-sample QPainterPath loop with the vectorised
+polygon construction for 1k, 10k and 100k point lines.
+
+Run with:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_plot_path.py
+"""
+
+import time
+import numpy as np
+from PyQt6 import QtGui, QtWidgets
+from touchic.plot_render import world_to_screen, line_polygons
+
+WIDTH = 450
+HEIGHT = 150
+FRAMES = 20
+
+
+# the original per-sample implementation, kept here as the reference
+def build_path_loop(x_array, y_array, x_min, x_scale, y_min, y_scale, width, height, base_level_y) -> QtGui.QPainterPath:
+    path = QtGui.QPainterPath()
+    skip = True
+    last_x = 0
+    for i, x in enumerate(x_array):
+        y = y_array[i]
+        px = (x - x_min) * x_scale
+        py = height - (y - y_min) * y_scale
+
+        py = py if py > 0 else 0
+        py = py if py < height else height
+
+        if 0 <= px <= width:
+            if skip:
+                path.moveTo(px, base_level_y)
+                path.lineTo(px, py)
+                skip = False
+            else:
+                path.lineTo(px, py)
+            last_x = px
+        else:
+            path.lineTo(last_x, base_level_y)
+            path.closeSubpath()
+            skip = True
+
+    if not skip:
+        path.lineTo(last_x, base_level_y)
+        path.closeSubpath()
+    return path
+
+
+# the vectorised implementation used by ICGraph
+def build_path_vectorised(x_array, y_array, x_min, x_scale, y_min, y_scale, width, height, base_level_y) -> QtGui.QPainterPath:
+    path = QtGui.QPainterPath()
+    px, py = world_to_screen(x_array, y_array, x_min, x_scale, y_min, y_scale, height)
+    for polygon in line_polygons(px, py, width, height, base_level_y):
+        path.addPolygon(polygon)
+        path.closeSubpath()
+    return path
+
+
+# render a number of frames into an image and return frames per second
+def measure(builder, x_array, y_array) -> float:
+    image = QtGui.QImage(WIDTH, HEIGHT, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    x_min, x_max = x_array[0], x_array[-1]
+    y_min, y_max = y_array.min() - 0.1, y_array.max() + 0.1
+    x_scale = WIDTH / (x_max - x_min)
+    y_scale = HEIGHT / (y_max - y_min)
+    base_level_y = HEIGHT - (0 - y_min) * y_scale
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        image.fill(0)
+        painter = QtGui.QPainter(image)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.drawPath(builder(x_array, y_array, x_min, x_scale, y_min, y_scale, WIDTH, HEIGHT, base_level_y))
+        painter.end()
+    elapsed = time.perf_counter() - start
+    return FRAMES / elapsed
+
+
+def main() -> None:
+    _ = QtWidgets.QApplication([])
+
+    print("{:>10} {:>14} {:>14} {:>9}".format("points", "loop fps", "vector fps", "speedup"))
+    for size in (1_000, 10_000, 100_000):
+        x_array = np.linspace(0, 100, size)
+        y_array = np.sin(x_array) + 0.1 * np.random.default_rng(0).standard_normal(size)
+        fps_loop = measure(build_path_loop, x_array, y_array)
+        fps_vector = measure(build_path_vectorised, x_array, y_array)
+        print("{:>10} {:>14.1f} {:>14.1f} {:>8.1f}x".format(size, fps_loop, fps_vector, fps_vector / fps_loop))
+
+
+if __name__ == "__main__":
+    main()
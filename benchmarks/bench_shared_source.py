@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 16 2026
+
+@author: Prosenjit
+
+Throughput benchmark and demo for ICGraph lines backed by a shared ring buffer.
+A producer process writes blocks of samples. The consumer picks them up either
+from a queue of Python lists copied into a new array (the update_data path) or
+directly from the shared memory, updating only the changed part of the pyramid.
+
+Run the benchmark with:
+    python benchmarks/bench_shared_source.py
+Show a live plot fed by a local producer with:
+    python benchmarks/bench_shared_source.py --demo
+"""
+
+import sys
+import time
+import multiprocessing
+import numpy as np
+from touchic.plot_data import ICMinMaxPyramid, ICSharedRingBuffer
+
+RING_SIZE = 100_000
+BLOCK_SIZE = 1_000
+DURATION = 3.0
+REFRESH_PERIOD = 0.02
+
+
+# producer writing blocks of a noisy sine wave into the shared ring
+def produce_shared(name: str, duration: float, period: float = 0.0) -> None:
+    ring = ICSharedRingBuffer.attach(name)
+    rng = np.random.default_rng(0)
+    phase = 0
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        t = phase + np.arange(BLOCK_SIZE)
+        ring.push(np.sin(t * 1e-3) + 0.05 * rng.standard_normal(BLOCK_SIZE))
+        phase += BLOCK_SIZE
+        if period:
+            time.sleep(period)
+    ring.close()
+
+
+# producer sending complete rings as lists, as required by update_data
+def produce_queue(queue: multiprocessing.Queue, duration: float) -> None:
+    rng = np.random.default_rng(0)
+    data = np.zeros(RING_SIZE)
+    index = 0
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        data[index:index + BLOCK_SIZE] = rng.standard_normal(BLOCK_SIZE)
+        index = (index + BLOCK_SIZE) % RING_SIZE
+        queue.put((BLOCK_SIZE, data.tolist()))
+    queue.put(None)
+
+
+# consumer copying every received ring into a new array and rebuilding the pyramid
+def consume_queue() -> tuple[float, float]:
+    queue = multiprocessing.Queue(maxsize=4)
+    producer = multiprocessing.Process(target=produce_queue, args=(queue, DURATION))
+    producer.start()
+
+    pyramid = ICMinMaxPyramid(np.zeros(RING_SIZE))
+    samples = 0
+    busy = 0.0
+    start = time.perf_counter()
+    while (item := queue.get()) is not None:
+        tic = time.perf_counter()
+        pyramid.rebuild(np.array(item[1]))
+        busy += time.perf_counter() - tic
+        samples += item[0]
+    elapsed = time.perf_counter() - start
+    producer.join()
+    return samples / elapsed, busy / elapsed
+
+
+# consumer polling the shared ring at the refresh period, as ICGraph.refresh_shared_lines does
+def consume_shared() -> tuple[float, float]:
+    ring = ICSharedRingBuffer.create(RING_SIZE)
+    producer = multiprocessing.Process(target=produce_shared, args=(ring.name, DURATION))
+    producer.start()
+
+    pyramid = ICMinMaxPyramid(ring.data)
+    seen = 0
+    busy = 0.0
+    start = time.perf_counter()
+    while producer.is_alive() or ring.write_count != seen:
+        tic = time.perf_counter()
+        write_count = ring.write_count
+        new_count = write_count - seen
+        if new_count >= RING_SIZE:
+            pyramid.rebuild()
+        elif new_count > 0:
+            first = seen % RING_SIZE
+            pyramid.update_range(first, min(first + new_count, RING_SIZE))
+            pyramid.update_range(0, first + new_count - RING_SIZE)
+        seen = write_count
+        busy += time.perf_counter() - tic
+        time.sleep(REFRESH_PERIOD)
+    elapsed = time.perf_counter() - start
+    producer.join()
+
+    del pyramid
+    ring.close()
+    return seen / elapsed, busy / elapsed
+
+
+# live plot of a shared line
+def demo() -> None:
+    from PyQt6 import QtCore, QtWidgets
+    from touchic.plot_widget import ICPlotWidget
+
+    app = QtWidgets.QApplication(sys.argv)
+    ring = ICSharedRingBuffer.create(RING_SIZE)
+    producer = multiprocessing.Process(target=produce_shared, args=(ring.name, 3600.0, 0.01), daemon=True)
+    producer.start()
+
+    plot = ICPlotWidget("Shared", "V")
+    plot.graph.add_shared_line("signal", list(range(RING_SIZE)), ring, "", "#00ff00", x_sorted=True)
+    plot.show()
+
+    timer = QtCore.QTimer()
+    timer.timeout.connect(plot.graph.refresh_shared_lines)
+    timer.start(int(REFRESH_PERIOD * 1000))
+
+    app.exec()
+    producer.terminate()
+
+    # the graph holds views of the shared memory until it is deleted
+    timer.stop()
+    del timer, plot
+    ring.close()
+
+
+def main() -> None:
+    if "--demo" in sys.argv:
+        demo()
+        return
+
+    print("{:>8} {:>16} {:>14}".format("source", "samples / s", "consumer busy"))
+    for label, consume in (("queue", consume_queue), ("shared", consume_shared)):
+        throughput, busy = consume()
+        print("{:>8} {:>16.0f} {:>13.1f}%".format(label, throughput, 100 * busy))
+
+
+if __name__ == "__main__":
+    main()
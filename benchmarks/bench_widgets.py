@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 16 2026
+
+@author: Prosenjit
+
+Paint time benchmark for the widgets, runnable without a display.
+Every widget is resized, given a new value and rendered into a QImage for a number
+of frames. The paint time percentiles are reported per widget, size and data load,
+followed by the Python memory allocated per frame, measured in a separate pass
+with tracemalloc so that tracing does not distort the timing.
+
+Run with:
+    python benchmarks/bench_widgets.py
+    python benchmarks/bench_widgets.py --frames 50 --widgets ICGraph ICRotaryGauge
+"""
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+import numpy as np
+
+# render offscreen unless a platform has been chosen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+from touchic.plot_widget import ICGraph, ICPlotWidget
+from touchic.linear_gauge import ICLinearGauge
+from touchic.rotary_gauge import ICRotaryGauge
+from touchic.linear_slider import ICLinearSlide
+from touchic.text_label import ICTextLabel, ICTextLabelType
+from touchic.radio_group import ICRadioGroup
+from touchic.alarm_widget import ICAlarmWidget
+
+SIZES = ((160, 120), (320, 240), (640, 480))
+PLOT_POINTS = (1_000, 10_000, 100_000)
+FRAMES = 100
+
+
+# graph with a noisy sine line of the given number of points
+def create_graph(points: int) -> ICGraph:
+    graph = ICGraph("graph")
+    x_data = np.linspace(0, 100, points)
+    graph.add_line("signal", x_data, np.sin(x_data) + 0.1 * np.random.default_rng(0).standard_normal(points), "", "#00ff00",
+                   rescale_display=True, x_sorted=True)
+    return graph
+
+
+# plot widget with a noisy sine line of the given number of points
+def create_plot(points: int) -> ICPlotWidget:
+    plot = ICPlotWidget("plot", "V")
+    x_data = np.linspace(0, 100, points)
+    plot.graph.add_line("signal", x_data, np.sin(x_data) + 0.1 * np.random.default_rng(0).standard_normal(points), "", "#00ff00",
+                        rescale_display=True, x_sorted=True)
+    return plot
+
+
+# alarm widgets are hidden until they are activated
+def create_alarm() -> ICAlarmWidget:
+    alarm = ICAlarmWidget(1, "Pressure high", "Pressure above the limit.")
+    alarm.activate()
+    return alarm
+
+
+# change the displayed value for the next frame
+def set_value(widget: QtWidgets.QWidget, frame: int) -> None:
+    value = 50 + 40 * np.sin(frame * 0.1)
+    if isinstance(widget, ICGraph):
+        widget.push_data(("signal",), (value / 40 - 1.25,))
+    elif isinstance(widget, ICPlotWidget):
+        widget.graph.push_data(("signal",), (value / 40 - 1.25,))
+    elif isinstance(widget, ICRadioGroup):
+        widget.selected = frame % 3
+    elif isinstance(widget, ICAlarmWidget):
+        widget.alarm_text = "Pressure high {}".format(frame)
+    else:
+        widget.value = value
+
+
+# benchmark cases as (widget name, data load, factory)
+def cases() -> list:
+    all_cases = []
+    for points in PLOT_POINTS:
+        all_cases.append(("ICGraph", points, lambda points=points: create_graph(points)))
+        all_cases.append(("ICPlotWidget", points, lambda points=points: create_plot(points)))
+    all_cases.extend([
+        ("ICLinearGauge", 1, lambda: ICLinearGauge("gauge", "V")),
+        ("ICRotaryGauge", 1, lambda: ICRotaryGauge(0, 100, "rotary", 50, "V")),
+        ("ICLinearSlide", 1, lambda: ICLinearSlide("slide", "V", list(range(0, 101, 5)), 50, [str(v) for v in range(0, 101, 5)])),
+        ("ICTextLabel", 1, lambda: ICTextLabel("label", 50.0, ICTextLabelType.LabelFloat)),
+        ("ICRadioGroup", 3, lambda: ICRadioGroup(["low", "medium", "high"])),
+        ("ICAlarmWidget", 1, create_alarm),
+    ])
+    return all_cases
+
+
+# render the widget into the image for the given number of frames.
+# returns the paint time of every frame in milliseconds
+def measure_time(widget: QtWidgets.QWidget, image: QtGui.QImage, frames: int) -> np.ndarray:
+    times = np.empty(frames)
+    for frame in range(frames):
+        set_value(widget, frame)
+        image.fill(0)
+        tic = time.perf_counter()
+        widget.render(image)
+        times[frame] = time.perf_counter() - tic
+    return 1e3 * times
+
+
+# render the widget with tracemalloc active. returns the mean peak of allocated memory per frame in KiB
+def measure_allocations(widget: QtWidgets.QWidget, image: QtGui.QImage, frames: int) -> float:
+    peaks = np.empty(frames)
+    tracemalloc.start()
+    for frame in range(frames):
+        set_value(widget, frame)
+        image.fill(0)
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        widget.render(image)
+        peaks[frame] = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return peaks.mean() / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Paint time benchmark of the widgets")
+    parser.add_argument("--frames", type=int, default=FRAMES, help="frames rendered per case")
+    parser.add_argument("--widgets", nargs="*", help="names of the widget classes to benchmark")
+    args = parser.parse_args()
+
+    _ = QtWidgets.QApplication(sys.argv)
+
+    print("{:>14} {:>9} {:>8} {:>9} {:>9} {:>9} {:>12}".format("widget", "size", "load", "p50 ms", "p90 ms", "p99 ms",
+                                                              "alloc KiB"))
+    for name, load, factory in cases():
+        if args.widgets and name not in args.widgets:
+            continue
+
+        widget = factory()
+        for width, height in SIZES:
+            widget.resize(width, height)
+            image = QtGui.QImage(width, height, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+
+            # the first frame lays out the widget and fills the caches
+            widget.render(image)
+            QtCore.QCoreApplication.processEvents()
+
+            times = measure_time(widget, image, args.frames)
+            allocated = measure_allocations(widget, image, max(args.frames // 10, 1))
+            p50, p90, p99 = np.percentile(times, (50, 90, 99))
+            print("{:>14} {:>9} {:>8} {:>9.3f} {:>9.3f} {:>9.3f} {:>12.1f}".format(name, "{}x{}".format(width, height), load,
+                                                                                  p50, p90, p99, allocated))
+        widget.deleteLater()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 17 2026
+
+@author: Prosenjit
+
+Tests of the delivery of async producers to the widgets by ICAsyncBridge
+"""
+
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import time
+import threading
+import numpy as np
+import pytest
+from PyQt6 import QtWidgets
+from touchic.async_bridge import ICAsyncBridge, ICBackpressure
+from touchic.base_widget import ICRefreshScheduler
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class Target:
+    """
+    Stand-in for a widget, recording the values set and the blocks pushed with their threads
+    """
+    def __init__(self):
+        self.values: list = []
+        self.blocks: list = []
+        self.threads: set = set()
+
+    @property
+    def value(self):
+        return self.values[-1] if self.values else None
+
+    @value.setter
+    def value(self, value) -> None:
+        self.values.append(value)
+        self.threads.add(threading.current_thread())
+
+    def push_block(self, line_names: tuple[str], block: np.ndarray) -> None:
+        self.blocks.append((line_names, block))
+        self.threads.add(threading.current_thread())
+
+
+# producer yielding the values, optionally raising an error at the end
+async def produce(values: list, error: Exception = None):
+    for value in values:
+        yield value
+    if error is not None:
+        raise error
+
+
+# wait for a condition set by the asyncio thread
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.005)
+    return condition()
+
+
+# one frame of the refresh scheduler
+def frame() -> None:
+    ICRefreshScheduler.instance()._on_frame()
+
+
+@pytest.fixture
+def bridge():
+    bridge = ICAsyncBridge.instance()
+    yield bridge
+    bridge.stop()
+
+
+# values are delivered in the GUI thread at the frames of the scheduler, and finished bindings are dropped
+def test_delivery_on_frames(bridge):
+    target = Target()
+    binding = bridge.bind(produce([1, 2, 3]), target)
+    assert wait_for(lambda: not binding.active)
+    assert target.values == [] and binding.pending == 1
+
+    end = time.monotonic() + 5
+    while bridge.bindings and time.monotonic() < end:
+        app.processEvents()
+        time.sleep(0.005)
+    assert target.values == [3]
+    assert target.threads == {threading.main_thread()}
+    assert bridge.bindings == []
+
+
+# Coalesce delivers the newest value and counts the replaced ones as dropped
+def test_coalesce_stats(bridge):
+    target = Target()
+    binding = bridge.bind(produce(list(range(100))), target, policy=ICBackpressure.Coalesce)
+    assert wait_for(lambda: not binding.active)
+    assert binding.stats == {"received": 100, "delivered": 0, "dropped": 99}
+
+    frame()
+    assert target.values == [99]
+    assert binding.stats == {"received": 100, "delivered": 1, "dropped": 99}
+    assert binding.pending == 0
+
+    # nothing new to deliver
+    frame()
+    assert target.values == [99]
+
+
+# DropOldest keeps the newest values up to the queue size and sets at most max_per_frame of them per frame
+def test_drop_oldest_stats(bridge):
+    target = Target()
+    binding = bridge.bind(produce(list(range(25))), target, policy=ICBackpressure.DropOldest, queue_size=10,
+                          max_per_frame=4)
+    assert wait_for(lambda: not binding.active)
+    assert binding.pending == 10
+    assert binding.stats == {"received": 25, "delivered": 0, "dropped": 15}
+
+    frame()
+    assert target.values == [15, 16, 17, 18]
+    assert binding.pending == 6
+
+    frame()
+    frame()
+    assert target.values == list(range(15, 25))
+    assert binding.stats == {"received": 25, "delivered": 10, "dropped": 15}
+    assert bridge.bindings == []
+
+
+# lines receive all the queued samples as one block, one row per line
+def test_lines_block(bridge):
+    target = Target()
+    binding = bridge.bind_lines(produce([(index, -index) for index in range(50)]), target, ("a", "b"))
+    assert wait_for(lambda: not binding.active)
+
+    frame()
+    assert len(target.blocks) == 1
+    line_names, block = target.blocks[0]
+    assert line_names == ("a", "b")
+    assert np.array_equal(block, [np.arange(50), -np.arange(50)])
+    assert binding.stats["delivered"] == 50
+
+
+# the exception that ended a producer is kept in the binding and the values before it are delivered
+def test_producer_error(bridge):
+    target = Target()
+    binding = bridge.bind(produce([1, 2], ValueError("sensor lost")), target, policy=ICBackpressure.DropOldest)
+    assert wait_for(lambda: binding.error is not None)
+    assert isinstance(binding.error, ValueError)
+    assert not binding.active
+
+    frame()
+    assert target.values == [1, 2]
+    assert binding.stats == {"received": 2, "delivered": 2, "dropped": 0}
+    assert bridge.bindings == []
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 17 2026
+
+@author: Prosenjit
+
+Tests of the persistent history log and its reader
+"""
+
+import os
+import time
+from datetime import datetime
+from touchic import history_log
+from touchic.history_log import ICHistoryLog, ICHistoryLogReader, CatalogFileName, SegmentFileName
+from touchic.widget_history import HistoryRecord, ICEventCodes, history_time_ns
+
+
+class Gauge:
+    pass
+
+
+class Button:
+    pass
+
+
+# wait for a condition set by the writer thread
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.005)
+    return condition()
+
+
+# write values of the event "value" for a widget
+def write_values(log: ICHistoryLog, widget: int, values: list[float]) -> None:
+    for value in values:
+        log.append(widget, ICEventCodes.code("value"), value, history_time_ns())
+
+
+# events written and closed are read back with their widget classes, event names and times
+def test_round_trip(tmp_path):
+    start = datetime.now()
+    log = ICHistoryLog(str(tmp_path), flush_interval=0.01)
+    log.register(1, Gauge)
+    log.register(2, Button)
+    write_values(log, 1, [1.5, 2.5])
+    log.append(2, ICEventCodes.code("pressed"), 1, history_time_ns())
+    log.close()
+    assert log.write_count == 3 and log.error is None
+
+    reader = ICHistoryLogReader(str(tmp_path))
+    assert reader.count == 3
+    events = list(reader.replay())
+    assert [event[1:] for event in events] == [("Gauge", "value", 1.5), ("Gauge", "value", 2.5), ("Button", "pressed", 1.0)]
+    assert all(abs((event[0] - start).total_seconds()) < 5 for event in events)
+
+    assert reader.query(widget_class="Gauge")["value"].tolist() == [1.5, 2.5]
+    assert reader.query(event="pressed").size == 1
+    assert reader.query(event="missing").size == 0
+    assert reader.query(stop=start).size == 0
+
+
+# a new writer continues the last segment after dropping an incomplete record, and keeps the numbers of the catalog
+def test_continue_truncated_segment(tmp_path):
+    log = ICHistoryLog(str(tmp_path), flush_interval=0.01)
+    log.register(1, Gauge)
+    write_values(log, 1, [1, 2, 3])
+    log.close()
+
+    segment = os.path.join(tmp_path, SegmentFileName.format(0))
+    with open(segment, "ab") as file:
+        file.write(b"\x01" * (HistoryRecord.itemsize // 2))
+
+    log = ICHistoryLog(str(tmp_path), flush_interval=0.01)
+    assert os.path.getsize(segment) == 3 * HistoryRecord.itemsize
+    log.register(1, Button)
+    write_values(log, 1, [4])
+    log.close()
+
+    reader = ICHistoryLogReader(str(tmp_path))
+    records = reader.query()
+    assert records["value"].tolist() == [1, 2, 3, 4]
+    assert records["widget"].tolist() == [0, 0, 0, 1]
+    assert set(records["event"].tolist()) == {0}
+    assert [reader.widget_class(widget) for widget in (0, 1)] == ["Gauge", "Button"]
+    assert not os.path.exists(os.path.join(tmp_path, SegmentFileName.format(1)))
+
+
+# events are split over segments of the configured size, in the order they were written
+def test_segment_rollover(tmp_path):
+    log = ICHistoryLog(str(tmp_path), segment_size=3, flush_interval=0.01)
+    log.register(1, Gauge)
+    write_values(log, 1, list(range(8)))
+    log.close()
+
+    sizes = [os.path.getsize(os.path.join(tmp_path, SegmentFileName.format(index))) // HistoryRecord.itemsize
+             for index in range(3)]
+    assert sizes == [3, 3, 2]
+    assert not os.path.exists(os.path.join(tmp_path, SegmentFileName.format(3)))
+
+    reader = ICHistoryLogReader(str(tmp_path))
+    assert reader.count == 8
+    assert reader.query()["value"].tolist() == list(range(8))
+
+    # the next writer continues the last segment
+    log = ICHistoryLog(str(tmp_path), segment_size=3, flush_interval=0.01)
+    write_values(log, 1, [8, 9])
+    log.close()
+    reader.reload()
+    assert reader.query()["value"].tolist() == list(range(10))
+    assert os.path.getsize(os.path.join(tmp_path, SegmentFileName.format(3))) == HistoryRecord.itemsize
+
+
+# a reader picks up the widgets, events and segments written since it was opened
+def test_catalog_reload(tmp_path):
+    log = ICHistoryLog(str(tmp_path), segment_size=2, flush_interval=0.01)
+    log.register(1, Gauge)
+    write_values(log, 1, [1])
+    assert wait_for(lambda: log.write_count == 1)
+
+    reader = ICHistoryLogReader(str(tmp_path))
+    assert reader.count == 1 and reader.widget_class(1) == ""
+
+    log.register(2, Button)
+    log.append(2, ICEventCodes.code("pressed"), 1, history_time_ns())
+    write_values(log, 1, [2, 3])
+    assert wait_for(lambda: log.write_count == 4)
+    reader.reload()
+    assert reader.count == 4
+    assert reader.widget_class(1) == "Button"
+    assert reader.query(widget_class="Button", event="pressed").size == 1
+    log.close()
+
+    # an incomplete last line of the catalog is skipped
+    with open(os.path.join(tmp_path, CatalogFileName), "a", encoding="utf-8") as catalog:
+        catalog.write('{"widget": 2, "cla')
+    reader.reload()
+    assert reader.widget_class(2) == ""
+    assert reader.count == 4
+
+
+# a failed write is kept in error and further events are dropped
+def test_write_error(tmp_path, monkeypatch):
+    def fail(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(history_log.os, "fsync", fail)
+    log = ICHistoryLog(str(tmp_path), flush_interval=0.01)
+    log.register(1, Gauge)
+    write_values(log, 1, [1])
+    assert wait_for(lambda: log.error is not None)
+    assert isinstance(log.error, OSError)
+
+    write_values(log, 1, [2, 3])
+    assert log._queue.empty()
+    log.close()
+    assert log.write_count == 1
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 17 2026
+
+@author: Prosenjit
+
+Tests of the data structures of plot_data
+"""
+
+import numpy as np
+from touchic.plot_data import ICMinMaxPyramid, ICLineStore
+from touchic.plot_render import minmax_decimate
+
+
+# the exact column envelope of a sorted line with NaN gaps is the one of minmax_decimate
+def test_pyramid_extremes_sorted_nan():
+    rng = np.random.default_rng(0)
+    size = 100000
+    x_array = np.linspace(0, 100, size)
+    y_array = np.sin(x_array)
+    y_array[rng.random(size) < 0.01] = np.nan
+    y_array[50000:50200] = np.nan
+    y_array[30000] = 50
+    y_array[70000] = -50
+    pyramid = ICMinMaxPyramid(y_array)
+
+    # column bounds as found by ICGraph for a display range and width
+    x_min, x_max, width = 10.3, 80.1, 400
+    start = int(np.searchsorted(x_array, x_min)) - 1
+    stop = int(np.searchsorted(x_array, x_max, side="right")) + 1
+    edges = x_min + np.arange(width + 1) * ((x_max - x_min) / width)
+    bounds = np.concatenate(([start], start + np.searchsorted(x_array[start:stop], edges), [stop]))
+    filled = bounds[1:] > bounds[:-1]
+
+    min_index, max_index, gap_index = pyramid.extremes(bounds[:-1][filled], bounds[1:][filled])
+    selected = np.unique(np.concatenate((min_index, max_index, gap_index[gap_index >= 0])))
+    expected = start + minmax_decimate(x_array[start:stop], y_array[start:stop], x_min, x_max, width)
+    assert np.array_equal(selected, expected)
+
+    # the spikes are kept and the gaps do not hide the extremes
+    assert np.nanmax(y_array[selected]) == 50
+    assert np.nanmin(y_array[selected]) == -50
+    assert (pyramid.min_value, pyramid.max_value) == (-50, 50)
+
+
+# first smallest and largest sample and first NaN of data[start:stop], ranking NaN as minmax_decimate
+def brute_extremes(data: np.ndarray, start: int, stop: int) -> tuple[int, int, int]:
+    values = data[start:stop]
+    gaps = np.flatnonzero(np.isnan(values))
+    return (start + int(np.argmin(np.where(np.isnan(values), np.inf, values))),
+            start + int(np.argmax(np.where(np.isnan(values), -np.inf, values))),
+            start + int(gaps[0]) if gaps.size else -1)
+
+
+# extremes of random ranges match a scan of the data
+def check_extremes(pyramid: ICMinMaxPyramid, rng: np.random.Generator) -> None:
+    data = pyramid.data
+    starts = rng.integers(0, data.size, 300)
+    stops = np.minimum(starts + rng.integers(1, data.size + 1, 300), data.size)
+    starts[:2], stops[:2] = (0, data.size - 1), (data.size, data.size)
+    min_index, max_index, gap_index = pyramid.extremes(starts, stops)
+    expected = np.array([brute_extremes(data, start, stop) for start, stop in zip(starts, stops)])
+    assert np.array_equal(min_index, expected[:, 0])
+    assert np.array_equal(max_index, expected[:, 1])
+    assert np.array_equal(gap_index, expected[:, 2])
+
+
+# data with repeated values, NaN gaps and infinite samples
+def random_data(rng: np.random.Generator, size: int) -> np.ndarray:
+    data = rng.integers(-20, 20, size).astype(np.float64)
+    data[rng.random(size) < 0.1] = np.nan
+    data[rng.random(size) < 0.01] = np.inf
+    data[rng.random(size) < 0.01] = -np.inf
+    return data
+
+
+# rebuilt pyramids of odd sizes, all NaN data and single samples match a scan of the data
+def test_pyramid_rebuild():
+    rng = np.random.default_rng(1)
+    for size in (1, 2, 3, 7, 64, 1000, 4097):
+        pyramid = ICMinMaxPyramid(random_data(rng, size))
+        check_extremes(pyramid, rng)
+
+        pyramid.rebuild(np.full(size, np.nan))
+        check_extremes(pyramid, rng)
+        assert np.isnan(pyramid.min_value) and np.isnan(pyramid.max_value)
+
+    data = random_data(rng, 1000)
+    data[np.isinf(data)] = 0
+    data[500] = 100
+    data[501] = -100
+    pyramid = ICMinMaxPyramid(data)
+    assert (pyramid.min_value, pyramid.max_value) == (-100, 100)
+
+
+# single sample and range updates give the extremes and the levels of a rebuilt pyramid
+def test_pyramid_update():
+    rng = np.random.default_rng(2)
+    for size in (5, 1000, 4097):
+        data = random_data(rng, size)
+        pyramid = ICMinMaxPyramid(data)
+
+        for _ in range(200):
+            index = int(rng.integers(0, size))
+            data[index] = random_data(rng, 1)[0]
+            pyramid.update(index)
+        check_extremes(pyramid, rng)
+
+        for _ in range(20):
+            start = int(rng.integers(0, size))
+            stop = int(rng.integers(start, size + 1))
+            data[start:stop] = random_data(rng, stop - start)
+            pyramid.update_range(start, stop)
+        check_extremes(pyramid, rng)
+
+        rebuilt = ICMinMaxPyramid(data.copy())
+        assert np.array_equal(pyramid.window(0, size, 16), rebuilt.window(0, size, 16))
+        assert np.array_equal(pyramid.min_value, rebuilt.min_value, equal_nan=True)
+        assert np.array_equal(pyramid.max_value, rebuilt.max_value, equal_nan=True)
+
+    # the extremes follow overwritten samples in both directions
+    data = np.zeros(100)
+    pyramid = ICMinMaxPyramid(data)
+    data[40] = 5
+    pyramid.update(40)
+    assert pyramid.max_value == 5
+    data[40] = np.nan
+    pyramid.update(40)
+    assert (pyramid.min_value, pyramid.max_value) == (0, 0)
+
+
+# the range of a line store follows written, filled and removed lines, ignoring NaN
+def test_line_store_envelope():
+    rng = np.random.default_rng(3)
+    store = ICLineStore()
+    x_data = np.arange(1000, dtype=np.float64)
+    for line_name in ("a", "b", "c"):
+        y_data = rng.standard_normal(1000)
+        y_data[rng.random(1000) < 0.1] = np.nan
+        assert store.add(line_name, x_data, y_data)
+    assert not store.add("d", x_data[:-1], np.zeros(999))
+
+    # range over all the lines, ignoring NaN
+    def check():
+        finite = store.y_data[~np.isnan(store.y_data)]
+        assert store.y_range() == (finite.min(), finite.max())
+
+    check()
+    store.write_column(10, ("a", "c"), (1000.0, -1000.0), np.nan)
+    check()
+    assert np.isnan(store.row("b")[10])
+
+    # blocks wrap around the end of the rows
+    block = rng.standard_normal((2, 50)) * 50
+    store.write_block(980, ("c", "a"), block, 0.0)
+    check()
+    assert np.array_equal(store.row("c")[980:], block[0, :20])
+    assert np.array_equal(store.row("a")[:30], block[1, 20:])
+    assert np.all(store.row("b")[:30] == 0)
+
+    # overwriting the extremes shrinks the range
+    store.fill_column(10, 0.0)
+    check()
+    store.y_data[:, 500:600] = 5000
+    store.mark_changed(500, 600)
+    check()
+    assert store.y_range()[1] == 5000
+
+    store.remove("a")
+    assert store.names == ["b", "c"]
+    check()
+    store.remove("b")
+    store.remove("c")
+    assert all(np.isnan(store.y_range()))
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 17 2026
+
+@author: Prosenjit
+
+Tests of the line reduction functions of plot_render
+"""
+
+import numpy as np
+from touchic.plot_render import minmax_decimate
+
+
+# NaN gaps in sorted and unsorted lines return valid indices and keep a gap sample per column
+def test_minmax_decimate_nan():
+    rng = np.random.default_rng(0)
+    y_array = rng.standard_normal(1000)
+    y_array[100:250] = np.nan
+    y_array[::7] = np.nan
+
+    for x_array in (np.linspace(0, 10, 1000), rng.random(1000) * 12 - 1):
+        selected = minmax_decimate(x_array, y_array, 0, 10, 20)
+        assert selected.size and selected.min() >= 0 and selected.max() < y_array.size
+        assert np.all(np.diff(selected) > 0)
+        assert np.isnan(y_array[selected]).any()
+
+        # extremes of the finite samples are retained
+        assert np.nanmax(y_array[selected]) == np.nanmax(y_array)
+        assert np.nanmin(y_array[selected]) == np.nanmin(y_array)
+
+
+# a line of gaps only is reduced to one sample per column
+def test_minmax_decimate_all_nan():
+    selected = minmax_decimate(np.arange(100.0), np.full(100, np.nan), 0, 100, 10)
+    assert np.array_equal(selected, np.arange(0, 100, 10))
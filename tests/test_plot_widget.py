@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 17 2026
+
+@author: Prosenjit
+
+Tests of the frames painted by ICGraph in the GUI thread and from snapshots
+"""
+
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PyQt6 import QtGui, QtWidgets
+from touchic.plot_widget import ICGraph, ICGraphBackend
+from touchic.plot_render import marker_image, marker_sprite, pixmap_fragments, draw_sprite_images, SpriteBatchFactor
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+# premultiplied ARGB pixels of an image
+def pixels(image: QtGui.QImage) -> np.ndarray:
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    return np.frombuffer(bits, dtype=np.uint32).copy()
+
+
+# pixels of a transparent image painted by a function of a painter
+def paint(width: int, height: int, draw, ratio: float = 1.0) -> np.ndarray:
+    image = QtGui.QImage(int(width * ratio), int(height * ratio), QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(ratio)
+    image.fill(0)
+    painter = QtGui.QPainter(image)
+    draw(painter)
+    painter.end()
+    return pixels(image)
+
+
+# graph with a dense line and a line of markers, painted directly and from a snapshot
+def graph_frames(markers: int) -> tuple[np.ndarray, np.ndarray]:
+    graph = ICGraph("graph")
+    graph.resize(400, 300)
+    graph.backend = ICGraphBackend.Painter
+    x_array = np.linspace(0, 10, 50000)
+    graph.add_line("line", x_array, np.sin(x_array), "", "#00ff00", rescale_display=True, x_sorted=True)
+    x_array = np.linspace(0, 10, markers)
+    graph.add_line("markers", x_array, np.cos(x_array), "o", "#ff0000", x_sorted=True)
+
+    direct = paint(400, 300, lambda painter: ICGraph._paint_frame(painter, graph._create_frame(400, 300, False)))
+    snapshot = paint(400, 300, lambda painter: ICGraph._paint_frame(painter, graph._create_frame(400, 300, True)))
+    return direct, snapshot
+
+
+# batched sprite images match the pixmap fragments where the copies do not overlap
+def test_sprite_images_batch_separate():
+    for ratio, fill_color in ((1.0, None), (2.0, QtGui.QColor(200, 0, 0, 128))):
+        image = marker_image("o", QtGui.QColor(0, 200, 100), fill_color, ratio)
+        sprite = marker_sprite("o", QtGui.QColor(0, 200, 100), fill_color, ratio)
+        grid_x, grid_y = np.meshgrid(np.arange(80) * 12.3 + 4.6, np.arange(60) * 11.7 + 5.2)
+        px, py = grid_x.ravel(), grid_y.ravel()
+        assert px.size >= SpriteBatchFactor * np.count_nonzero(pixels(image))
+
+        fragments = paint(1000, 720, lambda painter: painter.drawPixmapFragments(pixmap_fragments(px, py, sprite), sprite), ratio)
+        batched = paint(1000, 720, lambda painter: draw_sprite_images(painter, px, py, image), ratio)
+        assert np.array_equal(fragments, batched)
+
+
+# snapshot frames only differ from direct frames where batched markers overlap
+def test_painter_snapshot_difference():
+    direct, snapshot = graph_frames(100)
+    assert np.array_equal(direct, snapshot)
+
+    direct, snapshot = graph_frames(2000)
+    assert np.count_nonzero(direct != snapshot) < 3000
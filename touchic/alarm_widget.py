@@ -26,8 +26,7 @@ class ICAlarmMessage(QtWidgets.QDialog):
 
         layout = QtWidgets.QVBoxLayout()
         label = QtWidgets.QLabel("", self)
-        label.setStyleSheet("QLabel { background-color : " + ICDisplayConfig.QtColorToSting(ICDisplayConfig.BackgroundColor) + "; color : " +
-                            ICDisplayConfig.QtColorToSting(ICDisplayConfig.HeaderTextColor) + ";}")
+        label.setStyleSheet(ICDisplayConfig.style_sheet("Label", back=ICDisplayConfig.BackgroundColor, text=ICDisplayConfig.HeaderTextColor))
         label.setText("<span style='font-size:" + "{}".format(ICDisplayConfig.GeneralTextSize) + "pt;'>" + message + "</span>")
         label.setWordWrap(True)
         layout.addWidget(label)
@@ -47,7 +46,7 @@ class ICAlarmMessage(QtWidgets.QDialog):
         layout.addLayout(horizontal_layout)
         self.setLayout(layout)
 
-        self.setStyleSheet("background-color : " + ICDisplayConfig.QtColorToSting(ICDisplayConfig.BackgroundColor) + ";")
+        self.setStyleSheet(ICDisplayConfig.style_sheet("Background", back=ICDisplayConfig.BackgroundColor))
 
 
 class ICAlarmStatus(Enum):
@@ -107,9 +106,7 @@ class ICAlarmWidget(ICBaseWidget):
         # short message of the alarm
         self._alarm_display = QtWidgets.QLabel("", self)
         self._alarm_display.setFrameStyle(QtWidgets.QFrame.StyledPanel | QtWidgets.QFrame.Sunken)
-        self._alarm_display.setStyleSheet("QLabel { background-color : " + ICDisplayConfig.QtColorToSting(self._msg_back_color) + "; color : " +
-                                          ICDisplayConfig.QtColorToSting(self._msg_color) + "; border-radius : 8px; border-color : " +
-                                          ICDisplayConfig.QtColorToSting(self._msg_border_color) + "; border-width : 2px; border-style: outset; }")
+        self._apply_message_style()
         self._alarm_display.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         self._alarm_display.setWordWrap(True)
         self._alarm_display.setText("<span style='font-size:" + "{}".format(self._msg_size) + "pt;'> ({}):".format(self._raised_time.strftime("%H:%M:%S"))
@@ -309,11 +306,14 @@ class ICAlarmWidget(ICBaseWidget):
         # update the display
         self._local_update()
 
+    # restyle the alarm message with the message colors of the new palette
+    def on_theme_changed(self) -> None:
+        super().on_theme_changed()
+        self._apply_message_style()
+
     def _local_update(self) -> None:
-        # update alarm text
-        self._alarm_display.setStyleSheet("QLabel { background-color : " + ICDisplayConfig.QtColorToSting(self._msg_back_color) + "; color : " +
-                                          ICDisplayConfig.QtColorToSting(self._msg_color) + "; border-radius : 8px; border-color : " +
-                                          ICDisplayConfig.QtColorToSting(self._msg_border_color) + "; border-width : 2px; border-style: outset; }")
+        # update alarm text. the style sheet is only set again when the colors have changed
+        self._apply_message_style()
         self._alarm_display.setAlignment(Qt.AlignCenter)
         self._alarm_display.setText("<span style='font-size:" + "{}".format(self._msg_size) + "pt;'> ({}) : ".format(self._raised_time.strftime("%H:%M:%S"))
                                     + self._alarm_txt + "</span>")
@@ -321,3 +321,8 @@ class ICAlarmWidget(ICBaseWidget):
 
         # update the button
         self.acknowledge_button.update()
+
+    # style of the alarm message from the message colors
+    def _apply_message_style(self) -> None:
+        self.apply_style_sheet(ICDisplayConfig.style_sheet("AlarmMessage", back=self._msg_back_color, text=self._msg_color,
+                                                           border=self._msg_border_color), self._alarm_display)
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 16 2026
+
+@author: Prosenjit
+
+Bridge between asyncio data producers and the widgets.
+The asyncio loop runs in its own thread next to the Qt event loop, so neither waits
+for the other. Async iterables are consumed in the asyncio thread and handed over to
+the GUI thread at the frames of ICRefreshScheduler according to a backpressure policy:
+    Coalesce   : only the newest value is kept and shown at the next frame
+    DropOldest : values are queued up to a limit, dropping the oldest when full,
+                 and delivered in order at the next frames. lines receive all the
+                 queued values as one block, properties a limited number per frame
+Exceptions raised by a producer are printed and kept in the error of its binding.
+
+Bind an async generator to a gauge and to the lines of a graph with:
+    bridge = ICAsyncBridge.instance()
+    bridge.bind(read_pressure(), gauge)
+    bridge.bind_lines(read_waveforms(), graph, ("ch1", "ch2"))
+"""
+
+import asyncio
+import threading
+import traceback
+from collections import deque
+from enum import Enum
+from typing import AsyncIterable
+import numpy as np
+from PyQt6 import QtCore
+from .value_source import ICValueSource
+from .base_widget import ICBaseWidget, ICRefreshScheduler
+
+
+class ICBackpressure(Enum):
+    """
+    Handling of values arriving faster than they are displayed
+    """
+    Coalesce = 0
+    DropOldest = 1
+
+
+class ICAsyncBinding:
+    """
+    Connection of an async producer to a widget property or to the lines of a graph
+    """
+    def __init__(self, widget: ICBaseWidget, attribute: str, line_names: tuple[str], policy: ICBackpressure, queue_size: int,
+                 max_per_frame: int = 0):
+        self._widget: ICBaseWidget = widget
+        self._attribute: str = attribute
+        self._line_names: tuple[str] = line_names
+        self._policy: ICBackpressure = policy
+
+        # queued values set on the property per frame, so a full queue does not block the GUI thread
+        self._max_per_frame: int = max(max_per_frame, 1)
+
+        # newest value for Coalesce and queued values for DropOldest.
+        # deque append and popleft are safe between the two threads
+        self._source: ICValueSource = ICValueSource()
+        self._queue: deque = deque(maxlen=queue_size)
+        self._delivered_sequence: int = 0
+
+        # task consuming the producer in the asyncio thread and the exception that ended it
+        self._future = None
+        self._error: BaseException = None
+
+        # statistics
+        self._received: int = 0
+        self._delivered: int = 0
+
+    ########################################################
+    # properties
+    ########################################################
+    # backpressure policy
+    @property
+    def policy(self) -> ICBackpressure:
+        return self._policy
+
+    # is the producer still being consumed
+    @property
+    def active(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    # exception raised by the producer, None if it is running or has finished normally
+    @property
+    def error(self) -> BaseException:
+        return self._error
+
+    # statistics of the binding
+    #   received    : values produced
+    #   delivered   : values passed to the widget
+    #   dropped     : values replaced or pushed out of the queue before being delivered
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"received": self._received,
+                "delivered": self._delivered,
+                "dropped": self._received - self._delivered - self.pending}
+
+    # values waiting to be delivered
+    @property
+    def pending(self) -> int:
+        if self._policy == ICBackpressure.DropOldest:
+            return len(self._queue)
+        return int(self._source.sequence != self._delivered_sequence)
+
+    ########################################################
+    # functions
+    ########################################################
+    # stop consuming the producer
+    def cancel(self) -> None:
+        if self._future is not None:
+            self._future.cancel()
+
+    ########################################################
+    # helper functions
+    ########################################################
+    # consume the producer. runs in the asyncio thread
+    async def _consume(self, producer: AsyncIterable) -> None:
+        async for value in producer:
+            self._received += 1
+            if self._policy == ICBackpressure.DropOldest:
+                self._queue.append(value)
+            else:
+                self._source.write(value)
+
+    # keep the exception that ended the producer. runs in the asyncio thread
+    def _on_done(self, future) -> None:
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if error is not None:
+            self._error = error
+            traceback.print_exception(error)
+
+    # pass the waiting values to the widget. runs in the GUI thread
+    def _deliver(self) -> None:
+        if self._policy == ICBackpressure.DropOldest:
+            count = len(self._queue)
+            if self._line_names is None:
+                count = min(count, self._max_per_frame)
+            values = [self._queue.popleft() for _ in range(count)]
+        else:
+            value, _, sequence = self._source.read()
+            values = [value] if sequence != self._delivered_sequence else []
+            self._delivered_sequence = sequence
+
+        if not values:
+            return
+
+        if self._line_names is not None:
+            # one row of values per sample, one column per line
+            self._widget.push_block(self._line_names, np.asarray(values, dtype=float).reshape(len(values), -1).T)
+        else:
+            for value in values:
+                setattr(self._widget, self._attribute, value)
+        self._delivered += len(values)
+
+
+class ICAsyncBridge(QtCore.QObject):
+    """
+    Runs an asyncio event loop in a background thread and delivers the values of bound async producers
+    to the widgets once per frame of ICRefreshScheduler in the GUI thread.
+    """
+    # bridge shared by all the widgets
+    _instance = None
+
+    def __init__(self, *args, **kwargs):
+        super(ICAsyncBridge, self).__init__(*args, **kwargs)
+
+        # asyncio loop and its thread. started on first use
+        self._loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self._thread: threading.Thread = None
+
+        # active bindings
+        self._bindings: list[ICAsyncBinding] = []
+
+    # bridge shared by all the widgets. created on first use
+    @classmethod
+    def instance(cls) -> 'ICAsyncBridge':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    ########################################################
+    # properties
+    ########################################################
+    # asyncio loop running the producers
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    # is the asyncio thread running
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # active bindings
+    @property
+    def bindings(self) -> list[ICAsyncBinding]:
+        return list(self._bindings)
+
+    ########################################################
+    # functions
+    ########################################################
+    # start the asyncio thread
+    def start(self) -> None:
+        if not self.running:
+            self._thread = threading.Thread(target=self._loop.run_forever, name="ICAsyncBridge", daemon=True)
+            self._thread.start()
+
+    # cancel all the bindings and stop the asyncio thread
+    def stop(self) -> None:
+        for binding in self._bindings:
+            binding.cancel()
+        self._bindings.clear()
+        ICRefreshScheduler.instance().remove_frame_callback(self._on_frame)
+
+        if self.running:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+
+    # run a coroutine in the asyncio thread. returns a concurrent.futures.Future
+    def submit(self, coroutine):
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    # show the values of an async producer in a property of the widget, e.g. value of a gauge or a label.
+    # with DropOldest at most max_per_frame queued values are set per frame
+    def bind(self, producer: AsyncIterable, widget: ICBaseWidget, attribute: str = "value",
+             policy: ICBackpressure = ICBackpressure.Coalesce, queue_size: int = 1000,
+             max_per_frame: int = 16) -> ICAsyncBinding:
+        return self._add_binding(producer, ICAsyncBinding(widget, attribute, None, policy, queue_size, max_per_frame))
+
+    # append the values of an async producer to lines of an ICGraph.
+    # the producer yields one value per line for every sample
+    def bind_lines(self, producer: AsyncIterable, graph: ICBaseWidget, line_names: tuple[str],
+                   policy: ICBackpressure = ICBackpressure.DropOldest, queue_size: int = 10000) -> ICAsyncBinding:
+        return self._add_binding(producer, ICAsyncBinding(graph, "", tuple(line_names), policy, queue_size))
+
+    ########################################################
+    # helper functions
+    ########################################################
+    # start consuming the producer of a binding
+    def _add_binding(self, producer: AsyncIterable, binding: ICAsyncBinding) -> ICAsyncBinding:
+        binding._future = self.submit(binding._consume(producer))
+        binding._future.add_done_callback(binding._on_done)
+        self._bindings.append(binding)
+        ICRefreshScheduler.instance().add_frame_callback(self._on_frame)
+        return binding
+
+    # frame of the refresh scheduler. delivers the waiting values and drops finished bindings
+    def _on_frame(self) -> None:
+        for binding in list(self._bindings):
+            try:
+                binding._deliver()
+            except RuntimeError:
+                # the widget has been deleted
+                binding.cancel()
+                self._bindings.remove(binding)
+                continue
+
+            if not binding.active and not binding.pending:
+                self._bindings.remove(binding)
+
+        # leave the frames when idle
+        if not self._bindings:
+            ICRefreshScheduler.instance().remove_frame_callback(self._on_frame)
@@ -10,11 +10,16 @@ TODO: History should be truned off by default
 
 from enum import Enum, Flag
 from collections import deque
+import time
+import functools
+import weakref
 from weakref import WeakValueDictionary
-from datetime import datetime, timedelta
+from datetime import datetime
 from PyQt6 import QtCore, QtGui, QtWidgets
 from PyQt6.QtCore import Qt
 from .display_config import ICDisplayConfig
+from .value_source import ICValueSource
+from .widget_history import ICEventCodes, ICEventTexts, ICHistoryBuffer, ICHistoryRegistry, history_time_ns, history_time_to_datetime
 
 
 class ICWidgetState(Enum):
@@ -74,6 +79,227 @@ class ICWidgetHistory:
             return NotImplemented
 
 
+class ICRefreshScheduler(QtCore.QObject):
+    """
+    Frame clock coalescing the repaint requests of streaming widgets.
+    Widgets register themselves as dirty with request_update and are repainted once per frame.
+    Frames run at the global max_fps and a widget with its own lower max_fps is deferred until its interval has passed.
+    Widgets bound to an ICValueSource pull the newest value of the source at every frame.
+    Frame callbacks, e.g. of ICAsyncBridge, are called at every frame before the sources are pulled.
+    The clock stops when no widget is dirty, no source is bound and no frame callback is added.
+    """
+    # scheduler shared by all the widgets
+    _instance = None
+
+    def __init__(self, max_fps: float = ICDisplayConfig.RefreshMaxFPS, *args, **kwargs):
+        super(ICRefreshScheduler, self).__init__(*args, **kwargs)
+
+        # widgets waiting for a repaint, keyed on their id
+        self._dirty: dict[int, 'ICBaseWidget'] = {}
+
+        # value sources bound to widget properties, keyed on the widget id and the property name.
+        # each binding is [weak reference to the widget, source, last sequence number pulled]
+        self._bindings: dict[tuple[int, str], list] = {}
+
+        # functions called at every frame
+        self._frame_callbacks: list = []
+
+        # repaint directly if not enabled
+        self._enabled: bool = True
+
+        # frame clock
+        self._max_fps: float = max_fps
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(int(1000 / max_fps))
+        self._timer.timeout.connect(self._on_frame)
+
+        # statistics
+        self._requests: int = 0
+        self._coalesced: int = 0
+        self._deferred: int = 0
+        self._repaints: int = 0
+        self._frames: int = 0
+        self._pulled: int = 0
+
+    # scheduler shared by all the widgets. created on first use
+    @classmethod
+    def instance(cls) -> 'ICRefreshScheduler':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    ########################################################
+    # properties
+    ########################################################
+    # get the global frame rate
+    @property
+    def max_fps(self) -> float:
+        return self._max_fps
+
+    # set the global frame rate
+    @max_fps.setter
+    def max_fps(self, fps: float) -> None:
+        if fps > 0:
+            self._max_fps = fps
+            self._timer.setInterval(int(1000 / fps))
+
+    # is the repaint coalescing enabled
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    # enable or disable the coalescing. pending repaints are issued when disabled
+    @enabled.setter
+    def enabled(self, en: bool) -> None:
+        self._enabled = en
+        if not en:
+            self.flush()
+
+    # number of widgets waiting for a repaint
+    @property
+    def pending(self) -> int:
+        return len(self._dirty)
+
+    # number of bound value sources
+    @property
+    def bindings(self) -> int:
+        return len(self._bindings)
+
+    # statistics on the repaint requests
+    #   requests    : repaint requests received
+    #   coalesced   : requests merged into an already pending repaint
+    #   deferred    : times a dirty widget was held back by its own frame rate
+    #   repaints    : repaints issued
+    #   frames      : frame clock ticks
+    #   pulled      : new values pulled from bound sources
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"requests": self._requests,
+                "coalesced": self._coalesced,
+                "deferred": self._deferred,
+                "repaints": self._repaints,
+                "frames": self._frames,
+                "pulled": self._pulled}
+
+    ########################################################
+    # functions
+    ########################################################
+    # mark a widget as dirty. it is repainted at the next frame
+    def request_update(self, widget: 'ICBaseWidget') -> None:
+        if not self._enabled:
+            widget.update()
+            return
+
+        self._requests += 1
+        key = id(widget)
+        if key in self._dirty:
+            self._coalesced += 1
+            return
+
+        self._dirty[key] = widget
+        if not self._timer.isActive():
+            self._timer.start()
+
+    # set a property of the widget to the newest value of the source at every frame
+    def bind(self, widget: 'ICBaseWidget', source: ICValueSource, attribute: str = "value") -> None:
+        self._bindings[(id(widget), attribute)] = [weakref.ref(widget), source, -1]
+        if not self._timer.isActive():
+            self._timer.start()
+
+    # call a function at every frame, e.g. to deliver values received in another thread
+    def add_frame_callback(self, callback) -> None:
+        if callback not in self._frame_callbacks:
+            self._frame_callbacks.append(callback)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    # stop calling a function at every frame
+    def remove_frame_callback(self, callback) -> None:
+        if callback in self._frame_callbacks:
+            self._frame_callbacks.remove(callback)
+
+    # remove the binding of a property of the widget, or all its bindings
+    def unbind(self, widget: 'ICBaseWidget', attribute: str = None) -> None:
+        widget_key = id(widget)
+        for key in [key for key in self._bindings if key[0] == widget_key and attribute in (None, key[1])]:
+            del self._bindings[key]
+
+    # repaint all the dirty widgets now
+    def flush(self) -> None:
+        dirty = self._dirty
+        self._dirty = {}
+        if not self._bindings and not self._frame_callbacks:
+            self._timer.stop()
+        for widget in dirty.values():
+            self._repaint(widget, time.monotonic())
+
+    # reset the statistics
+    def reset_stats(self) -> None:
+        self._requests = 0
+        self._coalesced = 0
+        self._deferred = 0
+        self._repaints = 0
+        self._frames = 0
+        self._pulled = 0
+
+    ########################################################
+    # helper functions
+    ########################################################
+    # repaint a widget and record the time
+    def _repaint(self, widget: 'ICBaseWidget', time_now: float) -> None:
+        widget._last_refresh_time = time_now
+        try:
+            widget.update()
+            self._repaints += 1
+        except RuntimeError:
+            # the widget has been deleted
+            pass
+
+    # set the bound properties whose source has a new value. the setters request the repaints
+    def _pull_sources(self) -> None:
+        for key, binding in list(self._bindings.items()):
+            widget = binding[0]()
+            if widget is None:
+                del self._bindings[key]
+                continue
+
+            value, _, sequence = binding[1].read()
+            if sequence == binding[2]:
+                continue
+
+            binding[2] = sequence
+            try:
+                setattr(widget, key[1], value)
+            except RuntimeError:
+                # the widget has been deleted
+                del self._bindings[key]
+                continue
+            self._pulled += 1
+
+    # frame clock tick
+    def _on_frame(self) -> None:
+        self._frames += 1
+        for callback in list(self._frame_callbacks):
+            callback()
+        if self._bindings:
+            self._pull_sources()
+        time_now = time.monotonic()
+
+        dirty = self._dirty
+        self._dirty = {}
+        for key, widget in dirty.items():
+            # hold back widgets with a lower frame rate
+            if widget.max_fps > 0 and (time_now - widget._last_refresh_time) * widget.max_fps < 1:
+                self._dirty[key] = widget
+                self._deferred += 1
+            else:
+                self._repaint(widget, time_now)
+
+        # stop the clock when idle
+        if not self._dirty and not self._bindings and not self._frame_callbacks:
+            self._timer.stop()
+
+
 class ICBaseWidget(QtWidgets.QWidget):
     """
     Base widget for all (or most) widgets
@@ -112,14 +338,27 @@ class ICBaseWidget(QtWidgets.QWidget):
         # maintain history
         self._enable_history: bool = False
         self._history_len: int = 20
-        self._history = deque(maxlen=self._history_len)
+        self._history: ICHistoryBuffer = ICHistoryBuffer(self._history_len)
+        self._history_shared: bool = False
 
-        # time of last event
-        self._last_event_time: datetime = datetime.now()
+        # events are also recorded in the history registry across all widgets while it is enabled.
+        # the widget is removed from the registry when it is destroyed
+        ICHistoryRegistry.instance().register(self._instance_id, type(self))
+        self.destroyed.connect(functools.partial(ICHistoryRegistry.instance().unregister, self._instance_id))
+
+        # time of last event in monotonic nanoseconds
+        self._last_event_time: int = history_time_ns()
 
         # append timeout for consecutive events
         self._event_append_timeout: int = 0
 
+        # frame rate limit for streaming updates. 0 uses the global frame rate of the refresh scheduler
+        self._max_fps: float = 0
+        self._last_refresh_time: float = 0
+
+        # paint static parts of the widget into cached layers
+        self._layer_caching: bool = ICDisplayConfig.LayerCaching
+
         # background color
         self._background_color: QtGui.QColor = ICDisplayConfig.BackgroundColor
 
@@ -132,11 +371,14 @@ class ICBaseWidget(QtWidgets.QWidget):
         # minimum height of the window
         self._height_min: int = 0
 
+        # style sheets applied to the widget and its children, keyed by the id of the target
+        self._applied_style_sheets: dict[int, str] = {}
+
         # setup visual effects
         self.setSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
 
         # background color of the button
-        self.setStyleSheet("background-color : " + ICDisplayConfig.QtColorToSting(self._background_color) + ";")
+        self.apply_style_sheet(ICDisplayConfig.style_sheet("Background", back=self._background_color))
 
     ########################################################
     # properties
@@ -222,24 +464,51 @@ class ICBaseWidget(QtWidgets.QWidget):
         return self._history_len
 
     # set the new length for the activity history
-    # the history deque is resized
-    # current history is copied to the resized
+    # the history buffer is resized, the latest events are kept
+    # a shared buffer is not resized, only the length of history is limited
     @history_length.setter
     def history_length(self, new_len: int) -> None:
-        new_history = deque(self._history, maxlen=new_len)
-        self._history.clear()
-        self._history = new_history
+        if not self._history_shared:
+            self._history.resize(new_len)
         self._history_len = new_len
 
     # read only property history
+    # the events of the widget are converted to ICWidgetHistory objects, latest last.
+    # text events show their text as the event, or TextEvent if the text has been dropped
     @property
     def history(self) -> deque:
+        records = self._history.query(widget=self._instance_id)[-self._history_len:]
+        text_event = ICEventCodes.find(ICEventTexts.TextEvent)
+        events = deque(maxlen=self._history_len)
+        for record in records:
+            event, value = ICEventCodes.name(record["event"]), float(record["value"])
+            if record["event"] == text_event:
+                text = ICEventTexts.text(value)
+                event, value = (event, value) if text is None else (text, 0.0)
+            events.append(ICWidgetHistory(history_time_to_datetime(record["time"]), event, value))
+        return events
+
+    # buffer holding the history events
+    @property
+    def history_buffer(self) -> ICHistoryBuffer:
         return self._history
 
+    # record the history in a buffer shared with other widgets.
+    # events are told apart by the instance id of the widget. None returns to a buffer of its own
+    @history_buffer.setter
+    def history_buffer(self, buffer: ICHistoryBuffer) -> None:
+        self._history_shared = buffer is not None
+        self._history = buffer if buffer is not None else ICHistoryBuffer(self._history_len)
+
+    # id of the widget instance used in the history records
+    @property
+    def instance_id(self) -> int:
+        return self._instance_id
+
     # last event time readonly
     @property
     def last_event_time(self) -> datetime:
-        return self._last_event_time
+        return history_time_to_datetime(self._last_event_time)
 
     # append timeout
     @property
@@ -250,6 +519,27 @@ class ICBaseWidget(QtWidgets.QWidget):
     def history_append_interval_millis(self, tm: int) -> None:
         self._event_append_timeout = tm
 
+    # get the frame rate limit for streaming updates
+    @property
+    def max_fps(self) -> float:
+        return self._max_fps
+
+    # set the frame rate limit for streaming updates. 0 uses the global frame rate
+    @max_fps.setter
+    def max_fps(self, fps: float) -> None:
+        self._max_fps = max(fps, 0)
+
+    # get the layer caching
+    @property
+    def layer_caching(self) -> bool:
+        return self._layer_caching
+
+    # set the layer caching. widgets without static layers ignore it
+    @layer_caching.setter
+    def layer_caching(self, cache: bool) -> None:
+        self._layer_caching = cache
+        self.invalidate_layers()
+
     # get background colour
     @property
     def background_color(self) -> QtGui.QColor:
@@ -259,6 +549,7 @@ class ICBaseWidget(QtWidgets.QWidget):
     @background_color.setter
     def background_color(self, clr: QtGui.QColor) -> None:
         self._background_color = clr
+        self.apply_style_sheet(ICDisplayConfig.style_sheet("Background", back=clr))
         self.update()
 
     # get background colour
@@ -288,25 +579,103 @@ class ICBaseWidget(QtWidgets.QWidget):
     ########################################################
     # append to event history
     def append_history(self, desc: str, val: float) -> None:
-        t_now = datetime.now()
-        interval = (t_now - self._last_event_time)/timedelta(milliseconds=1)
-        if interval > self.history_append_interval_millis:
+        t_now = history_time_ns()
+        if t_now - self._last_event_time > self._event_append_timeout * 1000000:
             self._last_event_time = t_now
-            self._history.append(ICWidgetHistory(t_now, desc, val))
+            event = ICEventCodes.code(desc)
+            self._history.append(self._instance_id, event, val, t_now)
+            ICHistoryRegistry.instance().append(self._instance_id, event, val, t_now)
+
+    # append a text to event history, e.g. a displayed text. the text is kept in the bounded ICEventTexts table
+    def append_history_text(self, text: str) -> None:
+        if history_time_ns() - self._last_event_time > self._event_append_timeout * 1000000:
+            self.append_history(ICEventTexts.TextEvent, ICEventTexts.store(text))
+
+    # request a repaint through the refresh scheduler.
+    # used for streaming data, the repaints are coalesced and limited to the frame rate
+    def request_update(self) -> None:
+        ICRefreshScheduler.instance().request_update(self)
+
+    # create a transparent pixmap matching the widget for painting a cached layer
+    def create_layer(self, width: int, height: int) -> QtGui.QPixmap:
+        ratio = self.devicePixelRatioF()
+        layer = QtGui.QPixmap(int(width * ratio), int(height * ratio))
+        layer.setDevicePixelRatio(ratio)
+        layer.fill(Qt.transparent)
+        return layer
+
+    # start painting a cached layer with the render hints, pen and font of the widget painter
+    def begin_layer_painter(self, layer: QtGui.QPixmap, painter: QtGui.QPainter) -> QtGui.QPainter:
+        layer_painter = QtGui.QPainter(layer)
+        layer_painter.setRenderHints(painter.renderHints())
+        layer_painter.setPen(painter.pen())
+        layer_painter.setFont(painter.font())
+        return layer_painter
+
+    # drop the cached layers and repaint
+    def invalidate_layers(self) -> None:
+        self.on_layers_invalidated()
+        self.update()
+
+    # set the style sheet of the widget or one of its children.
+    # the sheets from ICDisplayConfig.style_sheet are interned, so an unchanged sheet is not parsed again
+    def apply_style_sheet(self, sheet: str, target: QtWidgets.QWidget = None) -> None:
+        target = self if target is None else target
+        if self._applied_style_sheets.get(id(target)) is sheet:
+            return
+        self._applied_style_sheets[id(target)] = sheet
+        target.setStyleSheet(sheet)
 
     # clear the event history
     def clear_history(self) -> None:
-        self._history.clear()
+        self._history.clear(self._instance_id)
 
     # dhow the history
     def display_history(self) -> None:
         pass
 
+    # show the newest value of the source at every frame of the refresh scheduler.
+    # attribute is the property set to the value, e.g. gauge_value for ICGaugeBar
+    def bind_source(self, source: ICValueSource, attribute: str = "value") -> None:
+        ICRefreshScheduler.instance().bind(self, source, attribute)
+
+    # stop following the source bound to the property, or all the bound sources
+    def unbind_source(self, attribute: str = None) -> None:
+        ICRefreshScheduler.instance().unbind(self, attribute)
+
     # class method to get access to all the active instances
     @classmethod
     def instances(cls):
         return cls._instances.values()
 
+    # change the palette of ICDisplayConfig and restyle all the active widgets in one pass.
+    # widgets using the palette colors follow the new palette, colors set on a widget are kept.
+    # the palette colors are recognised by object, every widget attribute holding a replaced one is moved to its successor.
+    # updates of the top level windows are suspended meanwhile, so each window is repainted once.
+    # every changed style sheet is still polished on its own
+    @classmethod
+    def apply_theme(cls, **colors: QtGui.QColor) -> None:
+        old_colors = [getattr(ICDisplayConfig, name, None) for name in colors]
+        ICDisplayConfig.set_palette(**colors)
+        successors = {id(old): (old, getattr(ICDisplayConfig, name)) for name, old in zip(colors, old_colors)}
+
+        widgets = list(cls._instances.values())
+        windows = {widget.window() for widget in widgets}
+        for window in windows:
+            window.setUpdatesEnabled(False)
+
+        for widget in widgets:
+            attributes = vars(widget)
+            for name, value in attributes.items():
+                successor = successors.get(id(value))
+                if successor is not None and successor[0] is value:
+                    attributes[name] = successor[1]
+            widget.on_theme_changed()
+            widget.invalidate_layers()
+
+        for window in windows:
+            window.setUpdatesEnabled(True)
+
     ########################################################
     # methods to be overridden by subclasses
     ########################################################
@@ -338,6 +707,15 @@ class ICBaseWidget(QtWidgets.QWidget):
     def on_state_changed(self) -> None:
         pass
 
+    # cached layers need to be repainted
+    def on_layers_invalidated(self) -> None:
+        pass
+
+    # palette of ICDisplayConfig changed. the palette colors held by the widget have already been replaced,
+    # subclasses restyle the children and style sheets derived from them
+    def on_theme_changed(self) -> None:
+        self.apply_style_sheet(ICDisplayConfig.style_sheet("Background", back=self._background_color))
+
     ########################################################
     # overrides and event handlers
     ########################################################
@@ -28,7 +28,7 @@ class ICConfigDialogTemplate (QtWidgets.QDialog):
         self._value = None
 
         # background color of the button
-        self.setStyleSheet("background-color : " + ICDisplayConfig.QtColorToSting(ICDisplayConfig.BackgroundColor) + ";")
+        self.setStyleSheet(ICDisplayConfig.style_sheet("Background", back=ICDisplayConfig.BackgroundColor))
 
     # generate the standard ok and cancel button
     def generate_ok_cancel_buttons(self) -> QtWidgets.QHBoxLayout:
@@ -49,9 +49,7 @@ class ICDataInputWidget (ICBaseWidget):
         layout = QtWidgets.QVBoxLayout()
 
         self._value_display = QtWidgets.QLabel("", self)
-        self._value_display.setStyleSheet("QLabel { background-color : " + ICDisplayConfig.QtColorToSting(self.background_color) + "; color : " +
-                                          ICDisplayConfig.QtColorToSting(ICDisplayConfig.ValueTextColor) + "; border-radius : 5px; border-style : solid; " +
-                                          "border-width : 2px; border-color : " + ICDisplayConfig.QtColorToSting(ICDisplayConfig.LabelBorderColor) + ";}")
+        self._apply_value_style()
 
         self._value_display.setAlignment(Qt.AlignRight)
         self._value_display.setText("<span style='font-size:" + "{}".format(ICDisplayConfig.LabelTextSize) + "pt;'>" + "{}".format(curr_val) + "</span>")
@@ -271,6 +269,23 @@ class ICDataInputWidget (ICBaseWidget):
 
         return True
 
+    """
+        style of the value display from the current palette
+    """
+    def _apply_value_style(self) -> None:
+        self.apply_style_sheet(ICDisplayConfig.style_sheet("ValueInput", back=self.background_color, text=ICDisplayConfig.ValueTextColor,
+                                                           border=ICDisplayConfig.LabelBorderColor), self._value_display)
+
+    ###############################################################
+    # base class overrides
+    ###############################################################
+    """
+        Restyle the value display when the palette changes
+    """
+    def on_theme_changed(self) -> None:
+        super().on_theme_changed()
+        self._apply_value_style()
+
     ###############################################################
     # Slots
     ###############################################################
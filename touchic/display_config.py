@@ -9,6 +9,7 @@ rendering the controls.  These can be overridden by changing them at the object
 
 TODO: Implement local color class
 """
+import sys
 from PyQt6 import QtGui
 
 
@@ -17,6 +18,21 @@ class ICDisplayConfig:
     BackgroundColor = QtGui.QColor(38, 50, 56)
     InFocusColor = QtGui.QColor(255, 87, 34)
 
+    # Maximum frame rate for repainting streaming widgets
+    RefreshMaxFPS = 30
+
+    # Paint static parts of the widgets into cached layers
+    LayerCaching = True
+
+    # Number of events kept by the history registry across all widgets
+    HistoryRegistrySize = 100000
+
+    # Record the events of all widgets in the history registry. a registry sink receives the events either way
+    HistoryRegistryEnabled = False
+
+    # Number of texts of history events kept, e.g. the text of a text label
+    HistoryTextSize = 10000
+
     # Tab settings
     TabWidth = "100"
     TabHeight = "25"
@@ -182,6 +198,49 @@ class ICDisplayConfig:
     RotaryGaugeMinMaxColor = QtGui.QColor(255, 241, 118)
     RotaryGaugeTargetColor = QtGui.QColor(225, 190, 231)
 
+    # number of cached overlay layers for different value text widths
+    RotaryGaugeLayerCount = 8
+
+    # style sheet templates. the named colors are filled in as rgb strings
+    StyleSheetTemplates = {
+        "Background": "background-color : {back};",
+        "Label": "QLabel {{ background-color : {back}; color : {text};}}",
+        "AlarmMessage": "QLabel {{ background-color : {back}; color : {text}; border-radius : 8px; border-color : {border}; "
+                        "border-width : 2px; border-style: outset; }}",
+        "ValueInput": "QLabel {{ background-color : {back}; color : {text}; border-radius : 5px; border-style : solid; "
+                      "border-width : 2px; border-color : {border};}}",
+    }
+
+    # cache of color strings keyed by the rgb value
+    _color_strings: dict[int, str] = {}
+
+    # cache of interned style sheets keyed by the template and the rgb values of its colors
+    _style_sheets: dict[tuple, str] = {}
+
     @staticmethod
     def QtColorToSting(clr: QtGui.QColor):
-        return "rgb({0}, {1}, {2})".format(clr.red(), clr.green(), clr.blue())
+        rgb = clr.rgb()
+        txt = ICDisplayConfig._color_strings.get(rgb)
+        if txt is None:
+            txt = "rgb({0}, {1}, {2})".format(clr.red(), clr.green(), clr.blue())
+            ICDisplayConfig._color_strings[rgb] = txt
+        return txt
+
+    # style sheet for the template filled with the given colors. identical sheets are returned as the same object
+    @classmethod
+    def style_sheet(cls, template: str, **colors: QtGui.QColor) -> str:
+        key = (template,) + tuple((name, clr.rgb()) for name, clr in colors.items())
+        sheet = cls._style_sheets.get(key)
+        if sheet is None:
+            sheet = sys.intern(cls.StyleSheetTemplates[template].format(
+                **{name: cls.QtColorToSting(clr) for name, clr in colors.items()}))
+            cls._style_sheets[key] = sheet
+        return sheet
+
+    # replace the colors of the palette, e.g. set_palette(BackgroundColor=QtGui.QColor(0, 0, 0))
+    @classmethod
+    def set_palette(cls, **colors: QtGui.QColor) -> None:
+        for name, clr in colors.items():
+            if not isinstance(getattr(cls, name, None), QtGui.QColor):
+                raise AttributeError("{} is not a color of the display configuration".format(name))
+            setattr(cls, name, clr)
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 16 2026
+
+@author: Prosenjit
+
+Persistent, append only log of the widget history events.
+The log is a directory holding a catalog and numbered segment files. Segments are
+raw arrays of history records with the time stored in nanoseconds since the epoch.
+The catalog (one JSON object per line) maps the widget and event numbers used in
+the records to the class of the widget and the name of the event.
+
+Events are written by a background thread in batches, and the files are synced
+at most once per flush interval. The queued events are written when the log is
+closed, which happens at the latest when the interpreter exits. ICHistoryLogReader
+memory maps the segments for replaying and querying the events after the
+application has stopped.
+
+Record the events of all widgets with:
+    ICHistoryRegistry.instance().sink = ICHistoryLog("logs/history")
+"""
+
+import os
+import time
+import json
+import queue
+import atexit
+import threading
+import traceback
+from datetime import datetime
+import numpy as np
+from .widget_history import HistoryRecord, ICEventCodes, _wall_clock_offset_ns
+
+# file names in the log directory
+CatalogFileName = "catalog.jsonl"
+SegmentFileName = "segment-{:06d}.bin"
+
+
+class ICHistoryLog:
+    """
+    Writer of the persistent history log. Events are queued by append and written by a background thread.
+    The interface matches ICHistoryRegistry.sink: register for the widget classes and append for the events.
+    If writing fails the error is printed, kept in error and no further events are accepted.
+    """
+    def __init__(self, directory: str, segment_size: int = 1000000, flush_interval: float = 1.0):
+        self._directory: str = directory
+        self._segment_size: int = segment_size
+        self._flush_interval: float = flush_interval
+
+        # events waiting to be written by the writer thread
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+
+        # numbers of the widgets and events in the log, keyed by the process ids of the widgets and event codes
+        self._widgets: dict[int, int] = {}
+        self._events: dict[int, int] = {}
+        self._event_names: dict[str, int] = {}
+
+        # counters of the log
+        self._widget_count: int = 0
+        self._write_count: int = 0
+
+        # error that stopped the writer thread
+        self._error: Exception = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_catalog()
+        self._catalog = open(os.path.join(directory, CatalogFileName), "a", encoding="utf-8")
+        self._segment_index: int = 0
+        self._segment_count: int = 0
+        self._segment = None
+        self._open_last_segment()
+
+        self._writer: threading.Thread = threading.Thread(target=self._write_loop, name="ICHistoryLog", daemon=True)
+        self._writer.start()
+
+        # write the queued events when the interpreter exits
+        atexit.register(self.close)
+
+    ########################################################
+    # properties
+    ########################################################
+    # directory of the log
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    # number of events written to the segment files by this writer
+    @property
+    def write_count(self) -> int:
+        return self._write_count
+
+    # error that stopped the writer, None while the log is written
+    @property
+    def error(self) -> Exception:
+        return self._error
+
+    ########################################################
+    # functions
+    ########################################################
+    # register the class of a widget instance
+    def register(self, widget: int, widget_class: type) -> None:
+        if self._error is None:
+            self._queue.put((widget, widget_class.__name__))
+
+    # queue an event. the time is the monotonic history time of the process.
+    # events are dropped once writing has failed
+    def append(self, widget: int, event: int, value: float, tm: int) -> None:
+        if self._error is None:
+            self._queue.put((widget, event, value, tm))
+
+    # write the queued events and stop the writer thread
+    def close(self) -> None:
+        atexit.unregister(self.close)
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+    ########################################################
+    # helper functions
+    ########################################################
+    # restore the widget and event numbers of an existing log
+    def _load_catalog(self) -> None:
+        path = os.path.join(self._directory, CatalogFileName)
+        if not os.path.exists(path):
+            return
+
+        with open(path, encoding="utf-8") as catalog:
+            for line in catalog:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # incomplete last line
+                    continue
+                if "event" in entry:
+                    self._event_names[entry["name"]] = entry["event"]
+                elif "widget" in entry:
+                    self._widget_count = max(self._widget_count, entry["widget"] + 1)
+
+    # continue writing the last segment. an incomplete record at its end is dropped
+    def _open_last_segment(self) -> None:
+        while os.path.exists(self._segment_path(self._segment_index + 1)):
+            self._segment_index += 1
+
+        path = self._segment_path(self._segment_index)
+        self._segment = open(path, "ab")
+        size = self._segment.tell()
+        self._segment_count = size // HistoryRecord.itemsize
+        if size != self._segment_count * HistoryRecord.itemsize:
+            self._segment.truncate(self._segment_count * HistoryRecord.itemsize)
+            self._segment.seek(0, os.SEEK_END)
+
+    # path of a segment file
+    def _segment_path(self, index: int) -> str:
+        return os.path.join(self._directory, SegmentFileName.format(index))
+
+    # number of an event in the log. new events are added to the catalog
+    def _event_number(self, event: int) -> int:
+        number = self._events.get(event)
+        if number is None:
+            name = ICEventCodes.name(event)
+            number = self._event_names.get(name)
+            if number is None:
+                number = len(self._event_names)
+                self._event_names[name] = number
+                self._catalog.write(json.dumps({"event": number, "name": name}) + "\n")
+            self._events[event] = number
+        return number
+
+    # write a batch of queued items. returns False when the log has been closed
+    def _write_batch(self, items: list) -> bool:
+        records = np.empty(len(items), dtype=HistoryRecord)
+        count = 0
+        running = True
+        for item in items:
+            if item is None:
+                running = False
+            elif len(item) == 2:
+                # new widget
+                self._widgets[item[0]] = self._widget_count
+                self._catalog.write(json.dumps({"widget": self._widget_count, "class": item[1]}) + "\n")
+                self._widget_count += 1
+            else:
+                widget, event, value, tm = item
+                records[count] = (tm + _wall_clock_offset_ns, self._widgets.get(widget, -1), self._event_number(event), value)
+                count += 1
+
+        # the catalog is written first so that every record can be resolved
+        self._catalog.flush()
+
+        # split the records over the segments
+        written = 0
+        while written < count:
+            if self._segment_count >= self._segment_size:
+                self._sync()
+                self._segment.close()
+                self._segment_index += 1
+                self._segment_count = 0
+                self._segment = open(self._segment_path(self._segment_index), "ab")
+
+            part = min(count - written, self._segment_size - self._segment_count)
+            self._segment.write(records[written:written + part].tobytes())
+            self._segment_count += part
+            written += part
+
+        self._segment.flush()
+        self._write_count += count
+        return running
+
+    # sync the catalog and the current segment to the disk
+    def _sync(self) -> None:
+        os.fsync(self._catalog.fileno())
+        os.fsync(self._segment.fileno())
+
+    # writer thread. stops accepting events if writing fails
+    def _write_loop(self) -> None:
+        try:
+            self._write_events()
+        except Exception as error:
+            self._error = error
+            traceback.print_exc()
+        finally:
+            self._catalog.close()
+            self._segment.close()
+
+    # write the queued events in batches and sync at most once per flush interval, until the log is closed
+    def _write_events(self) -> None:
+        running = True
+        unsynced = False
+        last_sync = time.monotonic()
+        while running:
+            try:
+                items = [self._queue.get(timeout=self._flush_interval)]
+            except queue.Empty:
+                items = []
+
+            # all the queued events are written as one batch
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if items:
+                running = self._write_batch(items)
+                unsynced = True
+
+            if unsynced and (not running or time.monotonic() - last_sync >= self._flush_interval):
+                self._sync()
+                unsynced = False
+                last_sync = time.monotonic()
+
+
+class ICHistoryLogReader:
+    """
+    Read only access to a history log. The segments are memory mapped, so the events are loaded only when used.
+    Times are given as datetime and are stored in nanoseconds since the epoch.
+    """
+    def __init__(self, directory: str):
+        self._directory: str = directory
+
+        # class names of the widgets and names of the events by their number in the log
+        self._widget_classes: dict[int, str] = {}
+        self._event_names: dict[int, str] = {}
+
+        # memory mapped segments in the order they were written
+        self._segments: list[np.ndarray] = []
+
+        self.reload()
+
+    ########################################################
+    # properties
+    ########################################################
+    # number of events in the log
+    @property
+    def count(self) -> int:
+        return sum(segment.size for segment in self._segments)
+
+    ########################################################
+    # functions
+    ########################################################
+    # map the segments and read the catalog again, e.g. while the log is still being written
+    def reload(self) -> None:
+        self._widget_classes.clear()
+        self._event_names.clear()
+        with open(os.path.join(self._directory, CatalogFileName), encoding="utf-8") as catalog:
+            for line in catalog:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if "event" in entry:
+                    self._event_names[entry["event"]] = entry["name"]
+                elif "widget" in entry:
+                    self._widget_classes[entry["widget"]] = entry["class"]
+
+        self._segments.clear()
+        index = 0
+        while os.path.exists(path := os.path.join(self._directory, SegmentFileName.format(index))):
+            count = os.path.getsize(path) // HistoryRecord.itemsize
+            if count:
+                self._segments.append(np.memmap(path, dtype=HistoryRecord, mode="r", shape=(count,)))
+            index += 1
+
+    # class name of a widget in the log
+    def widget_class(self, widget: int) -> str:
+        return self._widget_classes.get(widget, "")
+
+    # name of an event in the log
+    def event_name(self, event: int) -> str:
+        return self._event_names.get(event, "")
+
+    # copy of the events in [start, stop), optionally filtered by the class name of the widgets and the event name
+    def query(self, start: datetime = None, stop: datetime = None, widget_class: str = None,
+              event: str = None) -> np.ndarray:
+        widgets = None
+        if widget_class is not None:
+            widgets = np.array([widget for widget, cls in self._widget_classes.items() if cls == widget_class], dtype=np.int32)
+        event_number = None
+        if event is not None:
+            event_number = next((number for number, name in self._event_names.items() if name == event), -1)
+
+        parts = []
+        for segment in self._segments:
+            mask = np.ones(segment.size, dtype=bool)
+            if start is not None:
+                mask &= segment["time"] >= int(start.timestamp() * 1e9)
+            if stop is not None:
+                mask &= segment["time"] < int(stop.timestamp() * 1e9)
+            if widgets is not None:
+                mask &= np.isin(segment["widget"], widgets)
+            if event_number is not None:
+                mask &= segment["event"] == event_number
+            parts.append(segment[mask])
+        return np.concatenate(parts) if parts else np.empty(0, dtype=HistoryRecord)
+
+    # iterate over the events in [start, stop) as (time, widget class, event name, value)
+    def replay(self, start: datetime = None, stop: datetime = None, widget_class: str = None, event: str = None):
+        for record in self.query(start, stop, widget_class, event):
+            yield (datetime.fromtimestamp(record["time"] / 1e9), self.widget_class(int(record["widget"])),
+                   self.event_name(int(record["event"])), float(record["value"]))
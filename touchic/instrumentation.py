@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 16 2026
+
+@author: Prosenjit
+
+Opt-in paint time instrumentation of the widgets.
+When enabled, the paintEvent and the value setters of ICBaseWidget and all of its
+subclasses are replaced by timed wrappers. Disabling restores the original methods,
+so the widgets run without any overhead while the instrumentation is off.
+
+Enable and receive a summary every second with:
+    ICInstrumentation.instance().summary_ready.connect(print)
+    ICInstrumentation.instance().enabled = True
+"""
+
+import time
+import functools
+from PyQt6 import QtCore
+from PyQt6.QtCore import pyqtSignal
+from .base_widget import ICBaseWidget, ICRefreshScheduler
+
+
+class ICInstrumentation(QtCore.QObject):
+    """
+    Collects per widget paint and update statistics and emits a periodic summary.
+    Statistics are kept per widget instance id as a dictionary:
+        class         : name of the widget class
+        repaints      : paint events handled
+        paint_time    : total paint time in seconds
+        max_paint_time: longest paint in seconds
+        updates       : calls of value setters and data update methods
+        update_time   : total time spent in them in seconds
+    """
+    # properties whose setters are timed as updates
+    ValueProperties = ("value", "gauge_value", "current_value", "selected", "switch_position")
+
+    # methods that are timed as updates
+    ValueMethods = ("push_data", "push_block", "update_data", "refresh_shared_lines")
+
+    # summary of the last interval
+    summary_ready = pyqtSignal(dict)
+
+    # instrumentation shared by all the widgets
+    _instance = None
+
+    def __init__(self, interval: float = 1.0, top_count: int = 5, *args, **kwargs):
+        super(ICInstrumentation, self).__init__(*args, **kwargs)
+
+        self._enabled: bool = False
+
+        # original class attributes replaced by the wrappers, as (class, name, attribute)
+        self._originals: list[tuple[type, str, object]] = []
+
+        # statistics since enabled and since the last summary
+        self._stats: dict[int, dict] = {}
+        self._interval_stats: dict[int, dict] = {}
+
+        # depth of nested paint events, e.g. a subclass calling the paintEvent of its base class
+        self._paint_depth: int = 0
+
+        # number of widgets in the summary
+        self._top_count: int = top_count
+
+        # summary clock
+        self._interval: float = interval
+        self._interval_start: float = time.monotonic()
+        self._scheduler_stats: dict[str, int] = {}
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(int(1000 * interval))
+        self._timer.timeout.connect(self._on_interval)
+
+    # instrumentation shared by all the widgets. created on first use
+    @classmethod
+    def instance(cls) -> 'ICInstrumentation':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    ########################################################
+    # properties
+    ########################################################
+    # is the instrumentation active
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    # install or remove the timed wrappers
+    @enabled.setter
+    def enabled(self, en: bool) -> None:
+        if en == self._enabled:
+            return
+
+        self._enabled = en
+        if en:
+            self._install()
+            self._start_interval()
+            self._timer.start()
+        else:
+            self._timer.stop()
+            self._uninstall()
+
+    # seconds between two summaries
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @interval.setter
+    def interval(self, tm: float) -> None:
+        if tm > 0:
+            self._interval = tm
+            self._timer.setInterval(int(1000 * tm))
+
+    # number of the slowest widgets listed in the summary
+    @property
+    def top_count(self) -> int:
+        return self._top_count
+
+    @top_count.setter
+    def top_count(self, count: int) -> None:
+        self._top_count = count
+
+    ########################################################
+    # functions
+    ########################################################
+    # copy of the statistics of all the widgets since enabled, keyed by the widget instance id
+    def stats(self) -> dict[int, dict]:
+        return {widget: dict(entry) for widget, entry in self._stats.items()}
+
+    # copy of the statistics of one widget
+    def widget_stats(self, widget: ICBaseWidget) -> dict:
+        return dict(self._stats.get(widget.instance_id, self._new_entry(widget)))
+
+    # clear the statistics
+    def reset_stats(self) -> None:
+        self._stats.clear()
+        self._start_interval()
+
+    # summary of the statistics since the last summary
+    #   interval      : length of the interval in seconds
+    #   repaint_rate  : repaints per second of all the widgets
+    #   update_rate   : updates per second of all the widgets
+    #   coalesced     : repaint requests merged by the refresh scheduler
+    #   slowest       : statistics of the widgets with the most paint time, each with its instance id as "widget"
+    def summary(self) -> dict:
+        elapsed = max(time.monotonic() - self._interval_start, 1e-9)
+        entries = self._interval_stats.values()
+        slowest = sorted(self._interval_stats.items(), key=lambda item: item[1]["paint_time"], reverse=True)
+        scheduler_stats = ICRefreshScheduler.instance().stats
+        return {"interval": elapsed,
+                "repaint_rate": sum(entry["repaints"] for entry in entries) / elapsed,
+                "update_rate": sum(entry["updates"] for entry in entries) / elapsed,
+                "coalesced": scheduler_stats["coalesced"] - self._scheduler_stats.get("coalesced", 0),
+                "slowest": [dict(entry, widget=widget) for widget, entry in slowest[:self._top_count]]}
+
+    ########################################################
+    # helper functions
+    ########################################################
+    # empty statistics of a widget
+    @staticmethod
+    def _new_entry(widget: ICBaseWidget) -> dict:
+        return {"class": type(widget).__name__, "repaints": 0, "paint_time": 0.0, "max_paint_time": 0.0,
+                "updates": 0, "update_time": 0.0}
+
+    # statistics of a widget in the given collection
+    def _entry(self, collection: dict[int, dict], widget: ICBaseWidget) -> dict:
+        entry = collection.get(widget.instance_id)
+        if entry is None:
+            entry = self._new_entry(widget)
+            collection[widget.instance_id] = entry
+        return entry
+
+    # record a paint event
+    def _record_paint(self, widget: ICBaseWidget, duration: float) -> None:
+        for collection in (self._stats, self._interval_stats):
+            entry = self._entry(collection, widget)
+            entry["repaints"] += 1
+            entry["paint_time"] += duration
+            if duration > entry["max_paint_time"]:
+                entry["max_paint_time"] = duration
+
+    # record a value update
+    def _record_update(self, widget: ICBaseWidget, duration: float) -> None:
+        for collection in (self._stats, self._interval_stats):
+            entry = self._entry(collection, widget)
+            entry["updates"] += 1
+            entry["update_time"] += duration
+
+    # start a new summary interval
+    def _start_interval(self) -> None:
+        self._interval_stats = {}
+        self._interval_start = time.monotonic()
+        self._scheduler_stats = ICRefreshScheduler.instance().stats
+
+    # summary clock tick
+    def _on_interval(self) -> None:
+        summary = self.summary()
+        self._start_interval()
+        self.summary_ready.emit(summary)
+
+    # ICBaseWidget and all its subclasses, including the subclasses of subclasses
+    @staticmethod
+    def _widget_classes() -> list[type]:
+        classes = [ICBaseWidget]
+        index = 0
+        while index < len(classes):
+            classes.extend(cls for cls in classes[index].__subclasses__() if cls not in classes)
+            index += 1
+        return classes
+
+    # replace the paint events and value setters defined by the widget classes with timed wrappers
+    def _install(self) -> None:
+        for cls in self._widget_classes():
+            attributes = cls.__dict__
+            if "paintEvent" in attributes:
+                self._replace(cls, "paintEvent", self._timed_paint(attributes["paintEvent"]))
+
+            for name in ICInstrumentation.ValueProperties:
+                prop = attributes.get(name)
+                if isinstance(prop, property) and prop.fset is not None:
+                    self._replace(cls, name, prop.setter(self._timed_update(prop.fset)))
+
+            for name in ICInstrumentation.ValueMethods:
+                if callable(attributes.get(name)):
+                    self._replace(cls, name, self._timed_update(attributes[name]))
+
+    # restore the original methods
+    def _uninstall(self) -> None:
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals.clear()
+
+    # replace a class attribute and keep the original
+    def _replace(self, cls: type, name: str, attribute) -> None:
+        self._originals.append((cls, name, cls.__dict__[name]))
+        setattr(cls, name, attribute)
+
+    # wrapper timing a paint event. only the outermost of nested paint events is recorded
+    def _timed_paint(self, paint_event):
+        @functools.wraps(paint_event)
+        def wrapper(widget, event):
+            self._paint_depth += 1
+            tic = time.perf_counter()
+            try:
+                paint_event(widget, event)
+            finally:
+                self._paint_depth -= 1
+                if self._paint_depth == 0:
+                    self._record_paint(widget, time.perf_counter() - tic)
+        return wrapper
+
+    # wrapper timing a value setter or data update method
+    def _timed_update(self, method):
+        @functools.wraps(method)
+        def wrapper(widget, *args, **kwargs):
+            tic = time.perf_counter()
+            try:
+                return method(widget, *args, **kwargs)
+            finally:
+                self._record_update(widget, time.perf_counter() - tic)
+        return wrapper
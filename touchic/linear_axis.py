@@ -46,6 +46,10 @@ class ICLinearAxis(ICBaseWidget):
         # margin left out on both sides of the scale
         self._margin: int = 0
 
+        # cached layer of the scale, ticks and labels
+        self._axis_layer: Union[QtGui.QPixmap, None] = None
+        self._layer_key: Union[tuple, None] = None
+
         # click-ability and focus-ability
         self.focusable = False
         self.clickable = False
@@ -70,7 +74,7 @@ class ICLinearAxis(ICBaseWidget):
     @label.setter
     def label(self, lbl: str) -> None:
         self._label = lbl
-        self.update()
+        self.invalidate_layers()
 
     # are we drawing the labels?
     @property
@@ -80,7 +84,7 @@ class ICLinearAxis(ICBaseWidget):
     @drawing_labels.setter
     def drawing_labels(self, cond: bool) -> None:
         self._drawing_labels = cond
-        self.update()
+        self.invalidate_layers()
 
     # get the tick text size
     @property
@@ -91,7 +95,7 @@ class ICLinearAxis(ICBaseWidget):
     @tick_text_size.setter
     def tick_text_size(self, sz: int) -> None:
         self._tick_text_size = sz
-        self.update()
+        self.invalidate_layers()
 
     # get the tick color
     @property
@@ -102,7 +106,7 @@ class ICLinearAxis(ICBaseWidget):
     @tick_color.setter
     def tick_color(self, clr: QtGui.QColor) -> None:
         self._tick_color = clr
-        self.update()
+        self.invalidate_layers()
 
     # margin from the edge of the widget
     @property
@@ -112,7 +116,7 @@ class ICLinearAxis(ICBaseWidget):
     @margin.setter
     def margin(self, x: int) -> None:
         self._margin = x
-        self.update()
+        self.invalidate_layers()
 
     # tick label format
     @property
@@ -125,7 +129,7 @@ class ICLinearAxis(ICBaseWidget):
         self._tick_label_format = fmt
         for index, each_value in enumerate(self._values):
             self._displayed_values[index] = self._tick_label_format.format(each_value)
-        self.update()
+        self.invalidate_layers()
 
     ########################################################
     # functions
@@ -134,12 +138,12 @@ class ICLinearAxis(ICBaseWidget):
     def update_value(self, index: int, value: float) -> None:
         self._values[index] = value
         self._displayed_values[index] = self._tick_label_format.format(value)
-        self.update()
+        self.invalidate_layers()
 
     # update displayed values
     def update_displayed_value(self, index: int, displayed_value: str) -> None:
         self._displayed_values[index] = displayed_value
-        self.update()
+        self.invalidate_layers()
 
     # estimate the widget size based on the text size
     def estimate_max_scale_width(self) -> int:
@@ -178,15 +182,27 @@ class ICLinearAxis(ICBaseWidget):
     # base class override
     ########################################################
     def on_position_changed(self) -> None:
+        self._layer_key = None
         if self.position.is_vertical():
             self.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.MinimumExpanding)
         else:
             self.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.Maximum)
 
+    # drop the cached axis
+    def on_layers_invalidated(self) -> None:
+        self._layer_key = None
+
     ########################################################
     # override event handlers
     ########################################################
+    # the font is used for the tick labels
+    def changeEvent(self, e: QtCore.QEvent) -> None:
+        if e.type() == QtCore.QEvent.FontChange:
+            self._layer_key = None
+        super(ICLinearAxis, self).changeEvent(e)
+
     # override the default paint event
+    # the axis is painted into a cached layer, which is repainted only after a change in size or the ticks
     def paintEvent(self, e):
         # if not visible then nothing else to do
         if self.state not in (ICWidgetState.VisibleEnabled, ICWidgetState.VisibleDisabled):
@@ -199,6 +215,25 @@ class ICLinearAxis(ICBaseWidget):
         tmp_width = painter.device().width()
         tmp_height = painter.device().height()
 
+        if not self._layer_caching:
+            self._draw_axis(painter, tmp_width, tmp_height)
+            return
+
+        layer_key = (tmp_width, tmp_height, self.devicePixelRatioF())
+        if self._layer_key != layer_key:
+            self._layer_key = layer_key
+            self._axis_layer = self.create_layer(tmp_width, tmp_height)
+            layer_painter = self.begin_layer_painter(self._axis_layer, painter)
+            self._draw_axis(layer_painter, tmp_width, tmp_height)
+            layer_painter.end()
+
+        painter.drawPixmap(0, 0, self._axis_layer)
+
+    ########################################################
+    # helper functions
+    ########################################################
+    # draw the scale, ticks and labels
+    def _draw_axis(self, painter: QtGui.QPainter, tmp_width: int, tmp_height: int) -> None:
         ##########################################################
         # draw the scale line
         ##########################################################
@@ -345,14 +380,15 @@ class ICLinearAxis(ICBaseWidget):
                     rect = QtCore.QRectF(tmp_width / 2 - 50, tmp_height - (self._tick_text_size + 5), 100, self._tick_text_size + 5)
                 painter.drawText(rect, Qt.AlignHCenter, self._label)
 
-    ########################################################
-    # helper functions
-    ########################################################
     # update ticks
     def update_ticks(self, max_value: float, min_value: float) -> None:
         # get the number of steps in display from the current length
         display_steps = len(self._values) - 1
 
+        # ticks before the update. the cached axis is kept if they do not change
+        previous_values = list(self._values)
+        previous_displayed_values = list(self._displayed_values)
+
         # add the first element
         self._values[0] = min_value
         self._displayed_values[0] = self._tick_label_format.format(min_value)
@@ -371,7 +407,8 @@ class ICLinearAxis(ICBaseWidget):
         self._displayed_values[display_steps] = self._tick_label_format.format(max_value)
 
         # update the view
-        self.update()
+        if self._values != previous_values or self._displayed_values != previous_displayed_values:
+            self.invalidate_layers()
 
     # create the value and displayed value lists from max an min range
     @staticmethod
@@ -433,6 +470,204 @@ class ICLinearAxis(ICBaseWidget):
         return selected_values, selected_displayed_values
 
 
+class ICTextDisplay(QtWidgets.QWidget):
+    """
+        Light weight text display for the title and value of the containers.
+        A main text and a unit text are painted side by side on a common baseline.
+        Both are held as static text, so the text layout is only prepared again for the part that has changed.
+    """
+    def __init__(self, text_color: QtGui.QColor, back_color: QtGui.QColor, main_size: int, unit_size: int, border_radius: int = 0,
+                 *args, **kwargs):
+        super(ICTextDisplay, self).__init__(*args, **kwargs)
+
+        # displayed text
+        self._main_text: str = ""
+        self._unit_text: str = ""
+
+        # colors and corner radius of the background
+        self._text_color: QtGui.QColor = text_color
+        self._back_color: QtGui.QColor = back_color
+        self._border_radius: int = border_radius
+
+        # fonts for the main and the unit text. sizes are in points
+        self._main_font: QtGui.QFont = QtGui.QFont(self.font())
+        self._main_font.setPointSize(main_size)
+        self._unit_font: QtGui.QFont = QtGui.QFont(self.font())
+        self._unit_font.setPointSize(unit_size)
+
+        # prepared static text and the font metrics used for placing them
+        self._main_static: QtGui.QStaticText = QtGui.QStaticText()
+        self._unit_static: QtGui.QStaticText = QtGui.QStaticText()
+        self._main_metrics: QtGui.QFontMetricsF = QtGui.QFontMetricsF(self._main_font)
+        self._unit_metrics: QtGui.QFontMetricsF = QtGui.QFontMetricsF(self._unit_font)
+
+        # size required by the text
+        self._size_hint: QtCore.QSize = QtCore.QSize(0, 0)
+        self._update_size_hint()
+
+        self.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+
+    ########################################################
+    # properties
+    ########################################################
+    # get the main text
+    @property
+    def main_text(self) -> str:
+        return self._main_text
+
+    # get the unit text
+    @property
+    def unit_text(self) -> str:
+        return self._unit_text
+
+    # get the text color
+    @property
+    def text_color(self) -> QtGui.QColor:
+        return self._text_color
+
+    # set the text color
+    @text_color.setter
+    def text_color(self, clr: QtGui.QColor) -> None:
+        if self._text_color != clr:
+            self._text_color = clr
+            self.update()
+
+    # get the background color
+    @property
+    def back_color(self) -> QtGui.QColor:
+        return self._back_color
+
+    # set the background color
+    @back_color.setter
+    def back_color(self, clr: QtGui.QColor) -> None:
+        if self._back_color != clr:
+            self._back_color = clr
+            self.update()
+
+    # get the size of the main text
+    @property
+    def main_size(self) -> int:
+        return self._main_font.pointSize()
+
+    # set the size of the main text
+    @main_size.setter
+    def main_size(self, sz: int) -> None:
+        if self._main_font.pointSize() != sz:
+            self._main_font.setPointSize(sz)
+            self._main_metrics = QtGui.QFontMetricsF(self._main_font)
+            self._prepare_main()
+            self._update_size_hint()
+            self.update()
+
+    # get the size of the unit text
+    @property
+    def unit_size(self) -> int:
+        return self._unit_font.pointSize()
+
+    # set the size of the unit text
+    @unit_size.setter
+    def unit_size(self, sz: int) -> None:
+        if self._unit_font.pointSize() != sz:
+            self._unit_font.setPointSize(sz)
+            self._unit_metrics = QtGui.QFontMetricsF(self._unit_font)
+            self._prepare_unit()
+            self._update_size_hint()
+            self.update()
+
+    ########################################################
+    # functions
+    ########################################################
+    # set the displayed text. nothing is done if the text has not changed
+    def set_text(self, main_text: str, unit_text: str = "") -> None:
+        changed = False
+        if main_text != self._main_text:
+            self._main_text = main_text
+            self._prepare_main()
+            changed = True
+
+        if unit_text != self._unit_text:
+            self._unit_text = unit_text
+            self._prepare_unit()
+            changed = True
+
+        if changed:
+            self._update_size_hint()
+            self.update()
+
+    ########################################################
+    # helper functions
+    ########################################################
+    # prepare the layout of the main text
+    def _prepare_main(self) -> None:
+        self._main_static = QtGui.QStaticText(self._main_text)
+        self._main_static.setTextFormat(Qt.PlainText)
+        self._main_static.prepare(QtGui.QTransform(), self._main_font)
+
+    # prepare the layout of the unit text
+    def _prepare_unit(self) -> None:
+        self._unit_static = QtGui.QStaticText(self._unit_text)
+        self._unit_static.setTextFormat(Qt.PlainText)
+        self._unit_static.prepare(QtGui.QTransform(), self._unit_font)
+
+    # recalculate the size required by the text. the layout is only updated if it has changed
+    def _update_size_hint(self) -> None:
+        height = max(self._main_metrics.height(), self._unit_metrics.height())
+        size_hint = QtCore.QSize(int(self._text_width()) + 4, int(height) + 4)
+        if size_hint != self._size_hint:
+            self._size_hint = size_hint
+            self.updateGeometry()
+
+    # width of the main and unit text with the space between them
+    def _text_width(self) -> float:
+        width = self._main_metrics.horizontalAdvance(self._main_text)
+        if self._unit_text:
+            width += self._main_metrics.horizontalAdvance(" ") + self._unit_metrics.horizontalAdvance(self._unit_text)
+        return width
+
+    ########################################################
+    # overrides and event handlers
+    ########################################################
+    # size hint for the layout manager
+    def sizeHint(self) -> QtCore.QSize:
+        return self._size_hint
+
+    # minimum size hint for the layout manager
+    def minimumSizeHint(self) -> QtCore.QSize:
+        return self._size_hint
+
+    # paint the background and the text
+    def paintEvent(self, e):
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+
+        # background
+        rect = QtCore.QRectF(self.rect())
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._back_color)
+        if self._border_radius > 0:
+            painter.drawRoundedRect(rect, self._border_radius, self._border_radius)
+        else:
+            painter.drawRect(rect)
+
+        if not self._main_text and not self._unit_text:
+            return
+
+        # the text is centred and the two parts share the baseline
+        ascent = max(self._main_metrics.ascent(), self._unit_metrics.ascent())
+        descent = max(self._main_metrics.descent(), self._unit_metrics.descent())
+        baseline = 0.5 * (rect.height() - ascent - descent) + ascent
+        x_pos = 0.5 * (rect.width() - self._text_width())
+
+        painter.setPen(self._text_color)
+        painter.setFont(self._main_font)
+        painter.drawStaticText(QtCore.QPointF(x_pos, baseline - self._main_metrics.ascent()), self._main_static)
+
+        if self._unit_text:
+            x_pos += self._main_metrics.horizontalAdvance(self._main_text + " ")
+            painter.setFont(self._unit_font)
+            painter.drawStaticText(QtCore.QPointF(x_pos, baseline - self._unit_metrics.ascent()), self._unit_static)
+
+
 class ICLinearContainerType(Enum):
     BAR = 1
     BAR_NO_TITLE = 2
@@ -589,18 +824,13 @@ class ICLinearAxisContainer(ICBaseWidget):
         self._title_display = None
         if self.__container_type in (ICLinearContainerType.PLOT, ICLinearContainerType.PLOT_NO_VALUE, ICLinearContainerType.BAR,
                                      ICLinearContainerType.BAR_NO_VALUE):
-            self._title_display = QtWidgets.QLabel("", self)
-            self._title_display.setStyleSheet("QLabel { background-color : " + ICDisplayConfig.QtColorToSting(self.background_color) + "; color : " +
-                                              ICDisplayConfig.QtColorToSting(self._title_color) + ";}")
-            self._title_display.setAlignment(Qt.AlignCenter)
+            self._title_display = ICTextDisplay(self._title_color, self.background_color, self._title_size, self._unit_size, 0, self)
 
         # add display value label
         self._value_display = None
         if self.__container_type in (ICLinearContainerType.PLOT, ICLinearContainerType.PLOT_NO_TITLE, ICLinearContainerType.BAR,
                                      ICLinearContainerType.BAR_NO_TITLE):
-            self._value_display = QtWidgets.QLabel("", self)
-            self._value_display.setStyleSheet("QLabel { background-color : " + ICDisplayConfig.QtColorToSting(self.background_color) + "; color : " +
-                                              ICDisplayConfig.QtColorToSting(self._value_color) + "; border-radius : 5px; }")
+            self._value_display = ICTextDisplay(self._value_color, self.background_color, self._value_size, self._unit_size, 5, self)
 
         # create the grid layout
         self._layout: QtWidgets.QGridLayout = QtWidgets.QGridLayout()
@@ -835,6 +1065,7 @@ class ICLinearAxisContainer(ICBaseWidget):
     def alarm_colors(self, clrs: tuple[QtGui.QColor, QtGui.QColor]) -> None:
         self._error_back_color = clrs[0]
         self._error_text_color = clrs[1]
+        self._value_format_changed = True
         self._value_update()
 
     # get the size of the title text
@@ -1034,59 +1265,55 @@ class ICLinearAxisContainer(ICBaseWidget):
 
         # set up the display style
         if self._title_format_changed:
-            self._title_display.setStyleSheet("QLabel { background-color : " + ICDisplayConfig.QtColorToSting(self.background_color) + "; color : " +
-                                              ICDisplayConfig.QtColorToSting(self._title_color) + ";}")
+            self._title_display.back_color = self.background_color
+            self._title_display.text_color = self._title_color
+            self._title_display.main_size = self._title_size
+            self._title_display.unit_size = self._unit_size
             self._title_format_changed = False
 
         # update the text based on the state
         if self.state in (ICWidgetState.Transparent, ICWidgetState.FrameOnly):
-            self._title_display.setText("<span style='font-size:" + "{}".format(self._title_size) + "pt;'>" + "</span><span style='font-size:" +
-                                        "{}".format(self._unit_size) + "pt;'></span>")
+            self._title_display.set_text("")
+        elif self._unit:
+            self._title_display.set_text(self._title, "(" + self._unit + ")")
         else:
-            if self._unit:
-                self._title_display.setText("<span style='font-size:" + "{}".format(self._title_size) + "pt;'>" + self._title +
-                                            "</span> <span style='font-size:" + "{}".format(self._unit_size) + "pt;'>(" + self._unit + ")</span>")
-            else:
-                self._title_display.setText("<span style='font-size:" + "{}".format(self._title_size) + "pt;'>" + self._title + "</span>")
-
-        # update the title
-        self._title_display.update()
+            self._title_display.set_text(self._title)
 
     # update value
+    # the display is only repainted if the formatted value or the alarm status has changed
     def _value_update(self):
         # nothing to do if hidden
         if self.state == ICWidgetState.Hidden or self._value_display is None or self._central_widget is None:
             return
 
+        # set up the display style
+        if self._value_format_changed:
+            self._value_display.main_size = self._value_size
+            self._value_display.unit_size = self._unit_size
+            self._value_format_changed = False
+            self._alarmed = None
+
         # update the value based on widget visibility state
-        self._value_display.setAlignment(Qt.AlignCenter)
         if self.state in (ICWidgetState.Transparent, ICWidgetState.FrameOnly):
             # set background color and do not draw
-            self._value_display.setStyleSheet("QLabel { background-color : " + ICDisplayConfig.QtColorToSting(self.background_color) + "; color : " +
-                                              ICDisplayConfig.QtColorToSting(self._value_color) + "; border-radius : 5px;}")
-            self._value_display.setText("<span style='font-size:" + "{}".format(self._value_size) + "pt;'> </span> <span style='font-size:" +
-                                        "{}".format(self._unit_size) + "pt;'></span>")
+            self._value_display.back_color = self.background_color
+            self._value_display.text_color = self._value_color
+            self._value_display.set_text("")
+            self._alarmed = None
         else:
             # change if alarm status changed or format changed
-            if self._central_widget.alarm_activated != self._alarmed or self._value_format_changed:
+            if self._central_widget.alarm_activated != self._alarmed:
                 self._alarmed = self._central_widget.alarm_activated
                 # select format based on  alarm state
                 if self._central_widget.alarm_activated:
-                    self._value_display.setStyleSheet("QLabel { background-color : " + ICDisplayConfig.QtColorToSting(self._error_back_color) +
-                                                      "; color : " + ICDisplayConfig.QtColorToSting(self._error_text_color) + "; border-radius : 5px; }")
+                    self._value_display.back_color = self._error_back_color
+                    self._value_display.text_color = self._error_text_color
                 else:
-                    self._value_display.setStyleSheet("QLabel { background-color : " + ICDisplayConfig.QtColorToSting(self.background_color) +
-                                                      "; color : " + ICDisplayConfig.QtColorToSting(self._value_color) + "; border-radius : 5px; }")
+                    self._value_display.back_color = self.background_color
+                    self._value_display.text_color = self._value_color
 
             # update the value text
-            if self._unit:
-                self._value_display.setText("<span style='font-size:" + "{}".format(self._value_size) + "pt;'>" + "{:.2f}".format(self._value) +
-                                            "</span> <span style='font-size:" + "{}".format(self._unit_size) + "pt;'>" + self._unit + "</span>")
-            else:
-                self._value_display.setText("<span style='font-size:" + "{}".format(self._value_size) + "pt;'>" + "{:.2f}".format(self._value) + "</span>")
-
-        # update the label
-        self._value_display.update()
+            self._value_display.set_text("{:.2f}".format(self._value), self._unit)
 
     # update the widget
     def _local_update(self):
@@ -1170,6 +1397,13 @@ class ICLinearAxisContainer(ICBaseWidget):
             # update the screen
             self._local_update()
 
+    # palette changed. the title and value displays take the colors of the new palette
+    def on_theme_changed(self) -> None:
+        super().on_theme_changed()
+        self._title_format_changed = True
+        self._alarmed = None
+        self._local_update()
+
     ########################################################
     # override event handlers
     ########################################################
@@ -86,6 +86,11 @@ class ICGaugeBar(ICBaseWidget):
         # target color
         self._target_color: QtGui.QColor = ICDisplayConfig.LinearGaugeTargetColor
 
+        # cached layers of the container and of the target and alarm levels
+        self._background_layer: Union[QtGui.QPixmap, None] = None
+        self._overlay_layer: Union[QtGui.QPixmap, None] = None
+        self._layer_key: Union[tuple, None] = None
+
         # sets the click-ability and focus-ability of the button
         self.clickable = True
         self.focusable = False
@@ -108,7 +113,7 @@ class ICGaugeBar(ICBaseWidget):
     @gauge_range_min.setter
     def gauge_range_min(self, min_val: float) -> None:
         self._gauge_range_min = min_val
-        self.update()
+        self.invalidate_layers()
 
     # get the maximum limit of the gauge bar
     @property
@@ -119,7 +124,7 @@ class ICGaugeBar(ICBaseWidget):
     @gauge_range_max.setter
     def gauge_range_max(self, max_val: float) -> None:
         self._gauge_range_max = max_val
-        self.update()
+        self.invalidate_layers()
 
     # get the current value
     @property
@@ -162,7 +167,7 @@ class ICGaugeBar(ICBaseWidget):
                     self.alarm_activated = True
 
             self.changed.emit(val)
-            self.update()
+            self.request_update()
 
     # get the upper level alarm
     # tuple of (name, value)
@@ -191,7 +196,7 @@ class ICGaugeBar(ICBaseWidget):
             if self._gauge_val > self._alarm_upper_level:
                 self.alarm_activated = True
                 self.changed.emit(self._gauge_val)
-            self.update()
+            self.invalidate_layers()
 
     # get the lower level alarm
     # tuple of (name, value)
@@ -220,7 +225,7 @@ class ICGaugeBar(ICBaseWidget):
             if self._gauge_val < self._alarm_lower_level:
                 self.alarm_activated = True
                 self.changed.emit(self._gauge_val)
-            self.update()
+            self.invalidate_layers()
 
     @property
     def target_value(self) -> Union[float, None]:
@@ -232,7 +237,7 @@ class ICGaugeBar(ICBaseWidget):
     def target_value(self, val: float) -> None:
         self._target_tracking = True
         self._target_value = val
-        self.update()
+        self.invalidate_layers()
 
     # gauge width
     @property
@@ -242,7 +247,7 @@ class ICGaugeBar(ICBaseWidget):
     @gauge_width.setter
     def gauge_width(self, wd: int) -> None:
         self._gauge_width = wd
-        self.update()
+        self.invalidate_layers()
 
     # get the background container color of the bar
     @property
@@ -254,7 +259,7 @@ class ICGaugeBar(ICBaseWidget):
     def container_colors(self, clrs: tuple[QtGui.QColor, QtGui.QColor]) -> None:
         self._back_color_light = clrs[0]
         self._back_color_dark = clrs[1]
-        self.update()
+        self.invalidate_layers()
 
     # get the normal gauge color
     @property
@@ -289,6 +294,7 @@ class ICGaugeBar(ICBaseWidget):
     @alarm_level_text_size.setter
     def alarm_level_text_size(self, sz: int) -> None:
         self._alarm_text_size = sz
+        self.invalidate_layers()
 
     # get the alarm level text color
     @property
@@ -299,6 +305,7 @@ class ICGaugeBar(ICBaseWidget):
     @alarm_level_text_color.setter
     def alarm_level_text_color(self, clr: QtGui.QColor) -> None:
         self._alarm_text_color = clr
+        self.invalidate_layers()
 
     # min max color
     @property
@@ -318,7 +325,7 @@ class ICGaugeBar(ICBaseWidget):
     @target_color.setter
     def target_color(self, clr: QtGui.QColor) -> None:
         self._target_color = clr
-        self.update()
+        self.invalidate_layers()
 
     ########################################################
     # functions
@@ -372,6 +379,10 @@ class ICGaugeBar(ICBaseWidget):
     ########################################################
     # base class event overrides
     ########################################################
+    # drop the cached layers
+    def on_layers_invalidated(self) -> None:
+        self._layer_key = None
+
     # TODO: mouse click plots the history
     def on_mouse_released(self, event: QtGui.QMouseEvent) -> None:
         pass
@@ -630,33 +641,53 @@ class ICGaugeBar(ICBaseWidget):
                                                           bar_width - gauge_size_x - 10, self._alarm_text_size + 5)
                     upper_alarm_text_align = Qt.AlignLeft
 
+        ##################################################
+        # cached layers
+        ##################################################
+        # the container is painted into the background layer and the target and alarm levels into the overlay layer.
+        # they are repainted only after a change in size, state, position or the properties.
+        layer_key = (bar_width, bar_height, self.state, self.position)
+        paint_layers = not self._layer_caching or self._layer_key != layer_key
+        if self._layer_caching and paint_layers:
+            self._layer_key = layer_key
+            self._background_layer = self.create_layer(bar_width, bar_height)
+            self._overlay_layer = self.create_layer(bar_width, bar_height)
+
         ##################################################
         # paint the main rectangle
         ##################################################
-        rect = QtCore.QRectF(gauge_start_x, gauge_start_y, gauge_size_x, gauge_size_y)
+        if paint_layers:
+            back_painter = self.begin_layer_painter(self._background_layer, painter) if self._layer_caching else painter
+            rect = QtCore.QRectF(gauge_start_x, gauge_start_y, gauge_size_x, gauge_size_y)
 
-        if self.position.is_horizontal():
-            brush = QtGui.QLinearGradient(rect.topRight(), rect.topLeft())
-        else:
-            brush = QtGui.QLinearGradient(rect.bottomLeft(), rect.topLeft())
+            if self.position.is_horizontal():
+                brush = QtGui.QLinearGradient(rect.topRight(), rect.topLeft())
+            else:
+                brush = QtGui.QLinearGradient(rect.bottomLeft(), rect.topLeft())
 
-        # define the filling brush
-        brush.setColorAt(0, self._back_color_light)
-        brush.setColorAt(1, self._back_color_dark)
-        painter.setBrush(brush)
+            # define the filling brush
+            brush.setColorAt(0, self._back_color_light)
+            brush.setColorAt(1, self._back_color_dark)
+            back_painter.setBrush(brush)
 
-        # define the pen
-        pen = QtGui.QPen(ICDisplayConfig.LinearSlideBoxColorLight)
-        pen.setWidth(1)
-        pen.setCapStyle(Qt.RoundCap)
-        pen.setJoinStyle(Qt.RoundJoin)
-        painter.setPen(pen)
+            # define the pen
+            pen = QtGui.QPen(ICDisplayConfig.LinearSlideBoxColorLight)
+            pen.setWidth(1)
+            pen.setCapStyle(Qt.RoundCap)
+            pen.setJoinStyle(Qt.RoundJoin)
+            back_painter.setPen(pen)
 
-        # define the path and draw
-        path = QtGui.QPainterPath()
-        path.setFillRule(Qt.WindingFill)
-        path.addRoundedRect(rect, 10, 10)
-        painter.drawPath(path)
+            # define the path and draw
+            path = QtGui.QPainterPath()
+            path.setFillRule(Qt.WindingFill)
+            path.addRoundedRect(rect, 10, 10)
+            back_painter.drawPath(path)
+
+            if back_painter is not painter:
+                back_painter.end()
+
+        if self._layer_caching:
+            painter.drawPixmap(0, 0, self._background_layer)
 
         # leave here for frame only
         if self.state == ICWidgetState.FrameOnly:
@@ -667,6 +698,11 @@ class ICGaugeBar(ICBaseWidget):
         ##################################################
         rect = QtCore.QRectF(bar_start_x, bar_start_y, bar_size_x, bar_size_y)
 
+        # define the pen
+        pen = QtGui.QPen(ICDisplayConfig.LinearSlideBoxColorLight)
+        pen.setCapStyle(Qt.RoundCap)
+        pen.setJoinStyle(Qt.RoundJoin)
+
         brush = QtGui.QLinearGradient(rect.topRight(), rect.bottomLeft())
 
         # set the default color
@@ -704,56 +740,68 @@ class ICGaugeBar(ICBaseWidget):
             painter.drawLine(max_point_one, max_point_two)
 
         ##################################################
-        # draw target tracking
+        # target and alarm levels
         ##################################################
-        pen = painter.pen()
-        pen.setColor(self._target_color)
-        pen.setWidth(4)
-        painter.setPen(pen)
+        if paint_layers:
+            overlay_painter = self.begin_layer_painter(self._overlay_layer, painter) if self._layer_caching else painter
 
-        if self._target_tracking:
-            painter.drawLine(target_point_one, target_point_two)
+            ##################################################
+            # draw target tracking
+            ##################################################
+            pen = overlay_painter.pen()
+            pen.setColor(self._target_color)
+            pen.setWidth(4)
+            overlay_painter.setPen(pen)
 
-        ##################################################
-        # draw the limits.
-        ##################################################
-        # setup the font and pen
-        fnt = painter.font()
-        fnt.setBold(True)
-        fnt.setPixelSize(self._alarm_text_size)
-        painter.setFont(fnt)
+            if self._target_tracking:
+                overlay_painter.drawLine(target_point_one, target_point_two)
 
-        # set up the pen
-        pen = painter.pen()
-        pen.setColor(self._alarm_text_color)
-        pen.setWidth(4)
-        painter.setPen(pen)
+            ##################################################
+            # draw the limits.
+            ##################################################
+            # setup the font and pen
+            fnt = overlay_painter.font()
+            fnt.setBold(True)
+            fnt.setPixelSize(self._alarm_text_size)
+            overlay_painter.setFont(fnt)
 
-        # draw the lower level set point
-        if self._alarm_lower_level_set:
-            # draw the alarm level
-            painter.drawLine(lower_alarm_point_one, lower_alarm_point_two)
+            # set up the pen
+            pen = overlay_painter.pen()
+            pen.setColor(self._alarm_text_color)
+            pen.setWidth(4)
+            overlay_painter.setPen(pen)
 
-            # setup the pen for writing the alarm text
-            pen.setWidth(1)
-            painter.setPen(pen)
+            # draw the lower level set point
+            if self._alarm_lower_level_set:
+                # draw the alarm level
+                overlay_painter.drawLine(lower_alarm_point_one, lower_alarm_point_two)
 
-            # draw the alarm text
-            painter.drawText(lower_alarm_text_rect, lower_alarm_text_align, self._alarm_lower_level_text)
+                # setup the pen for writing the alarm text
+                pen.setWidth(1)
+                overlay_painter.setPen(pen)
 
-        # draw the upper level set point
-        pen.setWidth(4)
-        painter.setPen(pen)
-        if self._alarm_upper_level_set:
-            # draw the alarm level
-            painter.drawLine(upper_alarm_point_one, upper_alarm_point_two)
+                # draw the alarm text
+                overlay_painter.drawText(lower_alarm_text_rect, lower_alarm_text_align, self._alarm_lower_level_text)
 
-            # setup the pen for writing the alarm text
-            pen.setWidth(1)
-            painter.setPen(pen)
+            # draw the upper level set point
+            pen.setWidth(4)
+            overlay_painter.setPen(pen)
+            if self._alarm_upper_level_set:
+                # draw the alarm level
+                overlay_painter.drawLine(upper_alarm_point_one, upper_alarm_point_two)
+
+                # setup the pen for writing the alarm text
+                pen.setWidth(1)
+                overlay_painter.setPen(pen)
+
+                # draw the alarm text
+                overlay_painter.drawText(upper_alarm_text_rect, upper_alarm_text_align, self._alarm_upper_level_text)
+
+            if overlay_painter is not painter:
+                overlay_painter.end()
 
-            # draw the alarm text
-            painter.drawText(upper_alarm_text_rect, upper_alarm_text_align, self._alarm_upper_level_text)
+        if self._layer_caching:
+            painter.drawPixmap(0, 0, self._overlay_layer)
 
 
 class ICLinearGauge(ICLinearAxisContainer):
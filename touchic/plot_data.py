@@ -0,0 +1,706 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 16 2026
+
+@author: Prosenjit
+
+Data structures used by ICGraph to index and share plot data
+"""
+
+import multiprocessing
+from multiprocessing import shared_memory, resource_tracker
+import numpy as np
+
+
+class ICMinMaxPyramid:
+    """
+    Multi-resolution min/max index over a data array.
+    Level k holds, for every block of 2**k samples, the index of the smallest and the largest sample.
+    Levels are built up to a single block covering the complete array.
+    Blocks are aligned to powers of two, so window returns an approximate envelope of arbitrary ranges
+    while extremes covers each range exactly with at most two blocks per level.
+    NaN marks a gap as in minmax_decimate. It ranks above every value for the min and below every value
+    for the max, and the first NaN of every block is indexed so that gaps are kept.
+    """
+    def __init__(self, data: np.ndarray):
+        self._data: np.ndarray = data
+
+        # index of min and max samples per block. list position k holds level k + 1
+        self._min_index: list[np.ndarray] = []
+        self._max_index: list[np.ndarray] = []
+
+        # index of the first NaN sample per block, the data size if the block has none
+        self._gap_index: list[np.ndarray] = []
+
+        self.rebuild()
+
+    ########################################################
+    # properties
+    ########################################################
+    @property
+    def data(self) -> np.ndarray:
+        return self._data
+
+    # number of levels above the raw data
+    @property
+    def levels(self) -> int:
+        return len(self._min_index)
+
+    # smallest value in the data, read from the top of the pyramid
+    @property
+    def min_value(self) -> float:
+        if self._min_index:
+            return float(self._data[self._min_index[-1][0]])
+        return float(self._data[0]) if self._data.size else float("nan")
+
+    # largest value in the data, read from the top of the pyramid
+    @property
+    def max_value(self) -> float:
+        if self._max_index:
+            return float(self._data[self._max_index[-1][0]])
+        return float(self._data[0]) if self._data.size else float("nan")
+
+    ########################################################
+    # functions
+    ########################################################
+    # rebuild all the levels, optionally for a new data array
+    def rebuild(self, data: np.ndarray = None) -> None:
+        if data is not None:
+            self._data = data
+
+        self._min_index.clear()
+        self._max_index.clear()
+        self._gap_index.clear()
+
+        child_count = self._data.size
+        while child_count > 1:
+            blocks = np.arange((child_count + 1) // 2)
+            block_min, block_max, block_gap = self._combine(len(self._min_index), blocks)
+            self._min_index.append(block_min)
+            self._max_index.append(block_max)
+            self._gap_index.append(block_gap)
+            child_count = blocks.size
+
+    # update the levels after the samples in [start, stop) have changed
+    def update_range(self, start: int, stop: int) -> None:
+        if stop <= start:
+            return
+
+        for level in range(len(self._min_index)):
+            # blocks at the next level covering the changed range
+            start >>= 1
+            stop = ((stop - 1) >> 1) + 1
+            blocks = np.arange(start, stop)
+            block_min, block_max, block_gap = self._combine(level, blocks)
+            self._min_index[level][start:stop] = block_min
+            self._max_index[level][start:stop] = block_max
+            self._gap_index[level][start:stop] = block_gap
+
+    # update the levels after a single sample has changed.
+    # walks up the levels with scalar operations as this is called for every pushed sample
+    def update(self, index: int) -> None:
+        value = self._data.item
+        size = child_count = self._data.size
+        child_min = child_max = child_gap = None
+        block = index
+
+        for level in range(len(self._min_index)):
+            block >>= 1
+            left = 2 * block
+            right = left + 1 if left + 1 < child_count else left
+
+            if child_min is None:
+                left_min = left_max = left
+                right_min = right_max = right
+                left_gap = left if value(left) != value(left) else size
+                right_gap = right if value(right) != value(right) else size
+            else:
+                left_min = child_min.item(left)
+                left_max = child_max.item(left)
+                right_min = child_min.item(right)
+                right_max = child_max.item(right)
+                left_gap = child_gap.item(left)
+                right_gap = child_gap.item(right)
+
+            # the right child wins only if it is strictly smaller or larger, NaN losing to every value
+            low_right, low_left = value(right_min), value(left_min)
+            high_right, high_left = value(right_max), value(left_max)
+            child_min = self._min_index[level]
+            child_max = self._max_index[level]
+            child_gap = self._gap_index[level]
+            child_min[block] = right_min if low_right < low_left or (low_left != low_left and low_right < np.inf) else left_min
+            child_max[block] = right_max if high_right > high_left or (high_left != high_left and high_right > -np.inf) else left_max
+            child_gap[block] = left_gap if left_gap < right_gap else right_gap
+            child_count = child_min.size
+
+    # indices of the min and max samples of the blocks covering [start, stop).
+    # the coarsest level that represents the window with at most max_blocks blocks is used.
+    # the returned indices are sorted.
+    def window(self, start: int, stop: int, max_blocks: int) -> np.ndarray:
+        count = stop - start
+        if count <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        # nothing to select from for a single sample
+        if not self._min_index:
+            return np.arange(start, stop)
+
+        # select the resolution level
+        level = 1
+        while level < len(self._min_index) and (count >> level) >= max_blocks:
+            level += 1
+
+        first_block = start >> level
+        last_block = ((stop - 1) >> level) + 1
+        block_min = self._min_index[level - 1][first_block:last_block]
+        block_max = self._max_index[level - 1][first_block:last_block]
+
+        # order the two extremes of each block and drop duplicates
+        low = np.minimum(block_min, block_max)
+        high = np.maximum(block_min, block_max)
+        pairs = np.column_stack((low, high)).ravel()
+        keep = np.ones(pairs.size, dtype=bool)
+        keep[1::2] = high != low
+        return pairs[keep]
+
+    # indices of the smallest and largest sample and of the first NaN in each of the non empty index ranges
+    # [starts[i], stops[i]). the first of equal extremes is returned, and -1 for ranges without a NaN.
+    # the ranges are walked up the levels together, taking the blocks at their unaligned ends on every level
+    def extremes(self, starts: np.ndarray, stops: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        low = np.array(starts, dtype=np.intp)
+        high = np.array(stops, dtype=np.intp)
+        min_index = np.full(low.size, -1, dtype=np.intp)
+        max_index = np.full(low.size, -1, dtype=np.intp)
+        gap_index = np.full(low.size, self._data.size, dtype=np.intp)
+
+        for level in range(len(self._min_index) + 1):
+            if not np.any(low < high):
+                break
+
+            # block at the start of a range that is not aligned to the next level
+            take = (low < high) & (low & 1 == 1)
+            self._take_block(level, low[take], take, min_index, max_index, gap_index)
+            low += take
+
+            # block at the end of a range
+            take = (low < high) & (high & 1 == 1)
+            high -= take
+            self._take_block(level, high[take], take, min_index, max_index, gap_index)
+
+            low >>= 1
+            high >>= 1
+
+        gap_index[gap_index == self._data.size] = -1
+        return min_index, max_index, gap_index
+
+    ########################################################
+    # helper functions
+    ########################################################
+    # merge the extremes of blocks at a level into the extremes of the ranges selected by take.
+    # ties keep the earlier sample as blocks are taken from both ends of a range
+    def _take_block(self, level: int, blocks: np.ndarray, take: np.ndarray, min_index: np.ndarray, max_index: np.ndarray,
+                    gap_index: np.ndarray) -> None:
+        if not blocks.size:
+            return
+
+        data = self._data
+        if level == 0:
+            block_min = block_max = blocks
+            block_gap = np.where(np.isnan(data[blocks]), blocks, data.size)
+        else:
+            block_min = self._min_index[level - 1][blocks]
+            block_max = self._max_index[level - 1][blocks]
+            block_gap = self._gap_index[level - 1][blocks]
+
+        current = min_index[take]
+        block_value, current_value = data[block_min], data[current]
+        better = self._lower(block_value, current_value) | (~self._lower(current_value, block_value) & (block_min < current))
+        min_index[take] = np.where((current < 0) | better, block_min, current)
+
+        current = max_index[take]
+        block_value, current_value = data[block_max], data[current]
+        better = self._higher(block_value, current_value) | (~self._higher(current_value, block_value) & (block_max < current))
+        max_index[take] = np.where((current < 0) | better, block_max, current)
+
+        gap_index[take] = np.minimum(gap_index[take], block_gap)
+
+    # min and max indices of the blocks at level + 1 from their two children at level
+    def _combine(self, level: int, blocks: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        data = self._data
+        left = 2 * blocks
+        if level == 0:
+            right = np.minimum(left + 1, data.size - 1)
+            left_min = left_max = left
+            right_min = right_max = right
+            left_gap = np.where(np.isnan(data[left]), left, data.size)
+            right_gap = np.where(np.isnan(data[right]), right, data.size)
+        else:
+            child_min = self._min_index[level - 1]
+            child_max = self._max_index[level - 1]
+            child_gap = self._gap_index[level - 1]
+            right = np.minimum(left + 1, child_min.size - 1)
+            left_min = child_min[left]
+            left_max = child_max[left]
+            right_min = child_min[right]
+            right_max = child_max[right]
+            left_gap = child_gap[left]
+            right_gap = child_gap[right]
+
+        block_min = np.where(self._lower(data[right_min], data[left_min]), right_min, left_min)
+        block_max = np.where(self._higher(data[right_max], data[left_max]), right_max, left_max)
+        return block_min, block_max, np.minimum(left_gap, right_gap)
+
+    # True where value is strictly smaller than other, NaN being larger than every value as +inf in minmax_decimate
+    @staticmethod
+    def _lower(value: np.ndarray, other: np.ndarray) -> np.ndarray:
+        return (value < other) | (np.isnan(other) & (value < np.inf))
+
+    # True where value is strictly larger than other, NaN being smaller than every value as -inf in minmax_decimate
+    @staticmethod
+    def _higher(value: np.ndarray, other: np.ndarray) -> np.ndarray:
+        return (value > other) | (np.isnan(other) & (value > -np.inf))
+
+
+class ICPointIndex:
+    """
+    Nearest sample search for picking points of a line, using distances in screen pixels.
+    Lines with sorted x are searched in a window of x around the position found by binary search.
+    A sorted ring, as in scrolling graphs, is split at its oldest sample into two sorted segments.
+    Windows wider than MaxWindow samples are reduced to the block extremes of the min/max pyramid.
+    Other lines are indexed by a uniform grid of cells, built on the first search.
+    The index must be recreated when the data changes.
+    """
+    # maximum number of samples compared in a window of a sorted line
+    MaxWindow = 16384
+
+    # average number of samples per cell of the grid
+    CellSamples = 4
+
+    def __init__(self, x_data: np.ndarray, y_data: np.ndarray, x_sorted: bool, pyramid: ICMinMaxPyramid = None, split: int = 0):
+        self._x_data: np.ndarray = x_data
+        self._y_data: np.ndarray = y_data
+        self._x_sorted: bool = x_sorted
+        self._pyramid: ICMinMaxPyramid = pyramid
+
+        # sorted data runs from split to the end and continues from the start up to split
+        self._split: int = split
+
+        # grid of unsorted lines: cells per axis, origin, cell size, sample indices ordered by cell, start of each cell
+        self._grid_size: int = 0
+        self._grid_origin: tuple[float, float] = (0.0, 0.0)
+        self._cell_size: tuple[float, float] = (1.0, 1.0)
+        self._cell_order: np.ndarray = None
+        self._cell_start: np.ndarray = None
+
+    ########################################################
+    # functions
+    ########################################################
+    # index of the sample closest to (x, y), -1 if the line is empty.
+    # x_scale and y_scale are the pixels per unit along each axis.
+    # radius is the initial search distance in pixels, the search widens until the closest sample is found
+    def nearest(self, x: float, y: float, x_scale: float, y_scale: float, radius: float = 10.0) -> int:
+        if self._x_data.size == 0:
+            return -1
+        if self._x_sorted:
+            return self._nearest_sorted(x, y, x_scale, y_scale, radius)
+        return self._nearest_grid(x, y, x_scale, y_scale, radius)
+
+    ########################################################
+    # helper functions
+    ########################################################
+    # distance in pixels of the samples to (x, y)
+    def _screen_distance(self, index, x: float, y: float, x_scale: float, y_scale: float) -> np.ndarray:
+        return np.hypot((self._x_data[index] - x) * x_scale, (self._y_data[index] - y) * y_scale)
+
+    # closest sample of a sorted line. each sorted segment is searched separately
+    def _nearest_sorted(self, x: float, y: float, x_scale: float, y_scale: float, reach: float) -> int:
+        best, best_distance = -1, np.inf
+        for first, last in ((self._split, self._x_data.size), (0, self._split)):
+            if last > first:
+                index, distance = self._nearest_segment(first, last, x, y, x_scale, y_scale, reach)
+                if distance < best_distance:
+                    best, best_distance = index, distance
+        return best
+
+    # closest sample within the sorted segment [first, last) and its distance
+    def _nearest_segment(self, first: int, last: int, x: float, y: float, x_scale: float, y_scale: float,
+                         reach: float) -> tuple[int, float]:
+        x_data = self._x_data[first:last]
+        size = x_data.size
+        position = int(np.searchsorted(x_data, x))
+
+        while True:
+            # samples within reach along x, and at least the two neighbours of the position
+            start = min(int(np.searchsorted(x_data, x - reach / x_scale, side="left")), max(position - 1, 0))
+            stop = max(int(np.searchsorted(x_data, x + reach / x_scale, side="right")), min(position + 1, size))
+
+            if stop - start > ICPointIndex.MaxWindow and self._pyramid is not None:
+                candidates = self._pyramid.window(first + start, first + stop, ICPointIndex.MaxWindow // 2)
+                distance = self._screen_distance(candidates, x, y, x_scale, y_scale)
+                closest = int(np.argmin(distance))
+                best, best_distance = int(candidates[closest]), distance[closest]
+            else:
+                distance = self._screen_distance(slice(first + start, first + stop), x, y, x_scale, y_scale)
+                closest = int(np.argmin(distance))
+                best, best_distance = first + start + closest, distance[closest]
+
+            # every sample closer than the best one lies within reach
+            if not best_distance > reach:
+                return best, best_distance
+            reach = best_distance
+
+    # build the grid of an unsorted line
+    def _build_grid(self) -> None:
+        x_data = self._x_data
+        y_data = self._y_data
+        grid_size = max(int(np.sqrt(x_data.size / ICPointIndex.CellSamples)), 1)
+
+        x_min, x_max = float(np.min(x_data)), float(np.max(x_data))
+        y_min, y_max = float(np.min(y_data)), float(np.max(y_data))
+        cell_width = (x_max - x_min) / grid_size if x_max > x_min else 1.0
+        cell_height = (y_max - y_min) / grid_size if y_max > y_min else 1.0
+
+        # samples ordered by cell, row by row
+        cell_x = np.clip(((x_data - x_min) / cell_width).astype(np.intp), 0, grid_size - 1)
+        cell_y = np.clip(((y_data - y_min) / cell_height).astype(np.intp), 0, grid_size - 1)
+        cell = cell_y * grid_size + cell_x
+        self._cell_order = np.argsort(cell, kind="stable")
+        self._cell_start = np.searchsorted(cell[self._cell_order], np.arange(grid_size * grid_size + 1))
+
+        self._grid_size = grid_size
+        self._grid_origin = (x_min, y_min)
+        self._cell_size = (cell_width, cell_height)
+
+    # closest sample of an unsorted line
+    def _nearest_grid(self, x: float, y: float, x_scale: float, y_scale: float, reach: float) -> int:
+        if self._cell_order is None:
+            self._build_grid()
+
+        grid_size = self._grid_size
+        best, best_distance = -1, np.inf
+        while True:
+            # cells within reach
+            first_x, last_x = self._cell_range(x - reach / x_scale, x + reach / x_scale, 0)
+            first_y, last_y = self._cell_range(y - reach / y_scale, y + reach / y_scale, 1)
+
+            # samples of a row of cells are contiguous
+            rows = [self._cell_order[self._cell_start[row * grid_size + first_x]:self._cell_start[row * grid_size + last_x + 1]]
+                    for row in range(first_y, last_y + 1)]
+            candidates = np.concatenate(rows)
+            if candidates.size:
+                distance = self._screen_distance(candidates, x, y, x_scale, y_scale)
+                closest = int(np.argmin(distance))
+                best, best_distance = int(candidates[closest]), distance[closest]
+
+            # done when every sample closer than the best one has been checked
+            covers_grid = first_x == 0 and first_y == 0 and last_x == grid_size - 1 and last_y == grid_size - 1
+            if not best_distance > reach or covers_grid:
+                return best
+            reach = best_distance if best >= 0 else 2 * reach
+
+    # first and last cells along an axis overlapping [low, high]
+    def _cell_range(self, low: float, high: float, axis: int) -> tuple[int, int]:
+        origin = self._grid_origin[axis]
+        size = self._cell_size[axis]
+        first = int(np.clip(np.floor((low - origin) / size), 0, self._grid_size - 1))
+        last = int(np.clip(np.floor((high - origin) / size), 0, self._grid_size - 1))
+        return first, last
+
+
+class ICLineStore:
+    """
+    Columnar storage of lines sharing one x vector.
+    The y data of the lines is held in one matrix with a row per line, so a sample of every line
+    is written as a single column. The rows handed out are views of the matrix and remain valid
+    until lines are added or removed. The changed index ranges are collected until taken, for
+    updating the indices built over the rows.
+    The smallest and largest value of every column are kept with a min/max pyramid over each, so
+    the range of all the lines is updated at the written columns only.
+    """
+    def __init__(self):
+        self._x_data: np.ndarray = np.empty(0)
+        self._y_data: np.ndarray = np.empty((0, 0))
+
+        # row of each line in the matrix
+        self._rows: dict[str, int] = {}
+
+        # rows and positions of the stored lines for the line name tuples used in writes
+        self._column_maps: dict[tuple, tuple[np.ndarray, np.ndarray]] = {}
+
+        # changed index ranges, merged into at most two ranges as the ring wraps around
+        self._changes: list[tuple[int, int]] = []
+
+        # smallest and largest value of every column, ignoring NaN, and their pyramids
+        self._column_min: np.ndarray = np.empty(0)
+        self._column_max: np.ndarray = np.empty(0)
+        self._min_pyramid: ICMinMaxPyramid = ICMinMaxPyramid(self._column_min)
+        self._max_pyramid: ICMinMaxPyramid = ICMinMaxPyramid(self._column_max)
+
+    def __contains__(self, line_name: str) -> bool:
+        return line_name in self._rows
+
+    ########################################################
+    # properties
+    ########################################################
+    # x data shared by all the lines
+    @property
+    def x_data(self) -> np.ndarray:
+        return self._x_data
+
+    # y data of all the lines, one row per line
+    @property
+    def y_data(self) -> np.ndarray:
+        return self._y_data
+
+    # number of samples per line
+    @property
+    def size(self) -> int:
+        return self._x_data.size
+
+    # number of lines
+    @property
+    def count(self) -> int:
+        return len(self._rows)
+
+    # names of the lines in the order of their rows
+    @property
+    def names(self) -> list[str]:
+        return list(self._rows)
+
+    ########################################################
+    # functions
+    ########################################################
+    # y data of a line as a view of its row
+    def row(self, line_name: str) -> np.ndarray:
+        return self._y_data[self._rows[line_name]]
+
+    # add a line or replace its data. the first line sets the x data, which the other lines must match.
+    # returns False if the x data does not match, in which case a previous line of the same name is removed
+    def add(self, line_name: str, x_data: np.ndarray, y_data: np.ndarray) -> bool:
+        if not self._rows or self._rows.keys() == {line_name}:
+            self._x_data = np.array(x_data, dtype=np.float64)
+            self._y_data = np.empty((0, self._x_data.size))
+            self._rows.clear()
+        elif self._x_data.size != len(x_data) or not np.array_equal(self._x_data, x_data):
+            if line_name in self._rows:
+                self.remove(line_name)
+            return False
+
+        if line_name in self._rows:
+            self._y_data[self._rows[line_name]] = y_data
+        else:
+            self._rows[line_name] = self._y_data.shape[0]
+            self._y_data = np.vstack((self._y_data, np.asarray(y_data, dtype=np.float64)[np.newaxis, :]))
+            self._column_maps.clear()
+        self._rebuild_envelope()
+        return True
+
+    # remove a line. the rows of the following lines move up
+    def remove(self, line_name: str) -> None:
+        row = self._rows.pop(line_name, None)
+        if row is None:
+            return
+
+        self._y_data = np.delete(self._y_data, row, axis=0)
+        self._rows = {name: index - (index > row) for name, index in self._rows.items()}
+        self._column_maps.clear()
+        self._rebuild_envelope()
+
+    # rows of the stored lines named in line_names and their positions in line_names
+    def column_map(self, line_names: tuple[str]) -> tuple[np.ndarray, np.ndarray]:
+        column_map = self._column_maps.get(line_names)
+        if column_map is None:
+            positions = [position for position, line_name in enumerate(line_names) if line_name in self._rows]
+            rows = np.array([self._rows[line_names[position]] for position in positions], dtype=np.intp)
+            column_map = (rows, np.array(positions, dtype=np.intp))
+            self._column_maps[line_names] = column_map
+        return column_map
+
+    # write one sample of every line at index. lines that are not named are set to fill
+    def write_column(self, index: int, line_names: tuple[str], values: tuple[float], fill: float) -> None:
+        rows, positions = self.column_map(line_names)
+        column = np.full(len(self._rows), fill, dtype=np.float64)
+        column[rows] = np.asarray(values, dtype=np.float64)[positions]
+        self._y_data[:, index] = column
+        self.mark_changed(index, index + 1)
+
+    # write a block of samples of every line from start, wrapping around the end.
+    # block has one row per name in line_names. lines that are not named are set to fill
+    def write_block(self, start: int, line_names: tuple[str], block: np.ndarray, fill: float) -> None:
+        rows, positions = self.column_map(line_names)
+        count = block.shape[1]
+        values = np.full((len(self._rows), count), fill, dtype=np.float64)
+        values[rows] = block[positions]
+
+        first_count = min(count, self.size - start)
+        self._y_data[:, start:start + first_count] = values[:, :first_count]
+        self._y_data[:, :count - first_count] = values[:, first_count:]
+        self.mark_changed(start, start + first_count)
+        self.mark_changed(0, count - first_count)
+
+    # set one sample of every line to fill
+    def fill_column(self, index: int, fill: float) -> None:
+        self._y_data[:, index] = fill
+        self.mark_changed(index, index + 1)
+
+    # smallest and largest value over all the lines, ignoring NaN, read from the tops of the envelope pyramids
+    def y_range(self) -> tuple[float, float]:
+        if not self._y_data.size:
+            return float("nan"), float("nan")
+        return self._min_pyramid.min_value, self._max_pyramid.max_value
+
+    # record a changed index range [start, stop), e.g. after rows have been written in place
+    def mark_changed(self, start: int, stop: int) -> None:
+        if stop <= start:
+            return
+
+        self._update_envelope(start, stop)
+
+        for position, (first, last) in enumerate(self._changes):
+            if start <= last and stop >= first:
+                self._changes[position] = (min(first, start), max(last, stop))
+                return
+
+        if len(self._changes) < 2:
+            self._changes.append((start, stop))
+        else:
+            # merge with the closer range
+            position = 0 if abs(start - self._changes[0][1]) < abs(start - self._changes[1][1]) else 1
+            first, last = self._changes[position]
+            self._changes[position] = (min(first, start), max(last, stop))
+
+    # changed index ranges since the last call
+    def take_changes(self) -> list[tuple[int, int]]:
+        changes = self._changes
+        self._changes = []
+        return changes
+
+    ########################################################
+    # helper functions
+    ########################################################
+    # recalculate the column envelope, e.g. after lines have been added or removed
+    def _rebuild_envelope(self) -> None:
+        if self._rows:
+            self._column_min = np.fmin.reduce(self._y_data, axis=0)
+            self._column_max = np.fmax.reduce(self._y_data, axis=0)
+        else:
+            self._column_min = np.full(self.size, np.nan)
+            self._column_max = np.full(self.size, np.nan)
+        self._min_pyramid.rebuild(self._column_min)
+        self._max_pyramid.rebuild(self._column_max)
+
+    # update the column envelope after the columns in [start, stop) have been written
+    def _update_envelope(self, start: int, stop: int) -> None:
+        columns = self._y_data[:, start:stop]
+        self._column_min[start:stop] = np.fmin.reduce(columns, axis=0)
+        self._column_max[start:stop] = np.fmax.reduce(columns, axis=0)
+        if stop - start == 1:
+            self._min_pyramid.update(start)
+            self._max_pyramid.update(start)
+        else:
+            self._min_pyramid.update_range(start, stop)
+            self._max_pyramid.update_range(start, stop)
+
+
+class ICSharedRingBuffer:
+    """
+    Ring buffer of float64 samples held in shared memory.
+    The producer process writes samples with push and the plotting process reads the same memory through data.
+    The header stores the size of the ring and the total number of samples written.
+    The write count is advanced only after the samples are in place.
+    """
+    # header fields: ring size, write count
+    HeaderSize = 2 * np.dtype(np.int64).itemsize
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        self._memory: shared_memory.SharedMemory = memory
+        self._owner: bool = owner
+
+        # views over the shared memory block
+        self._header: np.ndarray = np.ndarray((2,), dtype=np.int64, buffer=memory.buf)
+        self._data: np.ndarray = np.ndarray((int(self._header[0]),), dtype=np.float64, buffer=memory.buf,
+                                            offset=ICSharedRingBuffer.HeaderSize)
+
+    # create a new shared ring buffer of the given size
+    @classmethod
+    def create(cls, size: int, name: str = None, fill: float = 0) -> 'ICSharedRingBuffer':
+        memory = shared_memory.SharedMemory(name=name, create=True,
+                                            size=ICSharedRingBuffer.HeaderSize + size * np.dtype(np.float64).itemsize)
+        header = np.ndarray((2,), dtype=np.int64, buffer=memory.buf)
+        header[0] = size
+        header[1] = 0
+        del header
+
+        ring = cls(memory, True)
+        ring._data.fill(fill)
+        return ring
+
+    # attach to a shared ring buffer created by another process
+    @classmethod
+    def attach(cls, name: str) -> 'ICSharedRingBuffer':
+        memory = shared_memory.SharedMemory(name=name)
+
+        # the creating process owns the memory. an independent process has its own resource tracker,
+        # which would remove the memory when the process exits. child processes share the tracker of the creator
+        if multiprocessing.parent_process() is None:
+            resource_tracker.unregister(memory._name, "shared_memory")
+        return cls(memory, False)
+
+    ########################################################
+    # properties
+    ########################################################
+    # name used to attach to the shared memory
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    # number of samples in the ring
+    @property
+    def size(self) -> int:
+        return self._data.size
+
+    # view of the samples in the shared memory
+    @property
+    def data(self) -> np.ndarray:
+        return self._data
+
+    # total number of samples written since the buffer was created
+    @property
+    def write_count(self) -> int:
+        return int(self._header[1])
+
+    # position in the ring of the next sample
+    @property
+    def write_index(self) -> int:
+        return self.write_count % self._data.size
+
+    ########################################################
+    # functions
+    ########################################################
+    # write samples at the current position, wrapping around the end of the ring
+    def push(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64).ravel()
+        size = self._data.size
+        write_count = int(self._header[1])
+
+        # only the latest samples that fit in the ring are written
+        if values.size > size:
+            write_count += values.size - size
+            values = values[-size:]
+
+        start = write_count % size
+        first_count = min(values.size, size - start)
+        self._data[start:start + first_count] = values[:first_count]
+        self._data[:values.size - first_count] = values[first_count:]
+
+        # publish the samples
+        self._header[1] = write_count + values.size
+
+    # release the shared memory. views returned by data must be released before closing
+    def close(self) -> None:
+        if self._owner:
+            self._memory.unlink()
+
+        self._header = None
+        self._data = None
+        self._memory.close()
@@ -0,0 +1,434 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 16 2026
+
+@author: Prosenjit
+
+Vectorised helpers used by ICGraph to convert plot data into screen geometry.
+Whole data arrays are transformed with NumPy and handed to Qt as contiguous
+polygon buffers instead of being added to a path one point at a time.
+Markers are pre-rendered once per style and color into small sprites, which are
+drawn for all the points of a line in one call from a buffer of pixmap fragments.
+The raster helpers draw lines and points directly into a NumPy ARGB32 image buffer
+for traces too dense for QPainter paths.
+"""
+
+from PyQt6 import QtCore, QtGui, sip
+from PyQt6.QtCore import Qt
+import numpy as np
+
+# half the size of a marker and of its sprite, which leaves room for the pen
+MarkerRadius = 3
+SpriteRadius = 5
+
+# sprite images are rasterized into one layer from this many points per visible pixel of the sprite.
+# fewer points are drawn one by one, which is faster for sparse markers and blends overlapping copies
+SpriteBatchFactor = 8
+
+# sprite images and pixmaps keyed by marker style, pen color, fill color and device pixel ratio
+_marker_images: dict[tuple, QtGui.QImage] = {}
+_marker_sprites: dict[tuple, QtGui.QPixmap] = {}
+
+
+# transform world coordinates to screen coordinates in a single pass
+def world_to_screen(x_array: np.ndarray, y_array: np.ndarray, x_min: float, x_scale: float, y_min: float, y_scale: float,
+                    height: float) -> tuple[np.ndarray, np.ndarray]:
+    px = (x_array - x_min) * x_scale
+    py = height - (y_array - y_min) * y_scale
+    return px, py
+
+
+# create a polygon and fill its point buffer directly from the coordinate arrays
+# QPointF is a pair of doubles, so the polygon storage can be viewed as a (n, 2) float64 array
+def polygon_from_arrays(px: np.ndarray, py: np.ndarray) -> QtGui.QPolygonF:
+    size = px.size
+    polygon = QtGui.QPolygonF()
+    if size == 0:
+        return polygon
+
+    polygon.resize(size)
+    ptr = polygon.data()
+    ptr.setsize(size * 2 * np.dtype(np.float64).itemsize)
+    buffer = np.frombuffer(ptr, dtype=np.float64).reshape(size, 2)
+    buffer[:, 0] = px
+    buffer[:, 1] = py
+    return polygon
+
+
+# fill an array of pixmap fragments, one per point, centered on the screen coordinates.
+# a fragment holds ten doubles (x, y, source left, top, width, height, scale x, y, rotation, opacity),
+# so the array storage can be viewed as a (n, 10) float64 array
+def pixmap_fragments(px: np.ndarray, py: np.ndarray, pixmap: QtGui.QPixmap) -> sip.array:
+    size = px.size
+    fragments = sip.array(QtGui.QPainter.PixmapFragment, size)
+    if size == 0:
+        return fragments
+
+    # the source is the complete pixmap, scaled back to device independent pixels
+    ratio = pixmap.devicePixelRatio()
+    buffer = np.frombuffer(memoryview(fragments), dtype=np.float64).reshape(size, 10)
+    buffer[:, 0] = px
+    buffer[:, 1] = py
+    buffer[:, 2:4] = 0
+    buffer[:, 4] = pixmap.width()
+    buffer[:, 5] = pixmap.height()
+    buffer[:, 6:8] = 1.0 / ratio
+    buffer[:, 8] = 0
+    buffer[:, 9] = 1
+    return fragments
+
+
+# draw copies of a sprite image centered on the points.
+# images can be drawn outside the GUI thread, where drawPixmapFragments is not available, so many copies are
+# rasterized into a single layer over the bounding box of the points and drawn in one call. where copies overlap
+# the layer keeps the most opaque pixel instead of blending the copies: premultiplied ARGB pixels compare by alpha first
+def draw_sprite_images(painter: QtGui.QPainter, px: np.ndarray, py: np.ndarray, image: QtGui.QImage) -> None:
+    if px.size == 0:
+        return
+
+    # visible pixels of the sprite
+    ratio = image.devicePixelRatio()
+    width, height = image.width(), image.height()
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    sprite = np.frombuffer(bits, dtype=np.uint32).reshape(height, image.bytesPerLine() // 4)[:, :width]
+    rows, columns = np.nonzero(sprite)
+
+    if px.size < SpriteBatchFactor * rows.size:
+        for x, y in zip((px - width / (2 * ratio)).tolist(), (py - height / (2 * ratio)).tolist()):
+            painter.drawImage(QtCore.QPointF(x, y), image)
+        return
+
+    # top left device pixel of every copy, rounded like the positions of drawImage
+    left = np.floor(px * ratio - width / 2 + 0.5).astype(np.intp)
+    top = np.floor(py * ratio - height / 2 + 0.5).astype(np.intp)
+    x0, y0 = int(left.min()), int(top.min())
+    layer_width = int(left.max()) - x0 + width
+    layer_height = int(top.max()) - y0 + height
+    corners = (top - y0) * layer_width + left - x0
+
+    # one pass per sprite pixel, over the layer shifted by the offset of the pixel
+    buffer = np.zeros((layer_height, layer_width), dtype=np.uint32)
+    layer = buffer.reshape(-1)
+    for offset, pixel in zip((rows * layer_width + columns).tolist(), sprite[rows, columns]):
+        np.maximum.at(layer[offset:], corners, pixel)
+
+    layer_image = image_from_buffer(buffer)
+    layer_image.setDevicePixelRatio(ratio)
+    painter.drawImage(QtCore.QPointF(x0 / ratio, y0 / ratio), layer_image)
+
+
+# sprite of a marker as a pixmap, for drawPixmapFragments. pixmaps belong to the GUI thread
+def marker_sprite(style: str, pen_color: QtGui.QColor, fill_color: QtGui.QColor = None, ratio: float = 1.0) -> QtGui.QPixmap:
+    key = (style, pen_color.rgba(), fill_color.rgba() if fill_color is not None else None, ratio)
+    sprite = _marker_sprites.get(key)
+    if sprite is None:
+        sprite = QtGui.QPixmap.fromImage(marker_image(style, pen_color, fill_color, ratio))
+        _marker_sprites[key] = sprite
+    return sprite
+
+
+# sprite of a marker drawn with a pen of the given color and optionally filled.
+# styles are the marker styles of ICGraph: o, t, r, x, + and *
+def marker_image(style: str, pen_color: QtGui.QColor, fill_color: QtGui.QColor = None, ratio: float = 1.0) -> QtGui.QImage:
+    key = (style, pen_color.rgba(), fill_color.rgba() if fill_color is not None else None, ratio)
+    sprite = _marker_images.get(key)
+    if sprite is not None:
+        return sprite
+
+    size = int(np.ceil(2 * SpriteRadius * ratio))
+    sprite = QtGui.QImage(size, size, QtGui.QImage.Format_ARGB32_Premultiplied)
+    sprite.setDevicePixelRatio(ratio)
+    sprite.fill(Qt.transparent)
+
+    pen = QtGui.QPen(pen_color)
+    pen.setWidth(2)
+    pen.setCapStyle(Qt.RoundCap)
+    pen.setJoinStyle(Qt.RoundJoin)
+
+    painter = QtGui.QPainter(sprite)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    painter.setPen(pen)
+    if fill_color is not None:
+        painter.setBrush(QtGui.QBrush(fill_color))
+
+    # the marker is centered in the sprite
+    c = SpriteRadius
+    r = MarkerRadius
+    path = QtGui.QPainterPath()
+    if style == "o":
+        path.addEllipse(QtCore.QPointF(c, c), r, r)
+    elif style == "r":
+        path.addRect(c - r, c - r, 2 * r, 2 * r)
+    elif style == "t":
+        path.moveTo(c, c - r)
+        path.lineTo(c - r, c + r)
+        path.lineTo(c + r, c + r)
+        path.lineTo(c, c - r)
+    elif style == "+":
+        path.moveTo(c, c - r)
+        path.lineTo(c, c + r)
+        path.moveTo(c - r, c)
+        path.lineTo(c + r, c)
+    elif style == "*":
+        for dx, dy in ((0, -r), (-r, 0), (r, 0), (r, r), (-r, r)):
+            path.moveTo(c, c)
+            path.lineTo(c + dx, c + dy)
+    else:
+        path.moveTo(c - r, c - r)
+        path.lineTo(c + r, c + r)
+        path.moveTo(c - r, c + r)
+        path.lineTo(c + r, c - r)
+    painter.drawPath(path)
+    painter.end()
+
+    _marker_images[key] = sprite
+    return sprite
+
+
+# find the start and stop (exclusive) indices of consecutive true values in a mask
+def contiguous_runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    padded = np.zeros(mask.size + 2, dtype=np.int8)
+    padded[1:-1] = mask
+    edges = np.diff(padded)
+    starts = np.flatnonzero(edges == 1)
+    stops = np.flatnonzero(edges == -1)
+    return starts, stops
+
+
+# build the closed polygons used to draw a line plot.
+# each visible run of points is closed down to the base level so that it can be filled.
+# py is clipped to the top and bottom of the window and points outside the window width break the line.
+def line_polygons(px: np.ndarray, py: np.ndarray, width: float, height: float, base_level_y: float) -> list[QtGui.QPolygonF]:
+    polygons = []
+    if px.size == 0:
+        return polygons
+
+    # limit py to top and bottom
+    py = np.clip(py, 0, height)
+
+    # split the line wherever it leaves the window
+    visible = (px >= 0) & (px <= width)
+    starts, stops = contiguous_runs(visible)
+
+    for start, stop in zip(starts, stops):
+        run_length = stop - start
+
+        # the run is framed by two points on the base level
+        run_x = np.empty(run_length + 2)
+        run_y = np.empty(run_length + 2)
+        run_x[0] = px[start]
+        run_x[1:-1] = px[start:stop]
+        run_x[-1] = px[stop - 1]
+        run_y[0] = base_level_y
+        run_y[1:-1] = py[start:stop]
+        run_y[-1] = base_level_y
+
+        polygons.append(polygon_from_arrays(run_x, run_y))
+
+    return polygons
+
+
+# reduce a line to at most two points (minimum and maximum) per pixel column.
+# returns the sorted indices of the retained samples.
+# samples on either side of the display range are gathered in one extra column each
+# so that the line still reaches the border of the window.
+# NaN marks a gap. the extremes are taken over the other samples and the first NaN of a column is kept
+def minmax_decimate(x_array: np.ndarray, y_array: np.ndarray, x_min: float, x_max: float, columns: int) -> np.ndarray:
+    size = x_array.size
+    if size <= 2 * columns or x_max <= x_min or columns < 1:
+        return np.arange(size)
+
+    # pixel column of each sample
+    column = np.floor((x_array - x_min) * (columns / (x_max - x_min)))
+    column = np.clip(column, -1, columns).astype(np.intp)
+
+    # group the samples by column. time series are already grouped
+    if np.all(column[1:] >= column[:-1]):
+        order = None
+        grouped_column = column
+        grouped_y = y_array
+    else:
+        order = np.argsort(column, kind="stable")
+        grouped_column = column[order]
+        grouped_y = y_array[order]
+
+    starts = np.flatnonzero(np.concatenate(([True], grouped_column[1:] != grouped_column[:-1])))
+    counts = np.diff(np.append(starts, size))
+    group = np.repeat(np.arange(starts.size), counts)
+
+    # first position of the minimum and maximum in every column.
+    # NaN never compares equal, so it is replaced by a value every column reaches
+    position = np.arange(size)
+    gap = np.isnan(grouped_y)
+    low_y = np.where(gap, np.inf, grouped_y)
+    high_y = np.where(gap, -np.inf, grouped_y)
+    col_min = np.minimum.reduceat(low_y, starts)
+    col_max = np.maximum.reduceat(high_y, starts)
+    min_pos = np.minimum.reduceat(np.where(low_y == col_min[group], position, size), starts)
+    max_pos = np.minimum.reduceat(np.where(high_y == col_max[group], position, size), starts)
+
+    # keep both extremes and the first gap in every column, once if they are the same sample
+    selected = np.concatenate((min_pos, max_pos))
+    if gap.any():
+        gap_pos = np.minimum.reduceat(np.where(gap, position, size), starts)
+        selected = np.concatenate((selected, gap_pos[gap_pos < size]))
+    if order is not None:
+        selected = order[selected]
+    return np.unique(selected)
+
+
+# largest triangle three buckets down sampling to n_out points.
+# returns the sorted indices of the retained samples.
+def lttb_decimate(x_array: np.ndarray, y_array: np.ndarray, n_out: int) -> np.ndarray:
+    size = x_array.size
+    if n_out >= size or n_out < 3:
+        return np.arange(size)
+
+    # bucket boundaries. first and last points are always retained
+    edges = np.linspace(1, size - 1, n_out - 1).astype(np.intp)
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = size - 1
+
+    anchor = 0
+    for bucket in range(n_out - 2):
+        start = edges[bucket]
+        stop = edges[bucket + 1]
+        next_stop = edges[bucket + 2] if bucket + 2 < edges.size else size
+
+        # average of the next bucket is the third point of the triangle
+        avg_x = x_array[stop:next_stop].mean()
+        avg_y = y_array[stop:next_stop].mean()
+
+        # pick the point forming the largest triangle with the previous selection
+        area = np.abs((x_array[anchor] - avg_x) * (y_array[start:stop] - y_array[anchor]) -
+                      (x_array[anchor] - x_array[start:stop]) * (avg_y - y_array[anchor]))
+        anchor = start + int(np.argmax(area)) if stop > start else start
+        selected[bucket + 1] = anchor
+
+    return np.unique(selected)
+
+
+# wrap an (height, width) uint32 buffer of premultiplied ARGB pixels as an image without copying.
+# the buffer must be kept alive while the image is used
+def image_from_buffer(buffer: np.ndarray) -> QtGui.QImage:
+    height, width = buffer.shape
+    return QtGui.QImage(buffer.data, width, height, buffer.strides[0], QtGui.QImage.Format_ARGB32_Premultiplied)
+
+
+# premultiplied ARGB pixel of a color
+def raster_color(color: QtGui.QColor) -> np.uint32:
+    return np.uint32(QtGui.qPremultiply(color.rgba()))
+
+
+# vertical pixel spans [low, high] covered by a polyline in each of the pixel columns.
+# segments between consecutive points are split at the column borders, so dense traces reduce to
+# one span per column and sparse traces are interpolated across the columns they cross.
+# columns that the line does not cross have low > high
+def line_spans(px: np.ndarray, py: np.ndarray, width: int) -> tuple[np.ndarray, np.ndarray]:
+    low = np.full(width, np.inf)
+    high = np.full(width, -np.inf)
+    if px.size < 2:
+        return point_spans(px, py, width)
+
+    # order the end points of each segment from left to right
+    swap = px[1:] < px[:-1]
+    x0 = np.where(swap, px[1:], px[:-1])
+    x1 = np.where(swap, px[:-1], px[1:])
+    y0 = np.where(swap, py[1:], py[:-1])
+    y1 = np.where(swap, py[:-1], py[1:])
+
+    # segments within the window
+    keep = (x1 >= 0) & (x0 < width) & np.isfinite(y0) & np.isfinite(y1)
+    x0, x1, y0, y1 = x0[keep], x1[keep], y0[keep], y1[keep]
+    if x0.size == 0:
+        return low, high
+
+    # columns crossed by every segment
+    first = np.clip(np.floor(x0), 0, width - 1).astype(np.intp)
+    last = np.clip(np.floor(x1), 0, width - 1).astype(np.intp)
+    counts = last - first + 1
+    segment = np.repeat(np.arange(first.size), counts)
+    column = first[segment] + np.arange(segment.size) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    # y at the ends of the part of each segment within its column. vertical segments keep both end points
+    dx = x1 - x0
+    slope = np.divide(y1 - y0, dx, out=np.zeros_like(dx), where=dx > 0)[segment]
+    xa = np.maximum(x0[segment], column)
+    xb = np.minimum(x1[segment], column + 1)
+    ya = np.where(dx[segment] > 0, y0[segment] + (xa - x0[segment]) * slope, y0[segment])
+    yb = np.where(dx[segment] > 0, y0[segment] + (xb - x0[segment]) * slope, y1[segment])
+
+    np.minimum.at(low, column, np.minimum(ya, yb))
+    np.maximum.at(high, column, np.maximum(ya, yb))
+    return low, high
+
+
+# vertical pixel spans [low, high] covering the points in each of the pixel columns
+def point_spans(px: np.ndarray, py: np.ndarray, width: int) -> tuple[np.ndarray, np.ndarray]:
+    low = np.full(width, np.inf)
+    high = np.full(width, -np.inf)
+    keep = (px >= 0) & (px < width) & np.isfinite(py)
+    column = px[keep].astype(np.intp)
+    np.minimum.at(low, column, py[keep])
+    np.maximum.at(high, column, py[keep])
+    return low, high
+
+
+# fill the spans of the pixel columns with a color.
+# thickness widens the spans by that many pixels up and down and into the next column
+def draw_spans(buffer: np.ndarray, low: np.ndarray, high: np.ndarray, color: np.uint32, thickness: int = 0) -> None:
+    height = buffer.shape[0]
+    if thickness:
+        low = low - thickness
+        high = high + thickness
+        low[1:] = np.minimum(low[1:], low[:-1])
+        high[1:] = np.maximum(high[1:], high[:-1])
+
+    # rows of the spans, clipped to the window
+    top = np.clip(np.rint(low), 0, height).astype(np.intp)
+    bottom = np.clip(np.rint(high), -1, height - 1).astype(np.intp)
+    columns = np.flatnonzero(bottom >= top)
+    if columns.size == 0:
+        return
+
+    rows = np.arange(height)[:, np.newaxis]
+    mask = (rows >= top[columns]) & (rows <= bottom[columns])
+    view = buffer[:, columns]
+    view[mask] = color
+    buffer[:, columns] = view
+
+
+# draw square dots of the given radius centered on the points
+def draw_points(buffer: np.ndarray, px: np.ndarray, py: np.ndarray, color: np.uint32, radius: int = 2) -> None:
+    height, width = buffer.shape
+    keep = (px > -radius - 1) & (px < width + radius) & (py > -radius - 1) & (py < height + radius)
+    ix = np.rint(px[keep]).astype(np.intp)
+    iy = np.rint(py[keep]).astype(np.intp)
+
+    # every pixel of every dot
+    offsets = np.arange(-radius, radius + 1)
+    dot_x, dot_y = np.broadcast_arrays(ix[:, np.newaxis, np.newaxis] + offsets[np.newaxis, np.newaxis, :],
+                                       iy[:, np.newaxis, np.newaxis] + offsets[np.newaxis, :, np.newaxis])
+    dot_x = dot_x.ravel()
+    dot_y = dot_y.ravel()
+    inside = (dot_x >= 0) & (dot_x < width) & (dot_y >= 0) & (dot_y < height)
+    buffer[dot_y[inside], dot_x[inside]] = color
+
+
+# color every pixel hit by the points with an opacity that grows with the logarithm of the number of hits
+def draw_density(buffer: np.ndarray, px: np.ndarray, py: np.ndarray, color: QtGui.QColor) -> None:
+    height, width = buffer.shape
+    keep = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+    pixel = py[keep].astype(np.intp) * width + px[keep].astype(np.intp)
+    hits = np.bincount(pixel, minlength=width * height)
+    hit = np.flatnonzero(hits)
+    if hit.size == 0:
+        return
+
+    # premultiplied channels scaled by the opacity of each pixel
+    alpha = color.alphaF() * np.log1p(hits[hit]) / np.log1p(hits[hit].max())
+    channels = np.array([1.0, color.redF(), color.greenF(), color.blueF()])
+    argb = np.rint(255 * alpha[:, np.newaxis] * channels[np.newaxis, :]).astype(np.uint32)
+    buffer.reshape(-1)[hit] = (argb[:, 0] << 24) | (argb[:, 1] << 16) | (argb[:, 2] << 8) | argb[:, 3]
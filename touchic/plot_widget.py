@@ -9,10 +9,104 @@ A class to plot 2D data
 from PyQt6 import QtCore, QtGui, QtWidgets
 from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
 from typing import Union
+from enum import Enum
 import numpy as np
 from .display_config import ICDisplayConfig
 from .base_widget import ICBaseWidget, ICWidgetState, ICWidgetPosition
 from .linear_axis import ICLinearAxisContainer, ICLinearContainerType, ICLinearAxis
+from .plot_render import world_to_screen, line_polygons, minmax_decimate, lttb_decimate, marker_sprite, pixmap_fragments
+from .plot_render import marker_image, draw_sprite_images
+from .plot_render import image_from_buffer, raster_color, line_spans, draw_spans, draw_points, draw_density
+from .plot_data import ICMinMaxPyramid, ICPointIndex, ICLineStore, ICSharedRingBuffer
+from .render_worker import ICRenderWorker, ICRenderJob
+
+
+class ICGraphDecimation(Enum):
+    """
+    Level of detail reduction applied before drawing lines with more samples than pixels
+        Off     : every sample is drawn
+        MinMax  : lines are reduced to the min/max envelope of each pixel column
+        LTTB    : as MinMax, markers are additionally down sampled with largest triangle three buckets
+    """
+    Off = 0
+    MinMax = 1
+    LTTB = 2
+
+
+class ICGraphPicking(Enum):
+    """
+    Selection of the points closest to the mouse
+        Click   : points are selected when the left button is released
+        Drag    : the selection follows the mouse while the left button is held
+        Hover   : the selection follows the mouse without pressing a button
+    """
+    Click = 0
+    Drag = 1
+    Hover = 2
+
+
+class ICGraphBackend(Enum):
+    """
+    Rendering of the lines and markers
+        Painter : lines are drawn as QPainter paths and markers as sprites
+        Raster  : lines and markers are rasterized with NumPy into an image buffer, for very dense traces.
+                  lines are drawn solid and markers as square dots
+    """
+    Painter = 0
+    Raster = 1
+
+
+class ICGraphFrameLine:
+    """
+    Samples and appearance of one line in a frame of ICGraph
+    """
+    def __init__(self, x_data: np.ndarray, y_data: np.ndarray, skip_index: int, is_line: bool, style: Union[str, Qt.PenStyle],
+                 line_color: QtGui.QColor, fill_color: Union[QtGui.QColor, None], sprite: Union[QtGui.QPixmap, QtGui.QImage, None],
+                 selected: Union[tuple[float, float], None]):
+        # samples to draw and the position of the selected sample among them, -1 if not included
+        self.x_data: np.ndarray = x_data
+        self.y_data: np.ndarray = y_data
+        self.skip_index: int = skip_index
+
+        # line or marker style, colors and the sprite of the markers.
+        # the sprite is a pixmap when drawn in the GUI thread and an image in a snapshot
+        self.is_line: bool = is_line
+        self.style: Union[str, Qt.PenStyle] = style
+        self.line_color: QtGui.QColor = line_color
+        self.fill_color: Union[QtGui.QColor, None] = fill_color
+        self.sprite: Union[QtGui.QPixmap, QtGui.QImage, None] = sprite
+
+        # x and y of the selected sample
+        self.selected: Union[tuple[float, float], None] = selected
+
+
+class ICGraphFrame:
+    """
+    Everything drawn by ICGraph for one frame, so that the frame can be drawn away from the widget.
+    A snapshot frame holds copies of the data and is safe to draw in another thread.
+    """
+    def __init__(self, width: int, height: int):
+        self.width: int = width
+        self.height: int = height
+
+        # display ranges
+        self.x_min: float = 0.0
+        self.x_max: float = 1.0
+        self.y_min: float = 0.0
+        self.y_max: float = 1.0
+        self.base_level: float = 0.0
+
+        # rendering options
+        self.raster: bool = False
+        self.density: bool = False
+        self.raster_buffer: Union[np.ndarray, None] = None
+        self.selected_color: QtGui.QColor = QtGui.QColor()
+        self.font: QtGui.QFont = QtGui.QFont()
+
+        # lines, and the marker lines as (name, position, color)
+        self.lines: list[ICGraphFrameLine] = []
+        self.y_markers: list[tuple[str, float, QtGui.QColor]] = []
+        self.x_markers: list[tuple[str, float, QtGui.QColor]] = []
 
 
 class ICGraph(ICBaseWidget):
@@ -22,6 +116,9 @@ class ICGraph(ICBaseWidget):
     # clicked event
     clicked = pyqtSignal(str, str, int, float, float)
 
+    # point under the mouse in hover picking
+    hovered = pyqtSignal(str, str, int, float, float)
+
     # current value changed
     current_changed = pyqtSignal(float)
 
@@ -60,12 +157,56 @@ class ICGraph(ICBaseWidget):
         # selected points
         self._selected_index: dict[str, int] = {}
 
+        # point selection mode, search radius in pixels and the nearest point indices, built on first use
+        self._picking: ICGraphPicking = ICGraphPicking.Click
+        self._pick_radius: float = 10.0
+        self._point_index: dict[str, ICPointIndex] = {}
+
+        # level of detail reduction and the cached indices of the reduced lines
+        # the cache is keyed on the display x range and the widget width
+        self._decimation: ICGraphDecimation = ICGraphDecimation.MinMax
+        self._lod_cache: dict[str, tuple[tuple, np.ndarray]] = {}
+
+        # rendering backend. the raster backend draws into a reused image buffer,
+        # optionally coloring each pixel by the number of samples falling on it
+        self._backend: ICGraphBackend = ICGraphBackend.Painter
+        self._density: bool = False
+        self._raster_buffer: np.ndarray = None
+
+        # background rendering. the render worker draws snapshots into back buffers and
+        # the latest completed frame is shown. a new snapshot is taken when the graph has changed
+        self._threaded: bool = False
+        self._frame_stale: bool = True
+        self._frame_size: tuple[int, int] = (0, 0)
+        self._front_buffer: QtGui.QImage = None
+        self._spare_buffer: QtGui.QImage = None
+
+        # min/max pyramid of the y data for selecting the resolution while zooming
+        self._plot_pyramid: dict[str, ICMinMaxPyramid] = {}
+
+        # is the x data of the line monotonically increasing
+        self._plot_x_sorted: dict[str, bool] = {}
+
+        # optional columnar store of the lines sharing the x data of the first line.
+        # the x and y data of the stored lines are views of the store
+        self._store: ICLineStore = None
+
+        # lines read directly from shared ring buffers and the write count seen at the last refresh
+        self._plot_source: dict[str, ICSharedRingBuffer] = {}
+        self._plot_source_count: dict[str, int] = {}
+
         # default level if not 0. it is used to plot the level for missing points in live data
         self._base_level: float = 0
 
         # ring index for push operation
         self._ring_index: int = 0
 
+        # scrolling strip chart. the ring is shown from its oldest to its newest sample without moving the data.
+        # the x data holds the position of each sample, the newest at scroll_x
+        self._scrolling: bool = False
+        self._scroll_interval: float = 1.0
+        self._scroll_x: float = 0.0
+
         # alarm level
         self._lower_alarm_level_name: str = ""
         self._upper_alarm_level_name: str = ""
@@ -195,6 +336,133 @@ class ICGraph(ICBaseWidget):
         self._auto_scale = scl
         self.update()
 
+    @property
+    def decimation(self) -> ICGraphDecimation:
+        return self._decimation
+
+    @decimation.setter
+    def decimation(self, mode: ICGraphDecimation) -> None:
+        self._decimation = mode
+        self._lod_cache.clear()
+        self.update()
+
+    @property
+    def backend(self) -> ICGraphBackend:
+        return self._backend
+
+    @backend.setter
+    def backend(self, mode: ICGraphBackend) -> None:
+        self._backend = mode
+        if mode != ICGraphBackend.Raster:
+            self._raster_buffer = None
+        self.update()
+
+    @property
+    def density(self) -> bool:
+        return self._density
+
+    @density.setter
+    def density(self, den: bool) -> None:
+        self._density = den
+        self.update()
+
+    @property
+    def threaded(self) -> bool:
+        return self._threaded
+
+    @threaded.setter
+    def threaded(self, thr: bool) -> None:
+        self._threaded = thr
+        self._front_buffer = None
+        self._spare_buffer = None
+        self.update()
+
+    @property
+    def picking(self) -> ICGraphPicking:
+        return self._picking
+
+    @picking.setter
+    def picking(self, mode: ICGraphPicking) -> None:
+        self._picking = mode
+        self.setMouseTracking(mode == ICGraphPicking.Hover)
+
+    @property
+    def pick_radius(self) -> float:
+        return self._pick_radius
+
+    @pick_radius.setter
+    def pick_radius(self, radius: float) -> None:
+        self._pick_radius = radius
+
+    @property
+    def scrolling(self) -> bool:
+        return self._scrolling
+
+    @scrolling.setter
+    def scrolling(self, scroll: bool) -> None:
+        if scroll == self._scrolling:
+            return
+        self._scrolling = scroll
+        if scroll:
+            self._scroll_x = 0.0
+
+        for line_name in self._pushed_lines():
+            if scroll:
+                # the samples in the ring are placed one interval apart, the newest at 0
+                positions = self._scroll_positions(self._plot_x_data[line_name].size)
+                if self._store is not None and line_name in self._store:
+                    self._store.x_data[:] = positions
+                else:
+                    self._plot_x_data[line_name] = positions
+                self._plot_x_sorted[line_name] = True
+            else:
+                # the samples keep their positions, which are sorted only if the ring has not wrapped around
+                x_array = self._plot_x_data[line_name]
+                self._plot_x_sorted[line_name] = bool(np.all(x_array[1:] >= x_array[:-1]))
+
+        self._lod_cache.clear()
+        self._point_index.clear()
+
+        # show the complete ring
+        if self._scale_display_x(True):
+            self.rescaled_x.emit()
+        self.update()
+
+    @property
+    def columnar(self) -> bool:
+        return self._store is not None
+
+    @columnar.setter
+    def columnar(self, col: bool) -> None:
+        if col == (self._store is not None):
+            return
+
+        if col:
+            # move the lines sharing the x data of the first line into the store
+            self._store = ICLineStore()
+            for line_name in self._pushed_lines():
+                self._store.add(line_name, self._plot_x_data[line_name], self._plot_y_data[line_name])
+            self._bind_store_rows()
+        else:
+            # every line gets its own copy of the data
+            store = self._store
+            self._store = None
+            for line_name in store.names:
+                self._plot_x_data[line_name] = store.x_data.copy()
+                self._plot_y_data[line_name] = store.row(line_name).copy()
+                self._plot_pyramid[line_name].rebuild(self._plot_y_data[line_name])
+            self._lod_cache.clear()
+            self._point_index.clear()
+
+    @property
+    def scroll_interval(self) -> float:
+        return self._scroll_interval
+
+    @scroll_interval.setter
+    def scroll_interval(self, interval: float) -> None:
+        if interval > 0:
+            self._scroll_interval = interval
+
     @property
     def selected_color(self) -> QtGui.QColor:
         return self._selected_color
@@ -240,9 +508,12 @@ class ICGraph(ICBaseWidget):
             x       : cross marker
             +       : plus marker
             *       : star marker
+        x_sorted declares that the x data is monotonically increasing (e.g. time series).
+        sorted lines are drawn, picked and scaled using only the visible index range.
+        if None the x data is checked once while adding the line.
     """
     def add_line(self, line_name: str, x_data: list[float], y_data: list[float], style: str, line_color: str, fill_color: str = "",
-                 rescale_display: float = False) -> None:
+                 rescale_display: float = False, x_sorted: Union[bool, None] = None) -> None:
 
         # x and y length should be same
         if len(x_data) != len(y_data):
@@ -254,7 +525,34 @@ class ICGraph(ICBaseWidget):
 
         # add the data and color to the dictionary
         self._plot_x_data[line_name] = np.array(x_data)
-        self._plot_y_data[line_name] = np.array(y_data)
+        self._plot_y_data[line_name] = np.array(y_data, dtype=np.float64)
+        self._lod_cache.pop(line_name, None)
+        self._point_index.pop(line_name, None)
+
+        # index the data for zooming. unsorted data falls back to scanning the complete line
+        if x_sorted is None:
+            x_array = self._plot_x_data[line_name]
+            x_sorted = bool(np.all(x_array[1:] >= x_array[:-1]))
+
+        # lines of a scrolling graph take the positions of the pushed samples
+        if self._scrolling and line_name not in self._plot_source:
+            primary_x = self._plot_x_data[self._primary_name]
+            if line_name != self._primary_name and primary_x.size == len(x_data):
+                self._plot_x_data[line_name] = primary_x.copy()
+            else:
+                self._plot_x_data[line_name] = self._scroll_positions(len(x_data))
+            x_sorted = True
+        self._plot_x_sorted[line_name] = x_sorted
+
+        # lines sharing the x data of the columnar store become rows of its matrix
+        stored = False
+        if self._store is not None and line_name not in self._plot_source:
+            was_stored = line_name in self._store
+            stored = self._store.add(line_name, self._plot_x_data[line_name], self._plot_y_data[line_name])
+            if stored or was_stored:
+                self._bind_store_rows()
+        if not stored:
+            self._plot_pyramid[line_name] = ICMinMaxPyramid(self._plot_y_data[line_name])
 
         self._plot_line_color[line_name] = QtGui.QColor(line_color)
         if fill_color:
@@ -291,6 +589,73 @@ class ICGraph(ICBaseWidget):
         # update the screen
         self.update()
 
+    """
+        Add a line whose y data is read directly from a shared ring buffer
+        the producer writes into the buffer from another process and the graph reads the same memory without copying
+        x_data should have the same size as the ring
+        call refresh_shared_lines periodically to pick up the new samples
+    """
+    def add_shared_line(self, line_name: str, x_data: list[float], source: ICSharedRingBuffer, style: str, line_color: str,
+                        fill_color: str = "", rescale_display: float = False, x_sorted: Union[bool, None] = None) -> None:
+        # x and ring length should be same
+        if len(x_data) != source.size:
+            return
+
+        # the line is known as shared while it is added, so it keeps its own data
+        self._plot_source[line_name] = source
+        self._plot_source_count[line_name] = source.write_count
+        self.add_line(line_name, x_data, source.data, style, line_color, fill_color, rescale_display, x_sorted)
+
+        # replace the copied data with the view of the shared memory
+        self._plot_y_data[line_name] = source.data
+        self._plot_pyramid[line_name].rebuild(source.data)
+        self._point_index.pop(line_name, None)
+
+    """
+        Pick up the samples written into the shared ring buffers since the last refresh
+        only the changed part of the pyramids is updated
+        returns True if any of the shared lines has changed
+    """
+    def refresh_shared_lines(self, rescale: bool = True) -> bool:
+        changed = False
+        for line_name, source in self._plot_source.items():
+            write_count = source.write_count
+            new_count = write_count - self._plot_source_count[line_name]
+            if new_count <= 0:
+                continue
+            self._plot_source_count[line_name] = write_count
+
+            # update the pyramid over the new samples, which may wrap around the end of the ring
+            pyramid = self._plot_pyramid[line_name]
+            ring_size = source.size
+            if new_count >= ring_size:
+                pyramid.rebuild()
+            else:
+                start = (write_count - new_count) % ring_size
+                pyramid.update_range(start, min(start + new_count, ring_size))
+                pyramid.update_range(0, start + new_count - ring_size)
+
+            # update about the change in primary line
+            if line_name == self._primary_name:
+                new_values = source.data[np.arange(write_count - min(new_count, ring_size), write_count) % ring_size]
+                self._check_alarm(new_values)
+                self.current_changed[float].emit(float(new_values[-1]))
+
+            self._lod_cache.pop(line_name, None)
+            self._point_index.pop(line_name, None)
+            changed = True
+
+        if changed:
+            # limits follow the data through the pyramids
+            if self._auto_scale and rescale:
+                if self._scale_y_range():
+                    self.rescaled_y.emit()
+
+            # request a view update
+            self.request_update()
+
+        return changed
+
     """
         Scale x axis display coordinates 
     """
@@ -334,8 +699,14 @@ class ICGraph(ICBaseWidget):
             x_arr = self._plot_x_data[line_name]
             if x_arr.size < 2:
                 continue
-            line_min = x_arr.min(initial=new_min)
-            line_max = x_arr.max(initial=new_max)
+            if self._plot_x_sorted[line_name]:
+                # the limits of sorted data are its end points
+                segments = self._line_segments(line_name)
+                line_min = x_arr[segments[0][0]]
+                line_max = x_arr[segments[-1][1] - 1]
+            else:
+                line_min = x_arr.min(initial=new_min)
+                line_max = x_arr.max(initial=new_max)
             new_min = new_min if new_min < line_min else line_min
             new_max = new_max if new_max > line_max else line_max
 
@@ -375,12 +746,20 @@ class ICGraph(ICBaseWidget):
             new_min = new_min if new_min < y_pos else y_pos
             new_max = new_max if new_max > y_pos else y_pos
 
+        # lines in the columnar store are scaled with the extremes of its column envelope
+        store = self._store
+        if store is not None and store.count and store.size >= 2:
+            line_min, line_max = store.y_range()
+            new_min = new_min if new_min < line_min else line_min
+            new_max = new_max if new_max > line_max else line_max
+
+        # extremes of the other lines are read from the top of their pyramids
         for line_name in self._plot_y_data:
-            y_arr = self._plot_y_data[line_name]
-            if y_arr.size < 2:
+            if self._plot_y_data[line_name].size < 2 or (store is not None and line_name in store):
                 continue
-            line_max = y_arr.max(initial=new_max)
-            line_min = y_arr.min(initial=new_min)
+            pyramid = self._plot_pyramid[line_name]
+            line_max = pyramid.max_value
+            line_min = pyramid.min_value
             new_min = new_min if new_min < line_min else line_min
             new_max = new_max if new_max > line_max else line_max
 
@@ -410,14 +789,30 @@ class ICGraph(ICBaseWidget):
 
     """
         Update data for a given line
+        shared lines are written by their producer only and are not updated
     """
     def update_data(self, line_name: str, data: list[float]) -> None:
+        # the memory of a shared line belongs to the producer
+        if line_name in self._plot_source:
+            return
+
         # size of new data should be same as previous data
         if len(data) != self._plot_y_data[line_name].size:
             return
 
-        # update the data
-        self._plot_y_data[line_name] = np.array(data)
+        # update the data in place.
+        # for a line in the columnar store the pending pushes are applied to the pyramids first, as the column envelope
+        # is updated over all the columns and the rebuilt pyramid of the line already includes the new data
+        in_store = self._store is not None and line_name in self._store
+        if in_store:
+            self._update_store_pyramids()
+        self._plot_y_data[line_name][:] = data
+        if in_store:
+            self._store.mark_changed(0, self._store.size)
+            self._store.take_changes()
+        self._plot_pyramid[line_name].rebuild()
+        self._lod_cache.pop(line_name, None)
+        self._point_index.pop(line_name, None)
 
         # reset limits, notify others and update the screen
         if self._scale_y_range():
@@ -429,13 +824,32 @@ class ICGraph(ICBaseWidget):
     """
        Push new data point for the current line
        self._ring_index is used to maintain the current position
+       in scrolling mode x_value is the position of the sample, e.g. its time.
+       if None the sample is placed scroll_interval after the previous one
     """
-    def push_data(self, all_line_names: tuple[str], data_set: tuple[float], rescale: bool = True) -> None:
+    def push_data(self, all_line_names: tuple[str], data_set: tuple[float], rescale: bool = True, x_value: float = None) -> None:
         # check for wrap around
         if self._plot_x_data[self._primary_name].size == self._ring_index:
             self._ring_index = 0
 
-        for line_name in self._plot_x_data.keys():
+        # position of the new sample
+        if self._scrolling:
+            self._scroll_x = self._scroll_x + self._scroll_interval if x_value is None else x_value
+            for x_array in self._pushed_x_data():
+                x_array[self._ring_index] = self._scroll_x
+
+        # lines in the columnar store are written as one column. their pyramids are updated before use
+        store = self._store
+        if store is not None and store.count:
+            store.write_column(self._ring_index, tuple(all_line_names), data_set, self._base_level)
+            if not self._scrolling:
+                store.fill_column((self._ring_index + 5) % store.size, self._base_level)
+
+        # shared lines are written by their producer
+        for line_name in self._pushed_lines():
+            if store is not None and line_name in store:
+                continue
+
             try:
                 index = all_line_names.index(line_name)
                 new_value = data_set[index]
@@ -447,65 +861,225 @@ class ICGraph(ICBaseWidget):
             # update data
             line[self._ring_index] = new_value
 
-            # update about the change in primary line
-            if line_name == self._primary_name:
-                self.current_changed[float].emit(new_value)
+            # update the pyramid for the changed samples
+            pyramid = self._plot_pyramid[line_name]
+            pyramid.update(self._ring_index)
 
-                # check for alarm
-                self.alarm_activated = False
-                if self._lower_alarm_level_name:
-                    if new_value < self._y_marker_lines[self._lower_alarm_level_name]:
-                        self.alarm_activated = True
+            # remove the next point. scrolling graphs have no gap
+            if not self._scrolling:
+                next_index = (self._ring_index + 5) % line.size
+                line[next_index] = self._base_level
+                pyramid.update(next_index)
 
-                if self._upper_alarm_level_name:
-                    if new_value > self._y_marker_lines[self._upper_alarm_level_name]:
-                        self.alarm_activated = True
+        # update about the change in primary line
+        new_value = float(self._plot_y_data[self._primary_name][self._ring_index])
+        self.current_changed[float].emit(new_value)
 
-            # remove the next point
-            next_index = (self._ring_index + 5) % line.size
-            line[next_index] = self._base_level
+        # check for alarm
+        self._check_alarm(np.asarray([new_value]))
 
-        # if auto scaling is on the plot is completely auto-scaled once at the beginning of the cycle
+        # the pyramids track the extremes of every line as samples are overwritten.
+        # the limits therefore follow the data in both directions without rescanning the ring
         if self._auto_scale and rescale:
-            if self._ring_index == 0:
-                if self._scale_y_range():
-                    self.rescaled_y.emit()
+            if self._scale_y_range():
+                self.rescaled_y.emit()
+
+        # reduced lines and point indices need to be recalculated
+        self._lod_cache.clear()
+        self._point_index.clear()
+
+        # increment the ring index and request view update
+        self._ring_index += 1
+        if self._scrolling:
+            self._scroll_view()
+        self.request_update()
+
+    """
+       Push a block of samples for several lines at once
+       data_block has one row per line in all_line_names and one column per sample
+       lines that are not named are filled with the base level
+       the alarm is raised if any sample of the primary line in the block crosses an alarm level
+       current_changed is emitted once with the last sample of the primary line
+       in scrolling mode x_block holds the positions of the samples.
+       if None the samples are placed scroll_interval apart after the previous one
+    """
+    def push_block(self, all_line_names: tuple[str], data_block: np.ndarray, rescale: bool = True,
+                   x_block: np.ndarray = None) -> None:
+        data_block = np.asarray(data_block, dtype=float)
+        if data_block.ndim != 2 or data_block.shape[0] != len(all_line_names) or data_block.shape[1] == 0:
+            return
+        if x_block is not None and len(x_block) != data_block.shape[1]:
+            return
+
+        # only the latest samples that fit in the ring are kept.
+        # the ring still advances over the dropped samples
+        ring_size = self._plot_x_data[self._primary_name].size
+        dropped_count = max(data_block.shape[1] - ring_size, 0)
+        data_block = data_block[:, dropped_count:]
+        count = data_block.shape[1]
+
+        # samples written before and after wrapping around
+        start = (self._ring_index + dropped_count) % ring_size
+        first_count = min(count, ring_size - start)
+        wrapped_count = count - first_count
+
+        # points ahead of the block that are removed to show the gap. scrolling graphs have no gap
+        if self._scrolling:
+            gap_index = np.empty(0, dtype=np.intp)
+        else:
+            gap_index = (start + np.arange(max(count, 5), count + 5)) % ring_size
+
+        # positions of the kept samples
+        if self._scrolling:
+            if x_block is None:
+                x_values = self._scroll_x + self._scroll_interval * np.arange(dropped_count + 1, dropped_count + count + 1)
+            else:
+                x_values = np.asarray(x_block, dtype=float)[dropped_count:]
+            self._scroll_x = float(x_values[-1])
+            for x_array in self._pushed_x_data():
+                x_array[start:start + first_count] = x_values[:first_count]
+                x_array[:wrapped_count] = x_values[first_count:]
+
+        # lines in the columnar store are written as one block. their pyramids are updated before use
+        store = self._store
+        if store is not None and store.count:
+            store.write_block(start, tuple(all_line_names), data_block, self._base_level)
+            for index in gap_index:
+                store.fill_column(int(index), self._base_level)
+
+        rows = {line_name: row for row, line_name in enumerate(all_line_names)}
+        for line_name in self._pushed_lines():
+            if store is not None and line_name in store:
+                continue
+
+            line: np.ndarray = self._plot_y_data[line_name]
+
+            # update data
+            if line_name in rows:
+                values = data_block[rows[line_name]]
+                line[start:start + first_count] = values[:first_count]
+                line[:wrapped_count] = values[first_count:]
             else:
-                scaled = False
+                line[start:start + first_count] = self._base_level
+                line[:wrapped_count] = self._base_level
+
+            # remove the next points
+            line[gap_index] = self._base_level
+
+            # update the pyramid for the changed samples
+            pyramid = self._plot_pyramid[line_name]
+            pyramid.update_range(start, start + first_count)
+            pyramid.update_range(0, wrapped_count)
+            for index in gap_index:
+                pyramid.update(int(index))
+
+        # check the primary line for alarm over the complete block
+        if self._primary_name in rows:
+            primary_values = data_block[rows[self._primary_name]]
+        else:
+            primary_values = np.full(count, self._base_level)
 
-                min_data = min(data_set)
-                if min_data < self._scale_y_min:
-                    new_min = min_data
+        self._check_alarm(primary_values)
 
-                    # ensure that the min and max limit is within the defined range
-                    if self._auto_scale_y_min_limit is not None:
-                        new_min = new_min if new_min > self._auto_scale_y_min_limit[0] else self._auto_scale_y_min_limit[0]
-                        new_min = new_min if new_min < self._auto_scale_y_min_limit[1] else self._auto_scale_y_min_limit[1]
+        # update about the change in primary line
+        self.current_changed[float].emit(float(primary_values[-1]))
 
-                    if new_min != self._scale_y_min:
-                        self._scale_y_min = new_min
-                        scaled = True
+        # limits follow the data through the pyramids
+        if self._auto_scale and rescale:
+            if self._scale_y_range():
+                self.rescaled_y.emit()
 
-                max_data = max(data_set)
-                if max_data > self._scale_y_max:
-                    new_max = max_data
+        # reduced lines and point indices need to be recalculated
+        self._lod_cache.clear()
+        self._point_index.clear()
 
-                    # ensure that the min and max limit is within the defined range
-                    if self._auto_scale_y_max_limit is not None:
-                        new_max = new_max if new_max > self._auto_scale_y_max_limit[0] else self._auto_scale_y_max_limit[0]
-                        new_max = new_max if new_max < self._auto_scale_y_max_limit[1] else self._auto_scale_y_max_limit[1]
+        # move the ring index past the block and request a single view update
+        self._ring_index = start + first_count if wrapped_count == 0 else wrapped_count
+        if self._scrolling:
+            self._scroll_view()
+        self.request_update()
 
-                    if new_max != self._scale_y_max:
-                        self._scale_y_max = new_max
-                        scaled = True
+    """
+        Lines whose samples are written by push_data and push_block, i.e. all but the shared lines
+    """
+    def _pushed_lines(self) -> list[str]:
+        return [line_name for line_name in self._plot_x_data if line_name not in self._plot_source]
 
-                # notify others about y axis rescaling
-                if scaled:
-                    self.rescaled_y.emit()
+    """
+        X data of the pushed lines, once for the lines sharing the x data of the columnar store
+    """
+    def _pushed_x_data(self) -> list[np.ndarray]:
+        return list({id(self._plot_x_data[line_name]): self._plot_x_data[line_name] for line_name in self._pushed_lines()}.values())
 
-        # increment the ring index and request view update
-        self._ring_index += 1
-        self.update()
+    """
+        Point the lines in the columnar store to the rows of its matrix, e.g. after the matrix has been reallocated
+    """
+    def _bind_store_rows(self) -> None:
+        for line_name in self._store.names:
+            self._plot_x_data[line_name] = self._store.x_data
+            self._plot_y_data[line_name] = self._store.row(line_name)
+            if line_name in self._plot_pyramid:
+                self._plot_pyramid[line_name].rebuild(self._plot_y_data[line_name])
+            else:
+                self._plot_pyramid[line_name] = ICMinMaxPyramid(self._plot_y_data[line_name])
+            self._lod_cache.pop(line_name, None)
+            self._point_index.pop(line_name, None)
+
+        # the rebuilt pyramids include all the changes
+        self._store.take_changes()
+
+    """
+        Update the pyramids of the lines in the columnar store over the samples written since the last update
+    """
+    def _update_store_pyramids(self) -> None:
+        if self._store is None:
+            return
+
+        changes = self._store.take_changes()
+        for line_name in self._store.names:
+            pyramid = self._plot_pyramid[line_name]
+            for start, stop in changes:
+                # single pushed samples walk up the levels with scalar operations
+                if stop - start == 1:
+                    pyramid.update(start)
+                else:
+                    pyramid.update_range(start, stop)
+
+    """
+        Positions of the samples in a ring of the given size for scrolling
+        the newest sample, just before the ring index, is at scroll_x and the older ones are scroll_interval apart
+    """
+    def _scroll_positions(self, size: int) -> np.ndarray:
+        head = self._ring_index % size if size else 0
+        age = (head - 1 - np.arange(size)) % max(size, 1)
+        return self._scroll_x - age * self._scroll_interval
+
+    """
+        Move the display x range with the newest sample
+        a zoomed view keeps its width while it shows the newest sample, otherwise it stays where it is
+    """
+    def _scroll_view(self) -> None:
+        if self._display_x_max >= self._scale_x_max:
+            window = self._display_x_max - self._display_x_min
+            self._scale_x_range()
+            self._display_x_max = self._scale_x_max
+            self._display_x_min = max(self._scale_x_max - window, self._scale_x_min)
+            self.rescaled_x.emit()
+        elif self._scale_display_x(False):
+            self.rescaled_x.emit()
+
+    """
+        Activate the alarm if any of the values crosses the alarm levels
+    """
+    def _check_alarm(self, values: np.ndarray) -> None:
+        self.alarm_activated = False
+        if self._lower_alarm_level_name:
+            if np.any(values < self._y_marker_lines[self._lower_alarm_level_name]):
+                self.alarm_activated = True
+
+        if self._upper_alarm_level_name:
+            if np.any(values > self._y_marker_lines[self._upper_alarm_level_name]):
+                self.alarm_activated = True
 
     """
         Remove line from the plot
@@ -524,6 +1098,18 @@ class ICGraph(ICBaseWidget):
             self._plot_line_color.pop(line_name)
             self._plot_style.pop(line_name)
             self._plot_is_line.pop(line_name)
+            self._plot_pyramid.pop(line_name)
+            self._plot_x_sorted.pop(line_name)
+            self._plot_source.pop(line_name, None)
+            self._plot_source_count.pop(line_name, None)
+            self._lod_cache.pop(line_name, None)
+            self._point_index.pop(line_name, None)
+            self._selected_index.pop(line_name, None)
+
+            # the remaining rows of the columnar store move up
+            if self._store is not None and line_name in self._store:
+                self._store.remove(line_name)
+                self._bind_store_rows()
 
             # rescale the y axis
             if self._scale_y_range():
@@ -683,49 +1269,194 @@ class ICGraph(ICBaseWidget):
         if self._scale_y_range():
             self.rescaled_y.emit()
 
+    """
+        Indices of the samples to draw for a line, None if every sample is drawn
+        The reduced line is recomputed only when the data, display x range or width changes
+    """
+    def _line_lod(self, line_name: str, width: int) -> Union[np.ndarray, None]:
+        if self._decimation == ICGraphDecimation.Off:
+            return None
+
+        # markers are only reduced in LTTB mode
+        is_line = self._plot_is_line[line_name]
+        if not (is_line or self._decimation == ICGraphDecimation.LTTB):
+            return None
+
+        # nothing to gain if there are fewer samples than two per pixel column
+        x_array = self._plot_x_data[line_name]
+        if x_array.size <= 2 * width:
+            return None
+
+        # return the cached reduction if nothing has changed
+        key = (self._display_x_min, self._display_x_max, width, self._decimation)
+        cached = self._lod_cache.get(line_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        y_array = self._plot_y_data[line_name]
+        if is_line and self._plot_x_sorted[line_name]:
+            # only the samples within the display range are considered
+            ranges = self._visible_ranges(line_name)
+            if sum(stop - start for start, stop in ranges) <= 2 * width:
+                lod_index = self._range_indices(ranges)
+            else:
+                # exact envelope of the pixel columns. the index range of every column is found by binary search
+                # and its extremes and first gap are read from the pyramid. samples on either side of the display range
+                # are gathered in one extra column each, as in minmax_decimate
+                pyramid = self._plot_pyramid[line_name]
+                edges = self._display_x_min + np.arange(width + 1) * ((self._display_x_max - self._display_x_min) / width)
+                parts = []
+                for start, stop in ranges:
+                    bounds = np.concatenate(([start], start + np.searchsorted(x_array[start:stop], edges), [stop]))
+                    filled = bounds[1:] > bounds[:-1]
+                    min_index, max_index, gap_index = pyramid.extremes(bounds[:-1][filled], bounds[1:][filled])
+                    parts.append(np.unique(np.concatenate((min_index, max_index, gap_index[gap_index >= 0]))))
+                lod_index = np.concatenate(parts)
+        elif is_line:
+            lod_index = minmax_decimate(x_array, y_array, self._display_x_min, self._display_x_max, width)
+        elif self._plot_x_sorted[line_name]:
+            # down sample only the markers within the display range, in the order of the samples
+            visible = self._range_indices(self._visible_ranges(line_name))
+            lod_index = visible[lttb_decimate(x_array[visible], y_array[visible], 2 * width)]
+        else:
+            # down sample only the markers within the display range
+            visible = np.flatnonzero((x_array >= self._display_x_min) & (x_array <= self._display_x_max))
+            lod_index = visible[lttb_decimate(x_array[visible], y_array[visible], 2 * width)]
+
+        self._lod_cache[line_name] = (key, lod_index)
+        return lod_index
+
+    """
+        Index ranges [start, stop) of a line in the order of its samples
+        The ring of a scrolling graph runs from the oldest sample at the ring index to the end
+        and continues from the start, so the samples are never moved
+    """
+    def _line_segments(self, line_name: str) -> list[tuple[int, int]]:
+        size = self._plot_x_data[line_name].size
+        head = self._ring_index % size if size else 0
+        if not self._scrolling or head == 0 or line_name in self._plot_source:
+            return [(0, size)]
+        return [(head, size), (0, head)]
+
+    """
+        Index ranges [start, stop) of a line with sorted x data within the display range
+        One sample on either side is included so that the line reaches the border
+    """
+    def _visible_ranges(self, line_name: str) -> list[tuple[int, int]]:
+        x_array = self._plot_x_data[line_name]
+        ranges = []
+        for first, last in self._line_segments(line_name):
+            segment = x_array[first:last]
+            start = int(np.searchsorted(segment, self._display_x_min, side="left"))
+            stop = int(np.searchsorted(segment, self._display_x_max, side="right"))
+            start, stop = first + max(start - 1, 0), first + min(stop + 1, segment.size)
+            if stop > start:
+                ranges.append((start, stop))
+        return ranges
+
+    """
+        Sample indices of a list of index ranges
+    """
+    @staticmethod
+    def _range_indices(ranges: list[tuple[int, int]]) -> np.ndarray:
+        if not ranges:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate([np.arange(start, stop) for start, stop in ranges])
+
+    """
+        Cleared image buffer of the raster backend, reused while the size stays the same
+    """
+    def _raster_canvas(self, width: int, height: int) -> np.ndarray:
+        if self._raster_buffer is None or self._raster_buffer.shape != (height, width):
+            self._raster_buffer = np.zeros((height, width), dtype=np.uint32)
+        else:
+            self._raster_buffer.fill(0)
+        return self._raster_buffer
+
+    """
+        Rasterize a line in screen coordinates into the image buffer
+        lines are drawn as column spans and filled down to the base level, markers as dots
+        in density mode every sample is a pixel colored by the number of samples on it
+    """
+    @staticmethod
+    def _raster_line(buffer: np.ndarray, line: ICGraphFrameLine, px: np.ndarray, py: np.ndarray, base_level_y: float,
+                     density: bool) -> None:
+        if density:
+            draw_density(buffer, px, py, line.line_color)
+        elif line.is_line:
+            low, high = line_spans(px, py, buffer.shape[1])
+            if line.fill_color is not None:
+                covered = low <= high
+                draw_spans(buffer, np.where(covered, np.minimum(low, base_level_y), low),
+                           np.where(covered, np.maximum(high, base_level_y), high), raster_color(line.fill_color))
+            draw_spans(buffer, low, high, raster_color(line.line_color), 1)
+        else:
+            draw_points(buffer, px, py, raster_color(line.line_color))
+
     ###################################################
     #    Override base class event handlers
     ###################################################
     def on_mouse_released(self, event: QtGui.QMouseEvent) -> None:
-        if event.button() & Qt.LeftButton:
-            # find the current position in data coordinates
-            painter = QtGui.QPainter(self)
-            temp_height = painter.device().height()
-            temp_width = painter.device().width()
-
-            # screen to world scaling factors
-            x_scale = (float(self._display_x_max - self._display_x_min)) / (float(temp_width))
-            y_scale = (float(self._scale_y_max - self._scale_y_min)) / (float(temp_height))
-
-            # position in world scales
-            real_pos_x = self._display_x_min + event.pos().x() * x_scale
-            real_pos_y = self._scale_y_min + (temp_height - event.pos().y()) * y_scale
-
-            for line_name in self._plot_x_data:
-                # for each line find the closest point in the graph
-                x_array = self._plot_x_data[line_name]
-                y_array = self._plot_y_data[line_name]
+        if event.button() & Qt.LeftButton and self._picking != ICGraphPicking.Hover:
+            for line_name, index in self._pick(event.pos()):
+                self.clicked.emit(self._name, line_name, index, self._plot_x_data[line_name][index], self._plot_y_data[line_name][index])
+            self.update()
 
-                if x_array.size == 0 or y_array.size == 0:
-                    continue
+    """
+        Selection follows the mouse in drag and hover picking
+    """
+    def on_mouse_moved(self, event: QtGui.QMouseEvent) -> None:
+        if self._picking == ICGraphPicking.Drag and event.buttons() & Qt.LeftButton:
+            signal = self.clicked
+        elif self._picking == ICGraphPicking.Hover:
+            signal = self.hovered
+        else:
+            return
 
-                dist = (x_array - real_pos_x)**2 + (y_array - real_pos_y)**2
-                min_index = np.argmin(dist)
+        for line_name, index in self._pick(event.pos()):
+            signal.emit(self._name, line_name, index, self._plot_x_data[line_name][index], self._plot_y_data[line_name][index])
+        self.request_update()
 
-                self._selected_index[line_name] = min_index
-                self.clicked.emit(self._name, line_name, min_index, x_array[min_index], y_array[min_index])
+    """
+        Select the point of each line closest to a position on the screen
+        returns the line names and the indices of the selected points
+    """
+    def _pick(self, pos: QtCore.QPoint) -> list[tuple[str, int]]:
+        width = max(self.width(), 1)
+        height = max(self.height(), 1)
 
-            self.update()
+        # world to screen scaling factors
+        x_range = self._display_x_max - self._display_x_min
+        y_range = self._scale_y_max - self._scale_y_min
+        x_scale = width / x_range if x_range > 0 else 1.0
+        y_scale = height / y_range if y_range > 0 else 1.0
+
+        # position in world scales
+        real_pos_x = self._display_x_min + pos.x() / x_scale
+        real_pos_y = self._scale_y_min + (height - pos.y()) / y_scale
+
+        self._update_store_pyramids()
+
+        picked = []
+        for line_name in self._plot_x_data:
+            point_index = self._point_index.get(line_name)
+            if point_index is None:
+                point_index = ICPointIndex(self._plot_x_data[line_name], self._plot_y_data[line_name], self._plot_x_sorted[line_name],
+                                           self._plot_pyramid[line_name], self._line_segments(line_name)[0][0])
+                self._point_index[line_name] = point_index
+
+            index = point_index.nearest(real_pos_x, real_pos_y, x_scale, y_scale, self._pick_radius)
+            if index >= 0:
+                self._selected_index[line_name] = index
+                picked.append((line_name, index))
+        return picked
 
     """
         Wheel motion zooms in and out
     """
     def on_wheel_rotated(self, event: QtGui.QWheelEvent) -> None:
         # find the current position in data coordinates
-        painter = QtGui.QPainter(self)
-        temp_width = painter.device().width()
-
-        x_scale = float(self._display_x_max - self._display_x_min) / float(temp_width)
+        x_scale = float(self._display_x_max - self._display_x_min) / float(max(self.width(), 1))
         cur_pos_x = self._display_x_min + event.pos().x() * x_scale
         mid_x = 0.5 * (self._display_x_max + self._display_x_min)
 
@@ -769,34 +1500,113 @@ class ICGraph(ICBaseWidget):
         # update the view
         self.update()
 
-    ###################################################
-    #    Override event handlers
-    ###################################################
     """
-        Draw the plot
+        Collect everything drawn in a frame of the given size
+        lines are reduced through the cached level of detail. the lines of a snapshot are copies
+        of the samples to draw, otherwise they are views of the data where possible
     """
-    def paintEvent(self, e):
-        if self.state in (ICWidgetState.Hidden, ICWidgetState.Transparent):
-            return
-
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
-
-        # window dimensions
-        temp_width = painter.device().width()
-        temp_height = painter.device().height()
-
+    def _create_frame(self, width: int, height: int, snapshot: bool) -> ICGraphFrame:
         # fix y limits for auto scale
         if self._scale_y_max == self._scale_y_min:
             self._scale_y_max += 1.0
             self._scale_y_min -= 1.0
 
+        frame = ICGraphFrame(width, height)
+        frame.x_min = self._display_x_min
+        frame.x_max = self._display_x_max
+        frame.y_min = self._scale_y_min
+        frame.y_max = self._scale_y_max
+        frame.base_level = self._base_level
+        frame.raster = self._backend == ICGraphBackend.Raster
+        frame.density = self._density
+        frame.selected_color = QtGui.QColor(self._selected_color)
+        frame.font = QtGui.QFont(self.font())
+        if frame.raster and not snapshot:
+            frame.raster_buffer = self._raster_canvas(width, height)
+
+        # the reduced lines use the pyramids of the columnar store
+        self._update_store_pyramids()
+
+        for line_name in self._plot_x_data:
+            x_array = self._plot_x_data[line_name]
+            y_array = self._plot_y_data[line_name]
+            is_line = self._plot_is_line[line_name]
+
+            # if there is selected point
+            selected_index = -1
+            if line_name in self._selected_index:
+                selected_index = self._selected_index[line_name]
+
+            # reduce the line to the level of detail of the display
+            # position of the selected point in the reduced line is skipped while drawing markers
+            # density coloring needs every sample
+            skip_index = selected_index
+            lod_index = None if frame.raster and self._density else self._line_lod(line_name, width)
+            if lod_index is not None:
+                x_array = x_array[lod_index]
+                y_array = y_array[lod_index]
+                position = np.flatnonzero(lod_index == selected_index)
+                skip_index = int(position[0]) if position.size else -1
+            elif self._plot_x_sorted[line_name]:
+                # draw only the visible part of sorted lines
+                ranges = self._visible_ranges(line_name)
+                if len(ranges) == 1 and not snapshot:
+                    start, stop = ranges[0]
+                    x_array = x_array[start:stop]
+                    y_array = y_array[start:stop]
+                    skip_index = selected_index - start if start <= selected_index < stop else -1
+                else:
+                    visible = self._range_indices(ranges)
+                    x_array = x_array[visible]
+                    y_array = y_array[visible]
+                    position = np.flatnonzero(visible == selected_index)
+                    skip_index = int(position[0]) if position.size else -1
+            elif snapshot:
+                x_array = x_array.copy()
+                y_array = y_array.copy()
+
+            # snapshots are drawn in the render worker, which cannot use pixmaps
+            fill_color = self._plot_fill_color.get(line_name)
+            sprite = None
+            if not (is_line or frame.raster):
+                create_sprite = marker_image if snapshot else marker_sprite
+                sprite = create_sprite(self._plot_style[line_name], self._plot_line_color[line_name], fill_color,
+                                       self.devicePixelRatioF())
+
+            selected = None
+            if selected_index != -1:
+                selected = (float(self._plot_x_data[line_name][selected_index]), float(self._plot_y_data[line_name][selected_index]))
+
+            frame.lines.append(ICGraphFrameLine(x_array, y_array, skip_index, is_line, self._plot_style[line_name],
+                                                QtGui.QColor(self._plot_line_color[line_name]),
+                                                QtGui.QColor(fill_color) if fill_color is not None else None, sprite, selected))
+
+        # marker lines
+        frame.y_markers = [(marker_name, y_pos, QtGui.QColor(self._y_marker_line_colors[marker_name]))
+                           for marker_name, y_pos in self._y_marker_lines.items()]
+        frame.x_markers = [(marker_name, x_pos, QtGui.QColor(self._x_marker_line_colors[marker_name]))
+                           for marker_name, x_pos in self._x_marker_lines.items()]
+        return frame
+
+    """
+        Draw a frame
+        uses only the frame, so it runs in the GUI thread as well as in the render worker
+    """
+    @staticmethod
+    def _paint_frame(painter: QtGui.QPainter, frame: ICGraphFrame) -> None:
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setFont(frame.font)
+
+        # window dimensions
+        temp_width = frame.width
+        temp_height = frame.height
+
         # world to screen scaling factors
-        x_scale = (float(temp_width)) / (float(self._display_x_max - self._display_x_min))
-        y_scale = (float(temp_height)) / (float(self._scale_y_max - self._scale_y_min))
+        x_scale = (float(temp_width)) / (float(frame.x_max - frame.x_min))
+        y_scale = (float(temp_height)) / (float(frame.y_max - frame.y_min))
 
         # calculate base level
-        base_level_y = temp_height - (self._base_level - self._scale_y_min) * y_scale
+        base_level_y = temp_height - (frame.base_level - frame.y_min) * y_scale
 
         # normal pen
         pen = QtGui.QPen()
@@ -805,187 +1615,71 @@ class ICGraph(ICBaseWidget):
         pen.setJoinStyle(Qt.RoundJoin)
 
         # selected pen
-        selected_pen = QtGui.QPen(self._selected_color)
+        selected_pen = QtGui.QPen(frame.selected_color)
         selected_pen.setWidth(2)
         selected_pen.setCapStyle(Qt.RoundCap)
         selected_pen.setJoinStyle(Qt.RoundJoin)
 
+        # lines are rasterized into an image buffer by the raster backend
+        buffer = frame.raster_buffer
+        if frame.raster and buffer is None:
+            buffer = np.zeros((temp_height, temp_width), dtype=np.uint32)
+
         # draw the lines
-        for line_name in self._plot_x_data:
-            x_array = self._plot_x_data[line_name]
-            y_array = self._plot_y_data[line_name]
+        for line in frame.lines:
+            x_array = line.x_data
+            y_array = line.y_data
+            skip_index = line.skip_index
 
             # draw the main plot
             path = QtGui.QPainterPath()
-            if line_name in self._plot_fill_color:
+            if line.fill_color is not None:
                 path.setFillRule(Qt.WindingFill)
-                brush = QtGui.QBrush(self._plot_fill_color[line_name])
+                brush = QtGui.QBrush(line.fill_color)
                 painter.setBrush(brush)
 
             # normal pen
-            pen.setColor(self._plot_line_color[line_name])
+            pen.setColor(line.line_color)
 
-            # if there is selected point
-            selected_index = -1
-            if line_name in self._selected_index:
-                selected_index = self._selected_index[line_name]
-
-            if self._plot_is_line[line_name]:
-                pen.setStyle(self._plot_style[line_name])
+            if frame.raster:
+                px, py = world_to_screen(x_array, y_array, frame.x_min, x_scale, frame.y_min, y_scale, temp_height)
+                ICGraph._raster_line(buffer, line, px, py, base_level_y, frame.density)
+            elif line.is_line:
+                pen.setStyle(line.style)
                 painter.setPen(pen)
-                skip = True
-                last_x = 0
-                for i, x in enumerate(x_array):
-                    y = y_array[i]
-                    px = (x - self._display_x_min) * x_scale
-                    py = temp_height - (y - self._scale_y_min) * y_scale
-
-                    # limit py to top and bottom
-                    py = py if py > 0 else 0
-                    py = py if py < temp_height else temp_height
-
-                    if 0 <= px <= temp_width:
-                        if skip:
-                            path.moveTo(px, base_level_y)
-                            path.lineTo(px, py)
-                            skip = False
-                        else:
-                            path.lineTo(px, py)
-                        last_x = px
-
-                    else:
-                        # close the loop
-                        path.lineTo(last_x, base_level_y)
-                        path.closeSubpath()
-
-                        # we start skipping till we get back in range
-                        skip = True
-
-                # if we were not skipping close the loop
-                if not skip:
-                    path.lineTo(last_x, base_level_y)
+
+                # transform the complete line to screen coordinates and add it as closed polygons
+                px, py = world_to_screen(x_array, y_array, frame.x_min, x_scale, frame.y_min, y_scale, temp_height)
+                for polygon in line_polygons(px, py, temp_width, temp_height, base_level_y):
+                    path.addPolygon(polygon)
                     path.closeSubpath()
             else:
+                # markers are copies of a pre-rendered sprite, drawn for all the visible points in one call
+                px, py = world_to_screen(x_array, y_array, frame.x_min, x_scale, frame.y_min, y_scale, temp_height)
+                visible = (px > 3) & (px < temp_width - 3) & (py > 3) & (py < temp_height - 3)
 
-                painter.setPen(pen)
-                if self._plot_style[line_name] == "o":
-                    # draw circles
-                    for i, x in enumerate(x_array):
-                        # skip the selected point
-                        if i == selected_index:
-                            continue
-
-                        # calculate screen coordinates
-                        y = y_array[i]
-                        px = (x - self._display_x_min) * x_scale
-                        py = temp_height - (y - self._scale_y_min) * y_scale
-
-                        if (3 < py < temp_height-3) and (3 < px < temp_width-3):
-                            path.addEllipse(QtCore.QPointF(px, py), 3, 3)
-
-                elif self._plot_style[line_name] == "r":
-                    # draw rectangles
-                    for i, x in enumerate(x_array):
-                        # skip the selected index
-                        if i == selected_index:
-                            continue
-
-                        # calculate screen coordinates
-                        y = y_array[i]
-                        px = (x - self._display_x_min) * x_scale
-                        py = temp_height - (y - self._scale_y_min) * y_scale
-
-                        if (3 < py < temp_height-3) and (3 < px < temp_width-3):
-                            path.addRect(px - 3, py - 3, 6, 6)
-
-                elif self._plot_style[line_name] == "t":
-                    # draw triangles
-                    for i, x in enumerate(x_array):
-                        # skip the selected index
-                        if i == selected_index:
-                            continue
-
-                        # calculate screen coordinates
-                        y = y_array[i]
-                        px = (x - self._display_x_min) * x_scale
-                        py = temp_height - (y - self._scale_y_min) * y_scale
-
-                        if (3 < py < temp_height-3) and (3 < px < temp_width-3):
-                            path.moveTo(px, py-3)
-                            path.lineTo(px-3, py+3)
-                            path.lineTo(px+3, py+3)
-                            path.lineTo(px, py-3)
-
-                elif self._plot_style[line_name] == "+":
-                    # draw +
-                    for i, x in enumerate(x_array):
-                        # skip the selected index
-                        if i == selected_index:
-                            continue
-
-                        # calculate screen coordinates
-                        y = y_array[i]
-                        px = (x - self._display_x_min) * x_scale
-                        py = temp_height - (y - self._scale_y_min) * y_scale
-
-                        if (3 < py < temp_height-3) and (3 < px < temp_width-3):
-                            path.moveTo(px, py-3)
-                            path.lineTo(px, py+3)
-                            path.moveTo(px-3, py)
-                            path.lineTo(px+3, py)
-
-                elif self._plot_style[line_name] == "*":
-                    # draw *
-                    for i, x in enumerate(x_array):
-                        # skip the selected index
-                        if i == selected_index:
-                            continue
-
-                        # calculate screen coordinates
-                        y = y_array[i]
-                        px = (x - self._display_x_min) * x_scale
-                        py = temp_height - (y - self._scale_y_min) * y_scale
-
-                        if (3 < py < temp_height-3) and (3 < px < temp_width-3):
-                            path.moveTo(px, py)
-                            path.lineTo(px, py-3)
-                            path.moveTo(px, py)
-                            path.lineTo(px-3, py)
-                            path.moveTo(px, py)
-                            path.lineTo(px+3, py)
-                            path.moveTo(px, py)
-                            path.lineTo(px+3, py+3)
-                            path.moveTo(px, py)
-                            path.lineTo(px-3, py+3)
+                # skip the selected point
+                if 0 <= skip_index < visible.size:
+                    visible[skip_index] = False
 
+                if isinstance(line.sprite, QtGui.QPixmap):
+                    painter.drawPixmapFragments(pixmap_fragments(px[visible], py[visible], line.sprite), line.sprite)
                 else:
-                    # draw x
-                    for i, x in enumerate(x_array):
-                        # skip the selected index
-                        if i == selected_index:
-                            continue
-
-                        # calculate screen coordinates
-                        y = y_array[i]
-                        px = (x - self._display_x_min) * x_scale
-                        py = temp_height - (y - self._scale_y_min) * y_scale
-
-                        if (3 < py < temp_height-3) and (3 < px < temp_width-3):
-                            path.moveTo(px-3, py-3)
-                            path.lineTo(px+3, py+3)
-                            path.moveTo(px-3, py+3)
-                            path.lineTo(px+3, py-3)
+                    draw_sprite_images(painter, px[visible], py[visible], line.sprite)
 
             # draw the line
             painter.drawPath(path)
 
-            # draw the selected point
-            if selected_index != -1:
-                painter.setPen(selected_pen)
+        # show the rasterized lines
+        if frame.raster:
+            painter.drawImage(0, 0, image_from_buffer(buffer))
 
-                # plot the circle
-                px = (x_array[selected_index] - self._display_x_min) * x_scale
-                py = temp_height - (y_array[selected_index] - self._scale_y_min) * y_scale
+        # draw the selected points
+        painter.setPen(selected_pen)
+        for line in frame.lines:
+            if line.selected is not None:
+                px = (line.selected[0] - frame.x_min) * x_scale
+                py = temp_height - (line.selected[1] - frame.y_min) * y_scale
 
                 if (3 < py < temp_height-3) and (3 < px < temp_width-3):
                     painter.drawEllipse(QtCore.QPointF(px, py), 3, 3)
@@ -998,10 +1692,10 @@ class ICGraph(ICBaseWidget):
         pen.setJoinStyle(Qt.RoundJoin)
 
         # draw y limit lines
-        for marker_name in self._y_marker_lines:
-            pen.setColor(self._y_marker_line_colors[marker_name])
+        for marker_name, marker_y, marker_color in frame.y_markers:
+            pen.setColor(marker_color)
             painter.setPen(pen)
-            y_pos = temp_height - (self._y_marker_lines[marker_name] - self._scale_y_min) * y_scale
+            y_pos = temp_height - (marker_y - frame.y_min) * y_scale
             painter.drawLine(QtCore.QPointF(0, y_pos), QtCore.QPointF(temp_width, y_pos))
 
             y_text_pos = y_pos - (ICDisplayConfig.GeneralTextSize + 5)
@@ -1014,16 +1708,15 @@ class ICGraph(ICBaseWidget):
         # draw the base line
         pen.setColor(ICDisplayConfig.LinearGaugeRulerColor)
         painter.setPen(pen)
-        y_pos = temp_height - (self._base_level - self._scale_y_min) * y_scale
+        y_pos = temp_height - (frame.base_level - frame.y_min) * y_scale
         painter.drawLine(QtCore.QPointF(0, y_pos), QtCore.QPointF(temp_width, y_pos))
 
         # draw x range lines
-        for marker_name in self._x_marker_lines:
-            x_world = self._x_marker_lines[marker_name]
-            if self._display_x_min < x_world < self._display_x_max:
-                pen.setColor(self._x_marker_line_colors[marker_name])
+        for marker_name, x_world, marker_color in frame.x_markers:
+            if frame.x_min < x_world < frame.x_max:
+                pen.setColor(marker_color)
                 painter.setPen(pen)
-                x_pos = (x_world - self._display_x_min) * x_scale
+                x_pos = (x_world - frame.x_min) * x_scale
                 painter.drawLine(QtCore.QPointF(x_pos, 0), QtCore.QPointF(x_pos, temp_height))
 
                 x_text_pos = x_pos + 3
@@ -1035,6 +1728,59 @@ class ICGraph(ICBaseWidget):
                 rect = QtCore.QRectF(x_text_pos, 3, 60, ICDisplayConfig.GeneralTextSize + 5)
                 painter.drawText(rect, align, marker_name)
 
+    """
+        Completed frame of the render worker. the previous front buffer becomes the spare back buffer
+    """
+    def _on_frame_rendered(self, image: QtGui.QImage) -> None:
+        if not self._threaded:
+            return
+        if self._front_buffer is not None:
+            self._spare_buffer = self._front_buffer
+        self._front_buffer = image
+
+        # show the frame without taking a new snapshot
+        super(ICGraph, self).update()
+
+    ###################################################
+    #    Override event handlers
+    ###################################################
+    """
+        Request a repaint. the next paint takes a new snapshot for the render worker
+    """
+    def update(self, *args) -> None:
+        self._frame_stale = True
+        super(ICGraph, self).update(*args)
+
+    """
+        Draw the plot
+        with background rendering a snapshot is submitted to the render worker when the graph
+        has changed, and the latest completed frame is shown
+    """
+    def paintEvent(self, e):
+        if self.state in (ICWidgetState.Hidden, ICWidgetState.Transparent):
+            return
+
+        painter = QtGui.QPainter(self)
+
+        # window dimensions
+        temp_width = painter.device().width()
+        temp_height = painter.device().height()
+
+        if not self._threaded:
+            self._paint_frame(painter, self._create_frame(temp_width, temp_height, False))
+            return
+
+        if self._frame_stale or self._frame_size != (temp_width, temp_height):
+            self._frame_stale = False
+            self._frame_size = (temp_width, temp_height)
+            job = ICRenderJob(ICGraph._paint_frame, self._create_frame(temp_width, temp_height, True), temp_width, temp_height,
+                              self._spare_buffer, ICGraph._on_frame_rendered)
+            self._spare_buffer = None
+            ICRenderWorker.instance().submit(self, job)
+
+        if self._front_buffer is not None:
+            painter.drawImage(0, 0, self._front_buffer)
+
 
 class ICPlotWidget(ICLinearAxisContainer):
     """
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 16 2026
+
+@author: Prosenjit
+
+Background rendering of widgets that are expensive to draw.
+A widget takes a snapshot of everything it draws and submits it together with a paint
+function. The worker thread paints the snapshot into a back buffer image and hands the
+completed image back in the GUI thread, which the widget then shows from its paintEvent. Only the latest
+snapshot of a widget is kept while the worker is busy, so frames that would already be
+stale when drawn are dropped instead of queued.
+
+Enable background rendering of a graph with:
+    graph.threaded = True
+"""
+
+import threading
+import traceback
+import weakref
+from typing import Callable
+from PyQt6 import QtCore, QtGui
+from PyQt6.QtCore import pyqtSignal, pyqtSlot
+
+
+class ICRenderJob:
+    """
+    Snapshot of a widget waiting to be painted
+    """
+    def __init__(self, paint: Callable, frame, width: int, height: int, buffer: QtGui.QImage, deliver: Callable):
+        # paint(painter, frame) draws the snapshot
+        self.paint: Callable = paint
+        self.frame = frame
+
+        # size of the image and an image that may be reused for it
+        self.width: int = width
+        self.height: int = height
+        self.buffer: QtGui.QImage = buffer
+
+        # deliver(widget, image) passes the completed image back. called in the GUI thread.
+        # the job holds no reference to the widget, so a deleted widget is not kept alive
+        self.deliver: Callable = deliver
+
+
+class ICRenderWorker(QtCore.QObject):
+    """
+    Thread painting the submitted snapshots into images, one widget at a time in the order of submission.
+    The completed images are delivered through a queued signal, so the widgets are only touched in the GUI thread.
+    """
+    # widget reference, job and completed image, emitted in the worker thread
+    _frame_ready = pyqtSignal(object, object, object)
+
+    # worker shared by all the widgets
+    _instance = None
+
+    def __init__(self, *args, **kwargs):
+        super(ICRenderWorker, self).__init__(*args, **kwargs)
+
+        # latest job of every widget waiting to be painted, keyed by a weak reference to the widget
+        self._pending: dict[weakref.ref, ICRenderJob] = {}
+        self._condition: threading.Condition = threading.Condition()
+        self._thread: threading.Thread = None
+
+        # statistics
+        self._submitted: int = 0
+        self._rendered: int = 0
+        self._dropped: int = 0
+
+        self._frame_ready.connect(self._on_frame_ready)
+
+    # worker shared by all the widgets. created on first use in the GUI thread
+    @classmethod
+    def instance(cls) -> 'ICRenderWorker':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    ########################################################
+    # properties
+    ########################################################
+    # number of jobs waiting to be painted
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    # statistics of the worker
+    #   submitted   : snapshots submitted by the widgets
+    #   rendered    : snapshots painted and delivered
+    #   dropped     : snapshots replaced by a newer one of the same widget before being painted
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {"submitted": self._submitted,
+                    "rendered": self._rendered,
+                    "dropped": self._dropped}
+
+    ########################################################
+    # functions
+    ########################################################
+    # queue a snapshot of a widget. a waiting snapshot of the same widget is dropped and its image reused
+    def submit(self, widget: QtCore.QObject, job: ICRenderJob) -> None:
+        key = weakref.ref(widget)
+        with self._condition:
+            self._submitted += 1
+            previous = self._pending.pop(key, None)
+            if previous is not None:
+                self._dropped += 1
+                if job.buffer is None:
+                    job.buffer = previous.buffer
+            self._pending[key] = job
+            self._condition.notify()
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._render_loop, name="ICRenderWorker", daemon=True)
+            self._thread.start()
+
+    ########################################################
+    # helper functions
+    ########################################################
+    # paint a job into its back buffer
+    @staticmethod
+    def _render(job: ICRenderJob) -> QtGui.QImage:
+        image = job.buffer
+        if image is None or image.width() != job.width or image.height() != job.height:
+            image = QtGui.QImage(job.width, job.height, QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.fill(0)
+
+        painter = QtGui.QPainter(image)
+        try:
+            job.paint(painter, job.frame)
+        finally:
+            painter.end()
+        return image
+
+    # worker thread. paints the waiting jobs in the order they were submitted
+    def _render_loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                key = next(iter(self._pending))
+                job = self._pending.pop(key)
+
+            try:
+                image = self._render(job)
+            except Exception:
+                # keep the worker running for the other widgets
+                traceback.print_exc()
+                continue
+
+            with self._condition:
+                self._rendered += 1
+            self._frame_ready.emit(key, job, image)
+
+    # pass a completed image to its widget. runs in the GUI thread
+    @pyqtSlot(object, object, object)
+    def _on_frame_ready(self, key: weakref.ref, job: ICRenderJob, image: QtGui.QImage) -> None:
+        widget = key()
+        if widget is None:
+            # the widget has been garbage collected
+            return
+
+        try:
+            job.deliver(widget, image)
+        except RuntimeError:
+            # the widget has been deleted
+            pass
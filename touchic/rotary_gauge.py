@@ -97,6 +97,11 @@ class ICRotaryGauge(ICBaseWidget):
         self.clickable = True
         self.focusable = True
 
+        # cached layers of the label area and of the gauge borders, target and alarm lines
+        self._background_layer: Union[QtGui.QPixmap, None] = None
+        self._background_layer_key: Union[tuple, None] = None
+        self._overlay_layers: dict[tuple, QtGui.QPixmap] = {}
+
         # set size of the text label
         self.size_hint = (ICDisplayConfig.RotaryGaugeWidth, ICDisplayConfig.RotaryGaugeHeight)
 
@@ -112,7 +117,7 @@ class ICRotaryGauge(ICBaseWidget):
     @gauge_range_min.setter
     def gauge_range_min(self, min_val: float) -> None:
         self._gauge_range_min = min_val
-        self.update()
+        self.invalidate_layers()
 
     # get the maximum limit of the gauge bar
     @property
@@ -123,7 +128,7 @@ class ICRotaryGauge(ICBaseWidget):
     @gauge_range_max.setter
     def gauge_range_max(self, max_val: float) -> None:
         self._gauge_range_max = max_val
-        self.update()
+        self.invalidate_layers()
 
     # get the name of the parameter
     @property
@@ -134,7 +139,7 @@ class ICRotaryGauge(ICBaseWidget):
     @name.setter
     def name(self, nm: str) -> None:
         self._name = nm
-        self.update()
+        self.invalidate_layers()
 
     # get the parameter value
     @property
@@ -170,7 +175,7 @@ class ICRotaryGauge(ICBaseWidget):
             if val < self._alarm_lower_level:
                 self.alarm_activated = True
 
-        self.update()
+        self.request_update()
 
     # get the name of the parameter
     @property
@@ -181,7 +186,7 @@ class ICRotaryGauge(ICBaseWidget):
     @unit.setter
     def unit(self, nm: str) -> None:
         self._name = nm
-        self.update()
+        self.invalidate_layers()
 
     @property
     def upper_alarm(self) -> Union[float, None]:
@@ -208,7 +213,7 @@ class ICRotaryGauge(ICBaseWidget):
                 self.alarm_activated = True
                 self.changed.emit(self._value)
 
-            self.update()
+            self.invalidate_layers()
 
     @property
     def lower_alarm(self) -> Union[float, None]:
@@ -235,7 +240,7 @@ class ICRotaryGauge(ICBaseWidget):
                 self.alarm_activated = True
                 self.changed.emit(self._value)
 
-            self.update()
+            self.invalidate_layers()
 
     @property
     def target_value(self) -> Union[float, None]:
@@ -247,7 +252,7 @@ class ICRotaryGauge(ICBaseWidget):
     def target_value(self, val: float) -> None:
         self._target_tracking = True
         self._target_value = val
-        self.update()
+        self.invalidate_layers()
 
     # text format
     @property
@@ -267,7 +272,7 @@ class ICRotaryGauge(ICBaseWidget):
     @name_text_size.setter
     def name_text_size(self, sz: int) -> None:
         self._name_text_size = sz
-        self.update()
+        self.invalidate_layers()
 
     # text size
     @property
@@ -277,7 +282,7 @@ class ICRotaryGauge(ICBaseWidget):
     @value_text_size.setter
     def value_text_size(self, sz: int) -> None:
         self._value_text_size = sz
-        self.update()
+        self.invalidate_layers()
 
     # text size
     @property
@@ -287,7 +292,7 @@ class ICRotaryGauge(ICBaseWidget):
     @unit_text_size.setter
     def unit_text_size(self, sz: int) -> None:
         self._unit_text_size = sz
-        self.update()
+        self.invalidate_layers()
 
     # get the background container color of the bar
     @property
@@ -299,7 +304,7 @@ class ICRotaryGauge(ICBaseWidget):
     def container_colors(self, clrs: tuple[QtGui.QColor, QtGui.QColor]) -> None:
         self._container_color_light = clrs[0]
         self._container_color_dark = clrs[1]
-        self.update()
+        self.invalidate_layers()
 
     # get the normal gauge color
     @property
@@ -343,7 +348,7 @@ class ICRotaryGauge(ICBaseWidget):
     @target_color.setter
     def target_color(self, clr: QtGui.QColor) -> None:
         self._target_color = clr
-        self.update()
+        self.invalidate_layers()
 
     # target color
     @property
@@ -353,7 +358,7 @@ class ICRotaryGauge(ICBaseWidget):
     @target_color.setter
     def target_color(self, clr: QtGui.QColor) -> None:
         self._alarm_color = clr
-        self.update()
+        self.invalidate_layers()
 
     ########################################################
     # functions
@@ -385,20 +390,23 @@ class ICRotaryGauge(ICBaseWidget):
         self._cycle_min_tracking = False
 
     ########################################################
-    # overrides and event handlers
+    # helper functions
     ########################################################
-    # redraw the widget
-    def redraw(self, painter: QtGui.QPainter, event) -> None:
-        # if the button is hidden then there is nothing to draw
-        if self._state == ICWidgetState.Hidden:
-            return
-
-        ########################################
-        # draw the label area
-        ########################################
-        temp_width = painter.device().width()
-        temp_height = painter.device().height()
+    # radial line across the gauge ring at the angle of a value
+    def _ring_marker_path(self, val: float, rect: QtCore.QRectF, half_width: float, half_height: float, scale: float) -> QtGui.QPainterPath:
+        theta = 360 * (val - self._gauge_range_min) / (self._gauge_range_max - self._gauge_range_min)
 
+        # calculate the path
+        path = QtGui.QPainterPath()
+        path.arcMoveTo(rect, 90 - theta)
+        pos = path.currentPosition()
+        new_x = half_width + (pos.x() - half_width) * scale
+        new_y = half_height + (pos.y() - half_height) * scale
+        path.lineTo(new_x, new_y)
+        return path
+
+    # paint the label area, name and unit. these only change with the size, state and properties
+    def _draw_background(self, painter: QtGui.QPainter, temp_width: float, temp_height: float) -> None:
         # define the rectangle to draw the button
         rect = QtCore.QRectF(3, 3, temp_width - 6, temp_height - 6)
 
@@ -436,199 +444,227 @@ class ICRotaryGauge(ICBaseWidget):
         # draw the rectangle
         painter.drawPath(path)
 
-        ########################################
         # draw the text only if the button is visible
+        if self._state not in (ICWidgetState.VisibleEnabled, ICWidgetState.VisibleDisabled):
+            return
+
+        # adjust the coordinate system for the border
+        painter.translate(3, 3)
+        temp_height -= 6
+        temp_width -= 6
+
         ########################################
-        if self._state in (ICWidgetState.VisibleEnabled, ICWidgetState.VisibleDisabled):
-            # adjust the coordinate system for the border
-            painter.translate(3, 3)
-            temp_height -= 6
-            temp_width -= 6
-
-            ########################################
-            # draw the name and unit
-            ########################################
-            fnt = painter.font()
-            fnt.setBold(True)
-            fnt.setPixelSize(self._name_text_size)
-            painter.setFont(fnt)
-            pen.setColor(self._name_color)
-            painter.setPen(pen)
-            half_width = 0.5 * temp_width
-            rect = QtCore.QRectF(0, temp_height - (self._name_text_size + 5), half_width, self._name_text_size + 5)
-            painter.drawText(rect, Qt.AlignRight, str(self._name))
-
-            # draw the unit
-            fnt.setPixelSize(self._unit_text_size)
-            painter.setFont(fnt)
-            rect = QtCore.QRectF(half_width, temp_height - (self._unit_text_size + 5), half_width, self._unit_text_size + 5)
-            painter.drawText(rect, Qt.AlignLeft, " ({})".format(self._unit))
-
-            # adjust for remaining height
-            temp_height -= max(self._name_text_size, self._unit_text_size)
-
-            ########################################
-            # draw the value
-            ########################################
-            fnt.setPixelSize(self._value_text_size)
-            painter.setFont(fnt)
-            pen.setColor(self._value_color)
-            painter.setPen(pen)
+        # draw the name and unit
+        ########################################
+        fnt = painter.font()
+        fnt.setBold(True)
+        fnt.setPixelSize(self._name_text_size)
+        painter.setFont(fnt)
+        pen.setColor(self._name_color)
+        painter.setPen(pen)
+        half_width = 0.5 * temp_width
+        rect = QtCore.QRectF(0, temp_height - (self._name_text_size + 5), half_width, self._name_text_size + 5)
+        painter.drawText(rect, Qt.AlignRight, str(self._name))
+
+        # draw the unit
+        fnt.setPixelSize(self._unit_text_size)
+        painter.setFont(fnt)
+        rect = QtCore.QRectF(half_width, temp_height - (self._unit_text_size + 5), half_width, self._unit_text_size + 5)
+        painter.drawText(rect, Qt.AlignLeft, " ({})".format(self._unit))
+
+    # paint the gauge borders, target and alarm lines. these only change with the size, the value box and properties
+    def _draw_overlay(self, painter: QtGui.QPainter, half_width: float, half_height: float, half_box_length: float,
+                      bigger_box_half_length: float) -> None:
+        rect = QtCore.QRectF(half_width - half_box_length, half_height - half_box_length, 2 * half_box_length, 2 * half_box_length)
+        rect_big = QtCore.QRectF(half_width - bigger_box_half_length, half_height - bigger_box_half_length,
+                                 2 * bigger_box_half_length, 2 * bigger_box_half_length)
+        scale = bigger_box_half_length / half_box_length
+
+        # draw gauge border
+        pen = QtGui.QPen(self._container_border_color)
+        pen.setWidth(1)
+        pen.setCapStyle(Qt.RoundCap)
+        pen.setJoinStyle(Qt.RoundJoin)
+        painter.setPen(pen)
+        painter.setBrush(QtGui.QBrush())
+        painter.drawEllipse(rect)
+        painter.drawEllipse(rect_big)
 
-            # calculate dimension for the text and rotary gauge
-            font_matrices = QtGui.QFontMetrics(fnt)
-            text_size = font_matrices.horizontalAdvance(str(self._value))
-            box_length = sqrt(2) * (max(text_size, self._value_text_size + 5) + 5)
-
-            # draw the value
-            rect = QtCore.QRectF(10, (temp_height - (self._value_text_size + 5))/2, temp_width - 20, self._value_text_size + 5)
-            painter.drawText(rect, Qt.AlignCenter, self._text_format.format(self._value))
-
-            ########################################
-            # main gauge
-            ########################################
-            # create the gradient
-            half_height = 0.5 * temp_height
-            gradient = QtGui.QConicalGradient(half_width, half_height, 90)
-            if self.alarm_activated:
-                gradient.setColorAt(0, self._gauge_color_alarm_light)
-                gradient.setColorAt(1, self._gauge_color_alarm_dark)
-            else:
-                gradient.setColorAt(0, self._gauge_color_normal_light)
-                gradient.setColorAt(1, self._gauge_color_normal_dark)
-
-            painter.setBrush(gradient)
-            pen.setBrush(gradient)
+        ########################################
+        # target line
+        ########################################
+        if self._target_tracking:
+            pen.setColor(self._target_color)
+            pen.setWidth(2)
             painter.setPen(pen)
+            painter.drawPath(self._ring_marker_path(self._target_value, rect, half_width, half_height, scale))
 
-            # calculate the path
-            path = QtGui.QPainterPath()
-            path.setFillRule(Qt.OddEvenFill)
-            theta = 360 * (self._value - self._gauge_range_min) / (self._gauge_range_max - self._gauge_range_min)
-
-            # smaller radius
-            half_box_length = box_length/2
-            rect = QtCore.QRectF(half_width - half_box_length, half_height - half_box_length, box_length, box_length)
-            path.moveTo(half_width, half_height - half_box_length)
-            path.arcTo(rect, 90, -theta)
-            pos = path.currentPosition()
-
-            # bigger radius
-            bigger_box_half_length = min(half_width, half_height) - 10
-            rect_big = QtCore.QRectF(half_width - bigger_box_half_length, half_height - bigger_box_half_length,
-                                     2 * bigger_box_half_length, 2 * bigger_box_half_length)
-            new_x = half_width + (pos.x() - half_width) * bigger_box_half_length / half_box_length
-            new_y = half_height + (pos.y() - half_height) * bigger_box_half_length / half_box_length
-            path.lineTo(new_x, new_y)
-            path.arcTo(rect_big, 90 - theta, theta)
-            path.closeSubpath()
-
-            # paint the gauge
-            painter.drawPath(path)
-
-            # draw gauge border
-            pen = QtGui.QPen(self._container_border_color)
-            pen.setWidth(1)
-            pen.setCapStyle(Qt.RoundCap)
-            pen.setJoinStyle(Qt.RoundJoin)
-            painter.setPen(pen)
+        ########################################
+        # upper and lower alarm lines
+        ########################################
+        pen.setColor(self._alarm_color)
+        pen.setWidth(2)
+        painter.setPen(pen)
+
+        if self._alarm_lower_level_set:
+            painter.drawPath(self._ring_marker_path(self._alarm_lower_level, rect, half_width, half_height, scale))
+
+        if self._alarm_upper_level_set:
+            painter.drawPath(self._ring_marker_path(self._alarm_upper_level, rect, half_width, half_height, scale))
+
+    ########################################################
+    # overrides and event handlers
+    ########################################################
+    # drop the cached layers
+    def on_layers_invalidated(self) -> None:
+        self._background_layer_key = None
+        self._overlay_layers.clear()
+
+    # redraw the widget
+    # the static parts are painted from cached layers and only the value and the gauge are painted every time
+    def redraw(self, painter: QtGui.QPainter, event) -> None:
+        # if the button is hidden then there is nothing to draw
+        if self._state == ICWidgetState.Hidden:
+            return
+
+        ########################################
+        # draw the label area
+        ########################################
+        widget_width = temp_width = painter.device().width()
+        widget_height = temp_height = painter.device().height()
+
+        if self._layer_caching:
+            layer_key = (temp_width, temp_height, self._state, self.in_focus, self.background_color.rgba())
+            if self._background_layer_key != layer_key:
+                self._background_layer_key = layer_key
+                self._background_layer = self.create_layer(temp_width, temp_height)
+                layer_painter = self.begin_layer_painter(self._background_layer, painter)
+                self._draw_background(layer_painter, temp_width, temp_height)
+                layer_painter.end()
+            painter.drawPixmap(0, 0, self._background_layer)
+        else:
+            painter.save()
+            self._draw_background(painter, temp_width, temp_height)
+            painter.restore()
+
+        ########################################
+        # draw the value and gauge only if the button is visible
+        ########################################
+        if self._state not in (ICWidgetState.VisibleEnabled, ICWidgetState.VisibleDisabled):
+            return
+
+        # adjust the coordinate system for the border
+        painter.translate(3, 3)
+        temp_height -= 6
+        temp_width -= 6
+        half_width = 0.5 * temp_width
+
+        # adjust for the name and unit
+        temp_height -= max(self._name_text_size, self._unit_text_size)
+
+        ########################################
+        # draw the value
+        ########################################
+        fnt = painter.font()
+        fnt.setBold(True)
+        fnt.setPixelSize(self._value_text_size)
+        painter.setFont(fnt)
+
+        pen = QtGui.QPen(self._value_color)
+        pen.setWidth(3 if self.in_focus else 1)
+        pen.setCapStyle(Qt.RoundCap)
+        pen.setJoinStyle(Qt.RoundJoin)
+        painter.setPen(pen)
+
+        # calculate dimension for the text and rotary gauge
+        font_matrices = QtGui.QFontMetrics(fnt)
+        text_size = font_matrices.horizontalAdvance(str(self._value))
+        box_length = sqrt(2) * (max(text_size, self._value_text_size + 5) + 5)
+
+        # draw the value
+        rect = QtCore.QRectF(10, (temp_height - (self._value_text_size + 5))/2, temp_width - 20, self._value_text_size + 5)
+        painter.drawText(rect, Qt.AlignCenter, self._text_format.format(self._value))
+
+        ########################################
+        # main gauge
+        ########################################
+        # create the gradient
+        half_height = 0.5 * temp_height
+        gradient = QtGui.QConicalGradient(half_width, half_height, 90)
+        if self.alarm_activated:
+            gradient.setColorAt(0, self._gauge_color_alarm_light)
+            gradient.setColorAt(1, self._gauge_color_alarm_dark)
+        else:
+            gradient.setColorAt(0, self._gauge_color_normal_light)
+            gradient.setColorAt(1, self._gauge_color_normal_dark)
+
+        painter.setBrush(gradient)
+        pen.setBrush(gradient)
+        painter.setPen(pen)
+
+        # calculate the path
+        path = QtGui.QPainterPath()
+        path.setFillRule(Qt.OddEvenFill)
+        theta = 360 * (self._value - self._gauge_range_min) / (self._gauge_range_max - self._gauge_range_min)
+
+        # smaller radius
+        half_box_length = box_length/2
+        rect = QtCore.QRectF(half_width - half_box_length, half_height - half_box_length, box_length, box_length)
+        path.moveTo(half_width, half_height - half_box_length)
+        path.arcTo(rect, 90, -theta)
+        pos = path.currentPosition()
+
+        # bigger radius
+        bigger_box_half_length = min(half_width, half_height) - 10
+        rect_big = QtCore.QRectF(half_width - bigger_box_half_length, half_height - bigger_box_half_length,
+                                 2 * bigger_box_half_length, 2 * bigger_box_half_length)
+        new_x = half_width + (pos.x() - half_width) * bigger_box_half_length / half_box_length
+        new_y = half_height + (pos.y() - half_height) * bigger_box_half_length / half_box_length
+        path.lineTo(new_x, new_y)
+        path.arcTo(rect_big, 90 - theta, theta)
+        path.closeSubpath()
+
+        # paint the gauge
+        painter.drawPath(path)
+
+        ########################################
+        # min max lines
+        ########################################
+        pen = QtGui.QPen(self._min_max_color)
+        pen.setWidth(2)
+        pen.setCapStyle(Qt.RoundCap)
+        pen.setJoinStyle(Qt.RoundJoin)
+        painter.setPen(pen)
+        scale = bigger_box_half_length / half_box_length
+
+        if self._cycle_min_tracking:
+            painter.drawPath(self._ring_marker_path(self._cycle_min, rect, half_width, half_height, scale))
+
+        if self._cycle_max_tracking:
+            painter.drawPath(self._ring_marker_path(self._cycle_max, rect, half_width, half_height, scale))
+
+        ########################################
+        # gauge borders, target and alarm lines
+        ########################################
+        if not self._layer_caching:
             painter.setBrush(QtGui.QBrush())
-            painter.drawEllipse(rect)
-            painter.drawEllipse(rect_big)
-
-            ########################################
-            # target line
-            ########################################
-            if self._target_tracking:
-                theta = 360 * (self._target_value - self._gauge_range_min) / (self._gauge_range_max - self._gauge_range_min)
-
-                # calculate the path
-                path = QtGui.QPainterPath()
-                path.arcMoveTo(rect, 90 - theta)
-                pos = path.currentPosition()
-                new_x = half_width + (pos.x() - half_width) * bigger_box_half_length / half_box_length
-                new_y = half_height + (pos.y() - half_height) * bigger_box_half_length / half_box_length
-                path.lineTo(new_x, new_y)
-
-                # set up the pen
-                pen.setColor(self._target_color)
-                pen.setWidth(2)
-                painter.setPen(pen)
-                painter.drawPath(path)
-
-            ########################################
-            # min max lines
-            ########################################
-            if self._cycle_min_tracking:
-                theta = 360 * (self._cycle_min - self._gauge_range_min) / (self._gauge_range_max - self._gauge_range_min)
-
-                # calculate the path
-                path = QtGui.QPainterPath()
-                path.arcMoveTo(rect, 90 - theta)
-                pos = path.currentPosition()
-                new_x = half_width + (pos.x() - half_width) * bigger_box_half_length / half_box_length
-                new_y = half_height + (pos.y() - half_height) * bigger_box_half_length / half_box_length
-                path.lineTo(new_x, new_y)
-
-                # set up the pen
-                pen.setColor(self._min_max_color)
-                pen.setWidth(2)
-                painter.setPen(pen)
-                painter.drawPath(path)
-
-            if self._cycle_max_tracking:
-                theta = 360 * (self._cycle_max - self._gauge_range_min) / (self._gauge_range_max - self._gauge_range_min)
-
-                # calculate the path
-                path = QtGui.QPainterPath()
-                path.arcMoveTo(rect, 90 - theta)
-                pos = path.currentPosition()
-                new_x = half_width + (pos.x() - half_width) * bigger_box_half_length / half_box_length
-                new_y = half_height + (pos.y() - half_height) * bigger_box_half_length / half_box_length
-                path.lineTo(new_x, new_y)
-
-                # set up the pen
-                pen.setColor(self._min_max_color)
-                pen.setWidth(2)
-                painter.setPen(pen)
-                painter.drawPath(path)
-
-            ########################################
-            # upper and lower alarm lines
-            ########################################
-            if self._alarm_lower_level_set:
-                theta = 360 * (self._alarm_lower_level - self._gauge_range_min) / (self._gauge_range_max - self._gauge_range_min)
-
-                # calculate the path
-                path = QtGui.QPainterPath()
-                path.arcMoveTo(rect, 90 - theta)
-                pos = path.currentPosition()
-                new_x = half_width + (pos.x() - half_width) * bigger_box_half_length / half_box_length
-                new_y = half_height + (pos.y() - half_height) * bigger_box_half_length / half_box_length
-                path.lineTo(new_x, new_y)
-
-                # set up the pen
-                pen.setColor(self._alarm_color)
-                pen.setWidth(2)
-                painter.setPen(pen)
-                painter.drawPath(path)
-
-            if self._alarm_upper_level_set:
-                theta = 360 * (self._alarm_upper_level - self._gauge_range_min) / (self._gauge_range_max - self._gauge_range_min)
-
-                # calculate the path
-                path = QtGui.QPainterPath()
-                path.arcMoveTo(rect, 90 - theta)
-                pos = path.currentPosition()
-                new_x = half_width + (pos.x() - half_width) * bigger_box_half_length / half_box_length
-                new_y = half_height + (pos.y() - half_height) * bigger_box_half_length / half_box_length
-                path.lineTo(new_x, new_y)
-
-                # set up the pen
-                pen.setColor(self._alarm_color)
-                pen.setWidth(2)
-                painter.setPen(pen)
-                painter.drawPath(path)
+            self._draw_overlay(painter, half_width, half_height, half_box_length, bigger_box_half_length)
+            return
+
+        # the value box changes with the width of the value text. a few sizes are kept
+        layer_key = (widget_width, widget_height, box_length)
+        if layer_key not in self._overlay_layers:
+            if len(self._overlay_layers) >= ICDisplayConfig.RotaryGaugeLayerCount:
+                self._overlay_layers.clear()
+
+            layer = self.create_layer(widget_width, widget_height)
+            layer_painter = self.begin_layer_painter(layer, painter)
+            layer_painter.translate(3, 3)
+            self._draw_overlay(layer_painter, half_width, half_height, half_box_length, bigger_box_half_length)
+            layer_painter.end()
+            self._overlay_layers[layer_key] = layer
+
+        painter.drawPixmap(-3, -3, self._overlay_layers[layer_key])
 
     def paintEvent(self, e):
         painter = QtGui.QPainter(self)
@@ -87,21 +87,22 @@ class ICTextLabel(ICBaseWidget):
         # strict type checking while setting
         if self.__type == ICTextLabelType.LabelText:
             self._value = str(val)
-            # add to the history and update the display
-            self.append_history(self._value, 0)
-            self.update()
+            # add to the history and update the display.
+            # the text is kept in the bounded text table instead of the event code table
+            self.append_history_text(self._value)
+            self.request_update()
 
         elif (self.__type == ICTextLabelType.LabelInteger) and (type(val) in (int, float)):
             self._value = int(val)
             # add to the history and update the display
             self.append_history("", float(self._value))
-            self.update()
+            self.request_update()
 
         elif type(val) in (int, float):
             self._value = float(val)
             # add to the history and update the display
             self.append_history("", self._value)
-            self.update()
+            self.request_update()
 
     # text format to convert float to str
     def text_format(self) -> str:
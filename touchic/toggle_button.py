@@ -232,7 +232,7 @@ class ICToggleButton(ICBasicButton):
             painter.setFont(fnt)
 
             # draw the text based on the LED position
-            if self._led_position in (ICWidgetPosition.Bottom | ICWidgetPosition.Right):
+            if self._position in (ICWidgetPosition.Bottom | ICWidgetPosition.Right):
                 rect = QtCore.QRect(10, 10, tmp_width - 20, self._label_text_size + 3)
                 painter.drawText(rect, Qt.AlignLeft, self._label)
             else:
@@ -243,11 +243,11 @@ class ICToggleButton(ICBasicButton):
             path = QtGui.QPainterPath()
             path.setFillRule(Qt.WindingFill)
 
-            if self._led_position == ICWidgetPosition.Bottom:
+            if self._position == ICWidgetPosition.Bottom:
                 rect = QtCore.QRectF(10, tmp_height - 25, tmp_width - 20, 15)
-            elif self._led_position == ICWidgetPosition.Top:
+            elif self._position == ICWidgetPosition.Top:
                 rect = QtCore.QRectF(10, 10, tmp_width - 20, 15)
-            elif self._led_position == ICWidgetPosition.Right:
+            elif self._position == ICWidgetPosition.Right:
                 rect = QtCore.QRectF(tmp_width-30, 10, 20, tmp_height-20)
             else:
                 rect = QtCore.QRectF(10, 10, 20, tmp_height - 20)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 16 2026
+
+@author: Prosenjit
+
+Thread safe value sources decoupling data acquisition from the display.
+Worker threads write samples to an ICValueSource at their own rate without locks or
+queued signals. Widgets bound to a source pull its newest value on the next frame of
+ICRefreshScheduler, so the UI runs at the display rate whatever the acquisition rate.
+
+Bind a gauge to a source written by a sensor thread with:
+    source = ICValueSource(history_size=1000)
+    gauge.bind_source(source)
+    ...
+    source.write(sensor.read())      # in the sensor thread
+"""
+
+import time
+import itertools
+import numpy as np
+
+
+class ICValueSource:
+    """
+    Latest value of a signal with an optional ring of the recent samples.
+    The latest sample is published as one immutable tuple (value, time, sequence), which is replaced
+    atomically, so readers never see a partly written sample and writers never wait for readers.
+    Samples are numbered in the order they are written. The ring history is meant for a single writer thread.
+    """
+    def __init__(self, value: float = 0.0, history_size: int = 0):
+        # numbers the samples. next() on the counter is atomic
+        self._counter = itertools.count(1)
+
+        # latest sample as (value, monotonic time in ns, sequence number)
+        self._latest: tuple[float, int, int] = (value, time.monotonic_ns(), 0)
+
+        # ring of the recent values and their times
+        self._history_values: np.ndarray = np.zeros(history_size)
+        self._history_times: np.ndarray = np.zeros(history_size, dtype=np.int64)
+
+    ########################################################
+    # properties
+    ########################################################
+    # newest value
+    @property
+    def value(self) -> float:
+        return self._latest[0]
+
+    # monotonic time of the newest value in nanoseconds
+    @property
+    def time_ns(self) -> int:
+        return self._latest[1]
+
+    # number of samples written. changes whenever a new sample is written
+    @property
+    def sequence(self) -> int:
+        return self._latest[2]
+
+    # number of samples kept in the history ring
+    @property
+    def history_size(self) -> int:
+        return self._history_values.size
+
+    ########################################################
+    # functions
+    ########################################################
+    # write a new sample. can be called from any thread
+    def write(self, value: float) -> None:
+        tm = time.monotonic_ns()
+        sequence = next(self._counter)
+
+        # the history is written before the sample is published
+        size = self._history_values.size
+        if size:
+            index = (sequence - 1) % size
+            self._history_values[index] = value
+            self._history_times[index] = tm
+
+        self._latest = (value, tm, sequence)
+
+    # newest sample as (value, monotonic time in ns, sequence number)
+    def read(self) -> tuple[float, int, int]:
+        return self._latest
+
+    # copy of the recent samples in chronological order as (times in ns, values).
+    # count limits the number of the latest samples returned
+    def history(self, count: int = None) -> tuple[np.ndarray, np.ndarray]:
+        size = self._history_values.size
+        sequence = self._latest[2]
+        available = min(sequence, size)
+        if count is not None:
+            available = min(available, count)
+
+        indices = np.arange(sequence - available, sequence) % size if size else np.empty(0, dtype=np.intp)
+        return self._history_times[indices], self._history_values[indices]
@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 16 2026
+
+@author: Prosenjit
+
+Array backed storage of the widget event history.
+Events are kept in a preallocated NumPy structured ring buffer holding a monotonic
+timestamp in nanoseconds, the instance id of the widget, an interned event code and
+the value. A buffer can belong to a single widget or be shared by several widgets.
+"""
+
+import time
+import threading
+from datetime import datetime
+from typing import Union
+import numpy as np
+from .display_config import ICDisplayConfig
+
+# record layout of a history event
+HistoryRecord = np.dtype([("time", np.int64), ("widget", np.int32), ("event", np.int32), ("value", np.float64)])
+
+# record layout of the event counts of the history registry
+HistoryCount = np.dtype([("widget", np.int32), ("interval", np.int64), ("count", np.int64)])
+
+# offset between the monotonic clock and the wall clock, used to convert timestamps to datetime
+_wall_clock_offset_ns: int = time.time_ns() - time.monotonic_ns()
+
+
+# monotonic timestamp in nanoseconds used for the history events
+def history_time_ns() -> int:
+    return time.monotonic_ns()
+
+
+# convert a history timestamp to a datetime
+def history_time_to_datetime(tm: int) -> datetime:
+    return datetime.fromtimestamp((int(tm) + _wall_clock_offset_ns) / 1e9)
+
+
+# convert a datetime to a history timestamp
+def datetime_to_history_time(tm: datetime) -> int:
+    return int(tm.timestamp() * 1e9) - _wall_clock_offset_ns
+
+
+class ICEventCodes:
+    """
+    Table of interned event names. Every distinct event name is stored once and referred to by its code.
+    """
+    _codes: dict[str, int] = {}
+    _names: list[str] = []
+
+    # code of the event name. new names are added to the table
+    @classmethod
+    def code(cls, name: str) -> int:
+        code = cls._codes.get(name)
+        if code is None:
+            code = len(cls._names)
+            cls._codes[name] = code
+            cls._names.append(name)
+        return code
+
+    # code of the event name or -1 if the name has never been used
+    @classmethod
+    def find(cls, name: str) -> int:
+        return cls._codes.get(name, -1)
+
+    # name of the event code
+    @classmethod
+    def name(cls, code: int) -> str:
+        return cls._names[code]
+
+
+class ICEventTexts:
+    """
+    Bounded table of the texts of history events, e.g. the text shown by ICTextLabel.
+    A text is recorded as the event TextEvent with the sequence number of the text as its value,
+    so the texts do not grow the event code table. The oldest texts are dropped once
+    ICDisplayConfig.HistoryTextSize texts are kept.
+    """
+    # name of the events holding a text
+    TextEvent: str = "text"
+
+    _texts: dict[int, str] = {}
+    _sequence: int = 0
+
+    # store a text and return its sequence number
+    @classmethod
+    def store(cls, text: str) -> int:
+        sequence = cls._sequence
+        cls._sequence += 1
+        cls._texts[sequence] = text
+        while len(cls._texts) > ICDisplayConfig.HistoryTextSize:
+            del cls._texts[next(iter(cls._texts))]
+        return sequence
+
+    # text of the sequence number or None if it has been dropped
+    @classmethod
+    def text(cls, sequence: int) -> Union[str, None]:
+        return cls._texts.get(int(sequence))
+
+
+class ICHistoryBuffer:
+    """
+    Fixed capacity ring buffer of history events.
+    Appending overwrites the oldest event once the buffer is full and does not allocate.
+    Queries return the matching events as a structured array in chronological order.
+    """
+    def __init__(self, capacity: int = 20):
+        self._data: np.ndarray = np.zeros(max(capacity, 1), dtype=HistoryRecord)
+
+        # total number of events appended
+        self._write_count: int = 0
+
+    ########################################################
+    # properties
+    ########################################################
+    # maximum number of events held
+    @property
+    def capacity(self) -> int:
+        return self._data.size
+
+    # number of events held
+    @property
+    def count(self) -> int:
+        return min(self._write_count, self._data.size)
+
+    # total number of events appended since the buffer was created or cleared
+    @property
+    def write_count(self) -> int:
+        return self._write_count
+
+    ########################################################
+    # functions
+    ########################################################
+    # append an event
+    def append(self, widget: int, event: int, value: float, tm: int) -> None:
+        self._data[self._write_count % self._data.size] = (tm, widget, event, value)
+        self._write_count += 1
+
+    # change the capacity. the latest events are kept
+    def resize(self, capacity: int) -> None:
+        capacity = max(capacity, 1)
+        records = self.records()[-capacity:]
+        self._data = np.zeros(capacity, dtype=HistoryRecord)
+        self._data[:records.size] = records
+        self._write_count = records.size
+
+    # remove all the events, or only the events of one widget
+    def clear(self, widget: int = None) -> None:
+        if widget is None:
+            self._write_count = 0
+            return
+
+        records = self.records()
+        records = records[records["widget"] != widget]
+        self._data[:records.size] = records
+        self._write_count = records.size
+
+    # copy of all the events in chronological order
+    def records(self) -> np.ndarray:
+        size = self._data.size
+        if self._write_count <= size:
+            return self._data[:self._write_count].copy()
+
+        start = self._write_count % size
+        return np.concatenate((self._data[start:], self._data[:start]))
+
+    # events in chronological order filtered by time range [start, stop), widget instance id and event name
+    def query(self, start: int = None, stop: int = None, widget: int = None, event: str = None) -> np.ndarray:
+        records = self.records()
+        mask = np.ones(records.size, dtype=bool)
+        if start is not None:
+            mask &= records["time"] >= start
+        if stop is not None:
+            mask &= records["time"] < stop
+        if widget is not None:
+            mask &= records["widget"] == widget
+        if event is not None:
+            mask &= records["event"] == ICEventCodes.find(event)
+        return records[mask]
+
+
+class ICHistoryRegistry:
+    """
+    Central history of the events of all the widgets, in the order they were appended.
+    As the timestamps are monotonic the records are sorted by time, so time ranges are located by binary search
+    on the ring instead of scanning it. The registry can be queried from any thread.
+    Aggregates are computed on views of the ring while holding the lock, without copying the records.
+    """
+    # the registry shared by all widgets
+    _instance: 'ICHistoryRegistry' = None
+
+    def __init__(self, capacity: int = ICDisplayConfig.HistoryRegistrySize):
+        self._lock: threading.Lock = threading.Lock()
+        self._buffer: ICHistoryBuffer = ICHistoryBuffer(capacity)
+
+        # class of every registered widget keyed by its instance id
+        self._widget_classes: dict[int, type] = {}
+
+        # destroyed widgets with the write count of the buffer when they were destroyed.
+        # their classes are kept until all their events have been overwritten
+        self._dead_widgets: dict[int, int] = {}
+
+        # events are recorded only when enabled
+        self._enabled: bool = ICDisplayConfig.HistoryRegistryEnabled
+
+        # optional receiver of all the events, e.g. ICHistoryLog for a persistent log
+        self._sink = None
+
+    # the registry shared by all widgets
+    @classmethod
+    def instance(cls) -> 'ICHistoryRegistry':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    ########################################################
+    # properties
+    ########################################################
+    # maximum number of events held
+    @property
+    def capacity(self) -> int:
+        return self._buffer.capacity
+
+    # number of events held
+    @property
+    def count(self) -> int:
+        return self._buffer.count
+
+    # recording of events
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, en: bool) -> None:
+        self._enabled = en
+
+    # receiver of all the events with the methods register and append, even when recording is disabled
+    @property
+    def sink(self):
+        return self._sink
+
+    # the widgets registered so far are registered with the new sink
+    @sink.setter
+    def sink(self, sink) -> None:
+        with self._lock:
+            self._sink = sink
+            if sink is not None:
+                for widget, widget_class in self._widget_classes.items():
+                    if widget not in self._dead_widgets:
+                        sink.register(widget, widget_class)
+
+    ########################################################
+    # functions
+    ########################################################
+    # register the class of a widget instance
+    def register(self, widget: int, widget_class: type) -> None:
+        with self._lock:
+            self._widget_classes[widget] = widget_class
+            if self._sink is not None:
+                self._sink.register(widget, widget_class)
+
+    # mark a widget as destroyed. its class is kept for the queries until its events have been overwritten
+    def unregister(self, widget: int) -> None:
+        with self._lock:
+            if widget in self._widget_classes:
+                self._dead_widgets[widget] = self._buffer.write_count
+            self._remove_dead_widgets()
+
+    # append an event of a registered widget
+    def append(self, widget: int, event: int, value: float, tm: int) -> None:
+        if self._enabled:
+            with self._lock:
+                self._buffer.append(widget, event, value, tm)
+        if self._sink is not None:
+            self._sink.append(widget, event, value, tm)
+
+    # change the capacity. the latest events are kept
+    def resize(self, capacity: int) -> None:
+        with self._lock:
+            # resizing renumbers the kept events from zero
+            shift = self._buffer.write_count
+            self._buffer.resize(capacity)
+            shift -= self._buffer.write_count
+            for widget in self._dead_widgets:
+                self._dead_widgets[widget] -= shift
+            self._remove_dead_widgets()
+
+    # remove all the events
+    def clear(self) -> None:
+        with self._lock:
+            self._buffer.clear()
+            self._remove_dead_widgets()
+
+    # instance ids of the registered widgets of a class, including its subclasses
+    def widgets(self, widget_class: type) -> np.ndarray:
+        with self._lock:
+            return np.array([widget for widget, cls in self._widget_classes.items() if issubclass(cls, widget_class)],
+                            dtype=np.int32)
+
+    # copy of the events in [start, stop) in chronological order, optionally filtered by
+    # the class of the widgets, a widget instance id and the event name
+    def query(self, start: int = None, stop: int = None, widget_class: type = None, widget: int = None,
+              event: str = None) -> np.ndarray:
+        widgets = None if widget_class is None else self.widgets(widget_class)
+        with self._lock:
+            parts = []
+            for records in self._segments(start, stop):
+                mask = self._filter_mask(records, widgets, widget, event)
+                parts.append(records if mask is None else records[mask])
+        return np.concatenate(parts) if parts else np.empty(0, dtype=HistoryRecord)
+
+    # number of events per widget and per time interval in [start, stop).
+    # intervals are counted in seconds since the epoch, e.g. the minute of an event is interval * 60 for interval=60
+    def count_per_interval(self, interval: float = 60.0, start: int = None, stop: int = None,
+                           widget_class: type = None) -> np.ndarray:
+        widgets = None if widget_class is None else self.widgets(widget_class)
+        interval_ns = int(interval * 1e9)
+
+        with self._lock:
+            keys = []
+            for records in self._segments(start, stop):
+                mask = self._filter_mask(records, widgets, None, None)
+                tm = records["time"] if mask is None else records["time"][mask]
+                widget_ids = records["widget"] if mask is None else records["widget"][mask]
+                keys.append(np.column_stack((widget_ids, (tm + _wall_clock_offset_ns) // interval_ns)))
+
+        counts = np.empty(0, dtype=HistoryCount)
+        if keys:
+            unique_keys, unique_counts = np.unique(np.concatenate(keys), axis=0, return_counts=True)
+            counts = np.empty(unique_counts.size, dtype=HistoryCount)
+            counts["widget"] = unique_keys[:, 0]
+            counts["interval"] = unique_keys[:, 1]
+            counts["count"] = unique_counts
+        return counts
+
+    ########################################################
+    # helper functions
+    ########################################################
+    # forget the destroyed widgets that have no events left in the buffer. must be called with the lock held.
+    # a widget has no events after it was destroyed, so they are gone once the events before it have been overwritten.
+    # the widgets are in the order they were destroyed
+    def _remove_dead_widgets(self) -> None:
+        write_count = self._buffer.write_count
+        oldest = write_count - self._buffer.count
+        for widget, destroyed in list(self._dead_widgets.items()):
+            if oldest < destroyed <= write_count:
+                break
+            del self._dead_widgets[widget]
+            del self._widget_classes[widget]
+
+    # views of the ring in chronological order limited to [start, stop). must be called with the lock held
+    def _segments(self, start: int, stop: int) -> list[np.ndarray]:
+        data = self._buffer._data
+        write_count = self._buffer.write_count
+        if write_count <= data.size:
+            segments = [data[:write_count]]
+        else:
+            split = write_count % data.size
+            segments = [data[split:], data[:split]]
+
+        limited = []
+        for records in segments:
+            first = 0 if start is None else np.searchsorted(records["time"], start, side="left")
+            last = records.size if stop is None else np.searchsorted(records["time"], stop, side="left")
+            if last > first:
+                limited.append(records[first:last])
+        return limited
+
+    # mask of the records matching the widgets and the event, or None if all match
+    @staticmethod
+    def _filter_mask(records: np.ndarray, widgets: np.ndarray, widget: int, event: str) -> np.ndarray:
+        mask = None
+        if widgets is not None:
+            mask = np.isin(records["widget"], widgets)
+        if widget is not None:
+            match = records["widget"] == widget
+            mask = match if mask is None else mask & match
+        if event is not None:
+            match = records["event"] == ICEventCodes.find(event)
+            mask = match if mask is None else mask & match
+        return mask